@@ -0,0 +1,64 @@
+"""Measures Cache inserts and lookups at 1M entries, per eviction policy.
+
+Usage: ``python -m benchmarks.cache``
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+from resist import Cache
+
+ENTRIES = 1_000_000
+CAPACITY = 100_000
+
+
+def legacy_evict(root: dict[int, int]) -> None:
+    # The eviction used before policies, copying every key on each eviction.
+    root.pop(list(root.keys())[0])
+
+
+def run(**options: Any) -> tuple[float, float]:
+    cache = Cache[int, int](CAPACITY, **options)
+    keys = list(range(ENTRIES))
+    lookups = [random.randrange(ENTRIES) for _ in range(ENTRIES)]
+
+    start = time.perf_counter()
+    for key in keys:
+        cache.set(key, key)
+    inserts = (time.perf_counter() - start) / ENTRIES
+
+    start = time.perf_counter()
+    for key in lookups:
+        cache.get(key)
+    gets = (time.perf_counter() - start) / ENTRIES
+
+    return inserts, gets
+
+
+def main() -> None:
+    print(f"{ENTRIES:,} inserts into a cache of {CAPACITY:,}, then {ENTRIES:,} lookups")
+    print(f"{'policy':>10} {'set (us/op)':>12} {'get (us/op)':>12}")
+
+    for name, options in [
+        ("fifo", {}),
+        ("lru", {"policy": "lru"}),
+        ("lfu", {"policy": "lfu"}),
+        ("fifo+ttl", {"ttl": 3600.0}),
+    ]:
+        inserts, gets = run(**options)
+        print(f"{name:>10} {inserts * 1e6:>12.2f} {gets * 1e6:>12.2f}")
+
+    root = {key: key for key in range(CAPACITY)}
+    start = time.perf_counter()
+    for _ in range(100):
+        legacy_evict(root)
+    print(
+        f"{'legacy':>10} {(time.perf_counter() - start) / 100 * 1e6:>12.2f} (evict only)"
+    )
+
+
+if __name__ == "__main__":
+    main()
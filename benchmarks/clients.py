@@ -0,0 +1,58 @@
+"""Measures the overhead of running many clients in one process,
+each with its own event registry and model caches.
+
+Usage: ``python -m benchmarks.clients``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import tracemalloc
+from typing import Any
+
+from resist import Events, Message, WebSocketClient
+
+from .payloads import message
+
+CLIENTS = 50
+DISPATCHES = 10_000
+
+
+async def callback(_: Any) -> None:
+    ...
+
+
+async def run() -> None:
+    loop = asyncio.get_running_loop()
+    payload = message()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    clients = [WebSocketClient("REVOLT_TOKEN", loop=loop) for _ in range(CLIENTS)]
+    for client in clients:
+        client.on(Events.MESSAGE)(callback)
+        client.on(Events.MESSAGE_UPDATE)(callback)
+        client.caches.resolve(Message)
+
+    setup = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for index in range(DISPATCHES):
+        clients[index % CLIENTS].dispatch(Events.MESSAGE, payload)
+
+    while any(client.dispatcher.inflight for client in clients):
+        await asyncio.sleep(0)
+
+    dispatch = (time.perf_counter() - start) / DISPATCHES
+
+    print(f"{'clients':>8} {'setup (us/client)':>18} {'memory (KiB/client)':>20}")
+    print(f"{CLIENTS:>8} {setup / CLIENTS * 1e6:>18.1f} {memory / CLIENTS / 1024:>20.1f}")
+    print(f"dispatch: {dispatch * 1e6:.2f} us/event")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
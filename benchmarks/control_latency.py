@@ -0,0 +1,75 @@
+"""Measures control event latency under a synthetic message flood,
+with control events in their own lane versus sharing the bulk lane.
+
+Usage: ``python -m benchmarks.control_latency``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from resist import Events, Lane, Listener, WebSocketClient
+
+FLOOD = 5000
+SAMPLES = 50
+
+
+async def run(lane: Lane) -> list[float]:
+    client = WebSocketClient("REVOLT_TOKEN", loop=asyncio.get_running_loop())
+    client.dispatcher.lane_limits = {Lane.BULK: 20}
+    client.dispatcher.max_backlog = FLOOD * 2
+
+    latencies: list[float] = []
+
+    async def on_message(_: Any) -> None:
+        await asyncio.sleep(0.001)
+
+    async def on_ready(data: dict[str, Any]) -> None:
+        latencies.append(time.perf_counter() - data["sent"])
+
+    message, ready = Events.MESSAGE, Events.READY
+    listeners = (
+        Listener(once=False, callback=on_message, check=lambda *_: True),
+        Listener(once=False, callback=on_ready, check=lambda *_: True),
+    )
+
+    ready.lane = lane
+    message.subscribe(listeners[0])
+    ready.subscribe(listeners[1])
+
+    try:
+        for _ in range(FLOOD):
+            client.dispatcher.submit(message, {"type": "Message"})
+
+        for _ in range(SAMPLES):
+            client.dispatcher.submit(
+                ready, {"type": "Ready", "sent": time.perf_counter()}
+            )
+            await asyncio.sleep(0.005)
+
+        while len(latencies) < SAMPLES:
+            await asyncio.sleep(0.01)
+    finally:
+        ready.lane = Lane.CONTROL
+        message.unsubscribe(listeners[0])
+        ready.unsubscribe(listeners[1])
+
+    return latencies
+
+
+def main() -> None:
+    print(f"{'lane':<8} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}")
+
+    for lane in (Lane.CONTROL, Lane.BULK):
+        latencies = sorted(asyncio.run(run(lane)))
+        p50 = statistics.median(latencies) * 1e3
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e3
+
+        print(f"{lane.name:<8} {p50:>10.2f} {p99:>10.2f} {latencies[-1] * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
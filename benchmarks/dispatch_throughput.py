@@ -0,0 +1,67 @@
+"""Measures dispatch throughput for inline synchronous listeners,
+and coroutine listeners with and without eager tasks.
+
+Usage: ``python -m benchmarks.dispatch_throughput``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable
+
+from resist import EAGER_TASKS, EVENT_MAPPING, Event, Listener, WebSocketClient
+
+from .payloads import message
+
+DISPATCHES = 100_000
+
+
+def sync_callback(_: Any) -> None:
+    ...
+
+
+async def async_callback(_: Any) -> None:
+    ...
+
+
+async def run(callback: Callable[..., Any], eager: bool) -> float:
+    loop = asyncio.get_running_loop()
+    client = WebSocketClient("REVOLT_TOKEN", loop=loop, eager=eager)
+    event = Event("Benchmark")
+    event.subscribe(Listener(once=False, callback=callback, check=lambda _: True))
+    payload = message()
+
+    start = time.perf_counter()
+    for _ in range(DISPATCHES):
+        event.dispatch(client, payload)
+
+    while client.dispatcher.inflight:
+        await asyncio.sleep(0)
+
+    elapsed = time.perf_counter() - start
+
+    del EVENT_MAPPING["Benchmark"]
+    return DISPATCHES / elapsed
+
+
+def main() -> None:
+    cases: list[tuple[str, Callable[..., Any], bool]] = [
+        ("inline", sync_callback, False),
+        ("task", async_callback, False),
+    ]
+
+    if EAGER_TASKS:
+        cases.append(("eager task", async_callback, True))
+    else:
+        print("eager tasks require Python 3.12+, skipping")
+
+    print(f"{'listener':>12} {'dispatches/s':>14}")
+
+    for name, callback, eager in cases:
+        rate = asyncio.run(run(callback, eager))
+        print(f"{name:>12} {rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measures fan-out throughput from a stand-in gateway to worker processes,
+each running a listener which burns some CPU per message.
+
+Usage: ``python -m benchmarks.fanout``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Any
+
+from resist import Events, Relay, WebSocketClient, Worker
+
+from .payloads import message
+
+MESSAGES = 20_000
+
+
+def work(path: str) -> None:
+    async def run() -> None:
+        client = WebSocketClient("REVOLT_TOKEN", loop=asyncio.get_running_loop())
+
+        @client.on(Events.MESSAGE)
+        def _(data: dict[str, Any]) -> None:
+            for _ in range(50):
+                hashlib.sha256(data["content"].encode()).digest()
+
+        # Bypasses REST, the stand-in gateway is all the worker talks to.
+        await Worker(client, path).run()
+
+    asyncio.run(run())
+
+
+async def run(workers: int) -> float:
+    path = os.path.join(tempfile.mkdtemp(), "relay.sock")
+    client = WebSocketClient("REVOLT_TOKEN", loop=asyncio.get_running_loop())
+    relay = Relay(path, routing="channel")
+    await relay.start(client)
+
+    processes = [
+        multiprocessing.Process(target=work, args=(path,)) for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    while len(relay.workers) < workers:
+        await asyncio.sleep(0.01)
+
+    payloads = [{**message(), "channel": str(n % 64)} for n in range(MESSAGES)]
+
+    start = time.perf_counter()
+    for payload in payloads:
+        relay.publish(payload)
+
+        if relay.backlogged:
+            await relay.drain()
+
+    await relay.close()
+    for process in processes:
+        await asyncio.to_thread(process.join)
+
+    return MESSAGES / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print(f"{'workers':>8} {'messages/s':>12}")
+
+    for workers in (1, 2, 4):
+        rate = asyncio.run(run(workers))
+        print(f"{workers:>8} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Measures indexed cache queries against scanning the cache.
+
+Usage: ``python -m benchmarks.index``
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from resist import Cache
+
+ENTRIES = 100_000
+CHANNELS = 1_000
+QUERIES = 1_000
+
+
+def main() -> None:
+    cache = Cache[int, tuple[int, int]](ENTRIES // 2)
+    cache.index("channel", lambda value: value[0])
+
+    start = time.perf_counter()
+    for key in range(ENTRIES):
+        cache.set(key, (random.randrange(CHANNELS), key))
+    inserts = (time.perf_counter() - start) / ENTRIES
+
+    channels = [random.randrange(CHANNELS) for _ in range(QUERIES)]
+
+    start = time.perf_counter()
+    for channel in channels:
+        cache.query("channel", channel, limit=50)
+    queries = (time.perf_counter() - start) / QUERIES
+
+    start = time.perf_counter()
+    for channel in channels:
+        found = [value for value in cache.root.values() if value[0] == channel]
+        found[-50:]
+    scans = (time.perf_counter() - start) / QUERIES
+
+    print(f"{ENTRIES:,} inserts into a cache of {ENTRIES // 2:,}, {CHANNELS:,} channels")
+    print(f"{'set (indexed)':>16} {inserts * 1e6:>10.2f} us/op")
+    print(f"{'query limit=50':>16} {queries * 1e6:>10.2f} us/op")
+    print(f"{'full scan':>16} {scans * 1e6:>10.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
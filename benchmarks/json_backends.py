@@ -0,0 +1,56 @@
+"""Compares the JSON backends on recorded gateway payloads.
+
+Usage: ``python -m benchmarks.json_backends``
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from typing import Any, Callable
+
+from resist import JSON, JSONBackend
+
+from .payloads import MESSAGE, READY
+
+
+def backends() -> list[JSONBackend]:
+    found = [JSONBackend("json", json.loads, json.dumps)]
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        found.append(JSONBackend("orjson", orjson.loads, orjson.dumps))  # type: ignore
+
+    try:
+        import ujson  # type: ignore
+    except ImportError:
+        pass
+    else:
+        found.append(JSONBackend("ujson", ujson.loads, ujson.dumps))  # type: ignore
+
+    return found
+
+
+def bench(func: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    print(f"default backend: {JSON.name}")
+    print(f"{'backend':<8} {'payload':<8} {'loads (us)':>12} {'dumps (us)':>12}")
+
+    for backend in backends():
+        for name, payload, number in (("Message", MESSAGE, 20000), ("Ready", READY, 20)):
+            raw = json.dumps(payload)
+
+            loads = bench(lambda: backend.loads(raw), number) * 1e6
+            dumps = bench(lambda: backend.dumps(payload), number) * 1e6
+
+            print(f"{backend.name:<8} {name:<8} {loads:>12.2f} {dumps:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
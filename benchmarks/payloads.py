@@ -0,0 +1,124 @@
+"""Recorded gateway payloads used by the benchmarks.
+
+The payloads are trimmed recordings with identifiers scrambled,
+``READY`` is padded out to the size of a mid-sized bot's session.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+__all__ = ("MESSAGE", "READY", "message", "ready")
+
+MESSAGE: dict[str, Any] = {
+    "type": "Message",
+    "_id": "01FYD3B6MZ1SQ2AXS8WRGQ04Q5",
+    "nonce": "01FYD3B6HGGH4JX9Y0QHPWNY5W",
+    "channel": "01FXQ5C46DZ4H9PM0CKBXG8QA0",
+    "author": "01FWMK2N6DGWJTF4D7ZHQ3Y4Z6",
+    "content": "has anyone tried the new voice server? latency looks a lot better",
+    "mentions": ["01FWMK2N6DGWJTF4D7ZHQ3Y4Z6"],
+    "replies": ["01FYD39X7J5M5T6Q0SB4WG5D5R"],
+    "attachments": [
+        {
+            "_id": "Hy7BFT9aF3ZmQfqXrlVvq4k4Q9Zq5gSxMvzqkIkZ1g",
+            "tag": "attachments",
+            "size": 183442,
+            "filename": "latency.png",
+            "metadata": {"type": "Image", "width": 1280, "height": 720},
+            "content_type": "image/png",
+        }
+    ],
+    "embeds": [
+        {
+            "type": "Website",
+            "url": "https://revolt.chat/",
+            "title": "Revolt",
+            "description": "User-first chat platform built with modern web technologies.",
+            "site_name": "Revolt",
+            "colour": "#FD6671",
+            "image": {
+                "url": "https://revolt.chat/header.png",
+                "width": 1200,
+                "height": 630,
+                "size": "Large",
+            },
+        }
+    ],
+}
+
+
+def _user(index: int) -> dict[str, Any]:
+    return {
+        "_id": f"01FWMK2N6DGWJTF4D7ZH{index:06d}",
+        "username": f"user{index}",
+        "avatar": {
+            "_id": f"avatar{index:06d}",
+            "tag": "avatars",
+            "size": 20480,
+            "filename": "avatar.png",
+            "metadata": {"type": "Image", "width": 256, "height": 256},
+            "content_type": "image/png",
+        },
+        "badges": 256,
+        "status": {"text": "around", "presence": "Online"},
+        "relationship": "None",
+        "online": index % 3 == 0,
+    }
+
+
+def _channel(index: int, server: str) -> dict[str, Any]:
+    return {
+        "_id": f"01FXQ5C46DZ4H9PM0CKB{index:06d}",
+        "server": server,
+        "name": f"channel-{index}",
+        "description": "general chatter",
+        "channel_type": "TextChannel",
+        "last_message_id": f"01FYD3B6MZ1SQ2AXS8WR{index:06d}",
+    }
+
+
+def _server(index: int, channels: list[str]) -> dict[str, Any]:
+    return {
+        "_id": f"01FXQ5BXNEKWTV2ARXSE{index:06d}",
+        "owner": "01FWMK2N6DGWJTF4D7ZH000000",
+        "name": f"server {index}",
+        "description": "a recorded server",
+        "channels": channels,
+        "categories": [{"id": "cat", "title": "Text", "channels": channels}],
+        "roles": [{"name": "member", "permissions": "0", "colour": "#FFFFFF"}],
+        "default_permissions": [[0, 0]],
+        "nsfw": False,
+        "flags": 0,
+    }
+
+
+def message() -> dict[str, Any]:
+    """Returns a recorded ``Message`` payload."""
+    return dict(MESSAGE)
+
+
+def ready(
+    users: int = 2000, servers: int = 50, channels_per_server: int = 20
+) -> dict[str, Any]:
+    """Builds a ``Ready`` payload of the given size."""
+    channels: list[dict[str, Any]] = []
+    server_data: list[dict[str, Any]] = []
+
+    for index in range(servers):
+        server = f"01FXQ5BXNEKWTV2ARXSE{index:06d}"
+        start = index * channels_per_server
+        owned = [_channel(c, server) for c in range(start, start + channels_per_server)]
+
+        channels.extend(owned)
+        server_data.append(_server(index, [c["_id"] for c in owned]))
+
+    return {
+        "type": "Ready",
+        "users": [_user(index) for index in range(users)],
+        "servers": server_data,
+        "channels": channels,
+    }
+
+
+READY: dict[str, Any] = ready()
@@ -0,0 +1,59 @@
+"""Measures saving, opening and looking up a snapshot of 100k cached messages.
+
+Usage: ``python -m benchmarks.snapshot``
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import time
+
+from resist import Message, Snapshot, WebSocketClient
+
+ENTRIES = 100_000
+LOOKUPS = 10_000
+
+
+def main() -> None:
+    client = WebSocketClient("REVOLT_TOKEN")
+    ids = [f"01ARZ3NDEK{index:016}" for index in range(ENTRIES)]
+
+    for unique in ids:
+        data = {"_id": unique, "channel": "0", "author": "0", "content": "x" * 100}
+        Message(client, data)  # type: ignore
+
+    path = os.path.join(tempfile.mkdtemp(), "resist.snapshot")
+
+    start = time.perf_counter()
+    Snapshot.save(path, client)
+    saved = time.perf_counter() - start
+
+    for unique in ids:
+        client.caches[Message].pop(unique)
+
+    start = time.perf_counter()
+    snapshot = Snapshot.open(path)
+    opened = time.perf_counter() - start
+
+    assert snapshot is not None
+    snapshot.load(client)
+    lookups = random.sample(ids, LOOKUPS)
+
+    start = time.perf_counter()
+    for unique in lookups:
+        client.caches[Message][unique]
+    loaded = (time.perf_counter() - start) / LOOKUPS
+
+    print(f"{ENTRIES:,} messages, {os.path.getsize(path) / 1e6:.1f} MB on disk")
+    print(f"{'save':>14} {saved * 1e3:>10.1f} ms")
+    print(f"{'open':>14} {opened * 1e3:>10.3f} ms")
+    print(f"{'first lookup':>14} {loaded * 1e6:>10.2f} us/op")
+
+    snapshot.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measures subscription churn, subscribing and cancelling short-lived listeners
+while many long-lived listeners stay subscribed.
+
+Usage: ``python -m benchmarks.subscriptions``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from resist import EVENT_MAPPING, Event, Listener, WebSocketClient
+
+CHURN = 100_000
+
+
+async def callback(_: Any) -> None:
+    ...
+
+
+def check(_: Any) -> bool:
+    return False
+
+
+async def run(subscribed: int) -> tuple[float, float]:
+    client = WebSocketClient("REVOLT_TOKEN", loop=asyncio.get_running_loop())
+    event = Event("Benchmark")
+
+    for _ in range(subscribed):
+        event.subscribe(Listener(once=False, callback=callback, check=check))
+
+    start = time.perf_counter()
+    for _ in range(CHURN):
+        event.subscribe(Listener(once=True, callback=callback, check=check)).cancel()
+    churn = (time.perf_counter() - start) / CHURN
+
+    # once listeners removed by dispatch itself, interleaved with the long-lived ones.
+    for _ in range(1000):
+        event.subscribe(Listener(once=True, callback=callback, check=lambda _: True))
+
+    start = time.perf_counter()
+    await asyncio.gather(*event.dispatch(client, None))
+    dispatch = time.perf_counter() - start
+
+    del EVENT_MAPPING["Benchmark"]
+    return churn, dispatch
+
+
+def main() -> None:
+    print(f"{'subscribed':>10} {'churn (us/op)':>14} {'dispatch (ms)':>14}")
+
+    for subscribed in (1_000, 10_000, 100_000):
+        churn, dispatch = asyncio.run(run(subscribed))
+        print(f"{subscribed:>10} {churn * 1e6:>14.2f} {dispatch * 1e3:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ from typing import Literal, NamedTuple
 from .client import *
 from .models import *
 from .rest import *
+from .snapshot import *
+from .utils import *
 from .websocket import *
 
 
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from attrs import define, field
 
+from .models import BUDGET, CacheRegistry, MemoryBudget
 from .rest import RESTClient
-from .websocket import Collector, Event, Listener, WebSocketHandler
+from .snapshot import Snapshot
+from .utils import JSON, JSONBackend
+from .websocket import (
+    Collector,
+    Dispatcher,
+    Event,
+    EventRegistry,
+    EventStream,
+    Listener,
+    ListenerExecutor,
+    Metrics,
+    Relay,
+    WebSocketHandler,
+    Worker,
+)
 
 if TYPE_CHECKING:
     Callback = Callable[..., Any]
     Check = Callable[..., bool]
 
+_log = logging.getLogger(__name__)
+
+
+def _expire(future: asyncio.Future[Any]) -> None:
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
+
 
 @define
 class WebSocketClient:
@@ -28,6 +53,44 @@ class WebSocketClient:
     loop: :class:`asyncio.AbstractEventLoop`
         The loop to use for async IO.
 
+    json: :class:`.JSONBackend`
+        The JSON backend used to encode and decode payloads.
+        Defaults to the fastest backend available.
+
+    format: :class:`str`
+        The gateway transport format, either `json` or `msgpack`.
+        The `msgpack` format requires the `msgpack` package.
+
+    reconnect: :class:`bool`
+        If the client should reconnect when the websocket drops.
+
+    decode_thread: :class:`bool`
+        If frames should be decoded on a dedicated thread instead of the loop.
+        Dispatch still happens on the loop, in the order frames were received.
+
+    max_inflight: None | :class:`int`
+        The max amount of listener tasks running at a given time.
+        Once reached, the client stops reading from the websocket until there is room.
+
+    eager: :class:`bool`
+        If listener tasks should be started eagerly, where the runtime supports it.
+
+    relay: None | :class:`.Relay`
+        The relay to fan gateway payloads out to worker processes through,
+        see :meth:`work` for the worker side.
+
+    snapshot: None | :class:`str`
+        The path of a :class:`.Snapshot` to warm the model caches and the API context
+        from when connecting, saved again when the client closes.
+
+    context_max_age: :class:`float`
+        The max age in seconds of the API context of a snapshot,
+        an older context is fetched again from the API root.
+
+    budget: None | :class:`.MemoryBudget`
+        The budget of the client's model caches, the process-wide :data:`BUDGET`
+        by default so a single limit bounds the caches of every client.
+
     Attributes
     ----------
     token: :class:`str`
@@ -36,21 +99,102 @@ class WebSocketClient:
     loop: :class:`asyncio.AbstractEventLoop`
         The loop to use for async IO.
 
+    json: :class:`.JSONBackend`
+        The JSON backend used to encode and decode payloads.
+
+    format: :class:`str`
+        The gateway transport format.
+
+    reconnect: :class:`bool`
+        If the client reconnects when the websocket drops.
+
+    decode_thread: :class:`bool`
+        If frames are decoded on a dedicated thread.
+
+    events: :class:`.EventRegistry`
+        The client's own events. Events passed to the client's methods,
+        such as :attr:`.Events.MESSAGE`, are resolved to the client's copy by name,
+        so listeners are never shared between clients.
+
+    caches: :class:`.CacheRegistry`
+        The client's own model caches, copied from :attr:`.Cacheable.cache`,
+        so cached models are never shared between clients.
+        They are dropped when the client closes.
+
+    executors: :class:`dict`
+        The :class:`.ListenerExecutor` listeners run on, with their queue depth metrics.
+        Mapped by `thread` or `process` for the pools created by the client,
+        or by the executor itself when one was supplied.
+
+    metrics: :class:`.Metrics`
+        The listener metrics, slow listener watchdog and event loop lag monitor
+        of the client, disabled until :meth:`.Metrics.enable` is called.
+
+    dispatcher: :class:`.Dispatcher`
+        The dispatcher tracking in-flight listener tasks,
+        its backlog and shedding policy can be configured through it.
+
     sock: :class:`.WebSocketHandler`
         The websocket handler for the client.
 
     rest: :class:`.RESTClient`
         The rest client being used.
+
+    warm: None | :class:`.Snapshot`
+        The snapshot loaded when connecting, if there was one.
     """
 
     token: str = field(repr=False)
     loop: asyncio.AbstractEventLoop = field(kw_only=True, repr=False, default=None)
+    json: JSONBackend = field(kw_only=True, repr=False, default=JSON)
+    format: Literal["json", "msgpack"] = field(kw_only=True, repr=True, default="json")
+    reconnect: bool = field(kw_only=True, repr=False, default=True)
+    decode_thread: bool = field(kw_only=True, repr=False, default=False)
+    max_inflight: None | int = field(kw_only=True, repr=False, default=None)
+    eager: bool = field(kw_only=True, repr=False, default=True)
+    relay: None | Relay = field(kw_only=True, repr=False, default=None)
+    snapshot: None | str = field(kw_only=True, repr=False, default=None)
+    context_max_age: float = field(kw_only=True, repr=False, default=3600.0)
+    budget: None | MemoryBudget = field(kw_only=True, repr=False, default=BUDGET)
+
+    events: EventRegistry = field(init=False, repr=False, factory=EventRegistry)
+    caches: CacheRegistry = field(init=False, repr=False)
+    dispatcher: Dispatcher = field(init=False, repr=False)
+    executors: dict[Any, ListenerExecutor] = field(init=False, repr=False, factory=dict)
+    metrics: Metrics = field(init=False, repr=False)
 
     sock: WebSocketHandler = field(init=False, repr=False)
     rest: RESTClient = field(init=False, repr=False)
+    warm: None | Snapshot = field(init=False, repr=False, default=None)
+
+    def __attrs_post_init__(self) -> None:
+        self.caches = CacheRegistry(self.budget)
+        self.dispatcher = Dispatcher(self, self.max_inflight)
+        self.metrics = Metrics(self)
+
+    def subscribe(self, event: Event[Any], listener: Listener | Collector) -> None:
+        """Subscribes a listener or collector to the client's copy of an event.
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event to subscribe to.
+
+        listener: :class:`.Listener` | :class:`.Collector`
+            The listener or collector to subscribe.
+        """
+        event = self.events.resolve(event)
+        event.subscribe(listener)
+
+        self.metrics.instrument(event, listener)
 
     def on(
-        self, event: Event[Any], check: Check = lambda *_: True
+        self,
+        event: Event[Any],
+        check: Check = lambda *_: True,
+        ordered_by: None | Literal["channel", "server", "author"] = None,
+        executor: None | Literal["thread", "process"] | Executor = None,
+        **filters: Any,
     ) -> Callable[..., Listener]:
         """Registers a callback to an event.
 
@@ -62,27 +206,81 @@ class WebSocketClient:
         check: Callable[..., :class:`bool`]
             The check the event must pass first in order to be dispatched.
 
+        ordered_by: None | :class:`str`
+            The payload key to serialize the callback by. Events sharing the key
+            are handled one at a time in the order received,
+            while different keys are handled concurrently.
+
+        executor: None | :class:`str` | :class:`concurrent.futures.Executor`
+            Runs the callback off the event loop, either on a `thread` pool,
+            a `process` pool or the executor given. The callback has to be a plain
+            function, importable by name for a process pool, and its payload
+            is pickled. The listener's task resolves to its result.
+
+        filters: Any
+            Key filters the payload must match, e.g `channel="..."`.
+            Filtered listeners are looked up through an index instead of being checked
+            on every event.
+
         Raises
         ------
         :exc:`TypeError`
-            The function being wrapped is not a coroutine function.
+            An executor was given for a coroutine function.
 
         Returns
         -------
         :class:`.Listener`
             The registered listener.
         """
+        offload = None if executor is None else self.executor(executor)
 
         def inner(func: Callback) -> Listener:
-            listener = Listener(once=False, callback=func, check=check)
-            event.subscribe(listener)
+            listener = Listener(
+                once=False,
+                callback=func,
+                check=check,
+                filters=filters,
+                ordered_by=ordered_by,
+                executor=offload,
+            )
+            self.subscribe(event, listener)
 
             return listener
 
         return inner
 
+    def executor(
+        self, executor: Literal["thread", "process"] | Executor
+    ) -> ListenerExecutor:
+        """Resolves the executor listeners run on, creating its pool if needed.
+
+        Parameters
+        ----------
+        executor: :class:`str` | :class:`concurrent.futures.Executor`
+            Either `thread`, `process` or an executor to use as-is.
+
+        Returns
+        -------
+        :class:`.ListenerExecutor`
+            The executor, shared by every listener given the same one.
+        """
+        if (resolved := self.executors.get(executor)) is not None:
+            return resolved
+
+        if executor == "thread":
+            resolved = ListenerExecutor(ThreadPoolExecutor(), owned=True)
+        elif executor == "process":
+            resolved = ListenerExecutor(ProcessPoolExecutor(), owned=True)
+        elif isinstance(executor, Executor):
+            resolved = ListenerExecutor(executor)
+        else:
+            raise ValueError(f"Unknown executor {executor!r}") from None
+
+        self.executors[executor] = resolved
+        return resolved
+
     def once(
-        self, event: Event[Any], check: Check = lambda *_: True
+        self, event: Event[Any], check: Check = lambda *_: True, **filters: Any
     ) -> Callable[..., Listener]:
         """Registers a one-time callback to an event.
 
@@ -94,10 +292,10 @@ class WebSocketClient:
         check: Callable[..., :class:`bool`]
             The check the event must pass first in order to be dispatched.
 
-        Raises
-        ------
-        :exc:`TypeError`
-            The function being wrapped is not a coroutine function.
+        filters: Any
+            Key filters the payload must match, e.g `channel="..."`.
+            Filtered listeners are looked up through an index instead of being checked
+            on every event.
 
         Returns
         -------
@@ -106,8 +304,8 @@ class WebSocketClient:
         """
 
         def inner(func: Callback) -> Listener:
-            listener = Listener(once=True, callback=func, check=check)
-            event.subscribe(listener)
+            listener = Listener(once=True, callback=func, check=check, filters=filters)
+            self.subscribe(event, listener)
 
             return listener
 
@@ -116,10 +314,12 @@ class WebSocketClient:
     def collect(
         self,
         event: Event[Any],
-        amount: int,
-        timeout: None | timedelta,
+        amount: None | int,
+        timeout: None | float | timedelta,
         once: bool = False,
         check: Check = lambda *_: True,
+        window: Literal["tumbling", "sliding"] = "tumbling",
+        **filters: Any,
     ) -> Callable[..., Collector]:
         """Registers a collector to an event.
 
@@ -128,31 +328,133 @@ class WebSocketClient:
         event: :class:`.Event`
             The event to subscribe the callback to.
 
+        amount: None | :class:`int`
+            The size of a batch, see :class:`.Collector`.
+
+        timeout: None | :class:`float` | :class:`datetime.timedelta`
+            The length of the window, in seconds if a float.
+
+        window: :class:`str`
+            The window mode, either `tumbling` or `sliding`.
+
         check: Callable[..., :class:`bool`]
             The check the event must pass first in order to be dispatched.
 
+        filters: Any
+            Key filters the payload must match, e.g `channel="..."`.
+            Filtered listeners are looked up through an index instead of being checked
+            on every event.
+
         Raises
         ------
-        :exc:`TypeError`
-            The function being wrapped is not a coroutine function.
+        :exc:`ValueError`
+            Neither an amount nor a timeout were given.
 
         Returns
         -------
         :class:`.Collector`
             The registered collector.
         """
-        timeout = timeout or timedelta.max
 
         def inner(func: Callback) -> Collector:
             collector = Collector(
-                once=once, callback=func, check=check, amount=amount, timeout=timeout
+                once=once,
+                callback=func,
+                check=check,
+                amount=amount,
+                timeout=timeout,
+                window=window,
+                filters=filters,
             )
 
-            event.subscribe(collector)
+            self.subscribe(event, collector)
             return collector
 
         return inner
 
+    async def wait_for(
+        self,
+        event: Event[Any],
+        check: Check = lambda *_: True,
+        timeout: None | float = None,
+    ) -> Any:
+        """Waits for an event to be dispatched.
+
+        No listener or task is created, the waiter is resolved inline when dispatching.
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event to wait for.
+
+        check: Callable[..., :class:`bool`]
+            The check the event must pass first in order to be returned.
+
+        timeout: None | :class:`float`
+            The amount of seconds to wait for, None to wait forever.
+
+        Raises
+        ------
+        :exc:`asyncio.TimeoutError`
+            The timeout was reached before the event was dispatched.
+
+        Returns
+        -------
+        Any
+            The payload the event was dispatched with.
+        """
+        loop = self.loop or asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        event = self.events.resolve(event)
+        event.waiters[future] = check
+
+        handle = None
+        if timeout is not None:
+            handle = loop.call_later(timeout, _expire, future)
+
+        try:
+            return await future
+        finally:
+            event.waiters.pop(future, None)
+
+            if handle is not None:
+                handle.cancel()
+
+    def stream(
+        self,
+        event: Event[Any],
+        check: Check = lambda *_: True,
+        maxsize: None | int = None,
+        overflow: Literal["drop_oldest", "drop_newest"] = "drop_oldest",
+    ) -> EventStream:
+        """Streams an event, as an alternative to registering a callback.
+
+        .. code-block:: python
+
+            async for message in client.stream(Events.MESSAGE, maxsize=100):
+                ...
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event to stream.
+
+        check: Callable[..., :class:`bool`]
+            The check the event must pass first in order to be streamed.
+
+        maxsize: None | :class:`int`
+            The max amount of events buffered, None for no limit.
+
+        overflow: :class:`str`
+            What happens when the buffer is full, either `drop_oldest` or `drop_newest`.
+
+        Returns
+        -------
+        :class:`.EventStream`
+            The stream, closed when the client disconnects.
+        """
+        return EventStream(self.events.resolve(event), check, maxsize, overflow)
+
     def dispatch(self, event: Event[Any], *args: Any) -> list[asyncio.Task[Any]]:
         """Dispatches an event.
 
@@ -169,7 +471,7 @@ class WebSocketClient:
         :class:`list`
             A list of :class:`asyncio.Task` created from the dispatch.
         """
-        return event.dispatch(self, *args)
+        return self.events.resolve(event).dispatch(self, *args)
 
     async def connect(self) -> None:
         """Starts the connection to the API."""
@@ -177,7 +479,92 @@ class WebSocketClient:
         if self.loop is None:
             self.loop = asyncio.get_running_loop()
 
-        self.rest = await RESTClient.connect(self)
+        self.rest = await self.connect_rest()
         self.sock = WebSocketHandler(self)
 
-        await self.sock.connect()
+        if self.relay is not None:
+            await self.relay.start(self)
+
+        self.metrics.start()
+
+        try:
+            await self.sock.run()
+        finally:
+            self.close_streams()
+
+    async def work(self, path: str) -> None:
+        """Runs the client as a worker of a :class:`.Relay`,
+        dispatching the payloads it receives instead of connecting to the gateway.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the Unix domain socket served by the relay.
+        """
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+
+        self.rest = await self.connect_rest()
+        self.metrics.start()
+
+        try:
+            await Worker(self, path).run()
+        finally:
+            self.close_streams()
+
+    async def connect_rest(self) -> RESTClient:
+        if self.snapshot is not None and self.warm is None:
+            self.warm = Snapshot.open(self.snapshot)
+
+        if self.warm is None:
+            return await RESTClient.connect(self)
+
+        self.warm.load(self)
+        context, fetched = self.warm.context, self.warm.fetched
+
+        if context is None or time.time() - fetched > self.context_max_age:
+            return await RESTClient.connect(self)
+
+        return await RESTClient.connect(self, context=context, fetched=fetched)
+
+    def save_snapshot(self) -> None:
+        """Saves the model caches and the API context to :attr:`snapshot`,
+        carrying over the entries of the loaded snapshot which were never looked up
+        nor removed. Nothing is saved if the client never connected.
+        """
+        # A client which never connected has nothing worth replacing a snapshot with.
+        if self.snapshot is not None and hasattr(self, "rest"):
+            try:
+                Snapshot.save(self.snapshot, self, self.warm)
+            except Exception:
+                _log.exception(f"FAILED TO SAVE SNAPSHOT {self.snapshot}")
+
+        if self.warm is not None:
+            self.warm.close()
+            self.warm = None
+
+    def close_streams(self) -> None:
+        """Closes every open :class:`.EventStream`."""
+        for event in self.events.values():
+            for stream in list(event.streams):
+                stream.close()
+
+    async def close(self) -> None:
+        """Closes the connection to the API."""
+        self.close_streams()
+        self.metrics.stop()
+
+        if hasattr(self, "sock"):
+            await self.sock.close()
+
+        if self.relay is not None:
+            await self.relay.close()
+
+        for executor in self.executors.values():
+            executor.shutdown()
+
+        self.save_snapshot()
+        self.caches.clear()
+
+        if hasattr(self, "rest"):
+            await self.rest.session.close()
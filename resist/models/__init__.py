@@ -1,5 +1,6 @@
 from .assets import *
 from .cacheable import *
+from .detachable import *
 from .embed import *
 from .fetchable import *
 from .flags import *
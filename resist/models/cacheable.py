@@ -1,17 +1,328 @@
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar
+import bisect
+import heapq
+import operator
+import sys
+import time
+import weakref
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Generic, Literal, TypeVar
 
+import attrs
 from attrs import define, field
 from typing_extensions import Self
 
-__all__ = ("Cache", "Cacheable")
+__all__ = (
+    "Cache",
+    "CacheStats",
+    "Cacheable",
+    "CacheRegistry",
+    "Index",
+    "MemoryBudget",
+    "BUDGET",
+    "footprint",
+)
 
 KeyT = TypeVar("KeyT")
 ValueT = TypeVar("ValueT")
+CacheableT = TypeVar("CacheableT", bound="Cacheable")
+
+Policy = Literal["fifo", "lru", "lfu"]
+Reason = Literal["capacity", "bytes", "budget", "expired"]
+MISSING: Any = object()
+
+
+def footprint(value: Any) -> int:
+    """Approximates the amount of bytes an object takes up, including what it holds.
+
+    Dicts, sequences and attrs instances are followed, objects reachable more than
+    once are counted once. The `client` attribute of models and other cache-able
+    models, which have their own cache entries, are not followed.
+
+    Parameters
+    ----------
+    value: Any
+        The object to measure.
+
+    Returns
+    -------
+    :class:`int`
+        The approximate size in bytes.
+    """
+    size, seen, pending = 0, set[int](), [value]
+
+    while pending:
+        obj = pending.pop()
+
+        if id(obj) in seen:
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())  # type: ignore
+
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)  # type: ignore
+
+        elif attrs.has(type(obj)):
+            for attribute in attrs.fields(type(obj)):
+                child = getattr(obj, attribute.name, None)
+
+                if attribute.name != "client" and not isinstance(child, Cacheable):
+                    pending.append(child)
+
+    return size
+
+
+def _limited(instance: Any, attribute: attrs.Attribute[Any], value: Any) -> Any:
+    # attrs calls the hook before assigning, the value is assigned first
+    # so the entries are measured against the new limit.
+    object.__setattr__(instance, attribute.name, value)
+    instance.measure()
+
+    return value
+
+
+def _rebudget(cache: Cache[Any, Any], _: attrs.Attribute[Any], budget: Any) -> Any:
+    if cache.budget is not None:
+        cache.budget.leave(cache)
+
+    if budget is not None:
+        budget.join(cache)
+
+    object.__setattr__(cache, "budget", budget)
+    cache.measure()
+
+    return budget
+
+
+@define
+class MemoryBudget:
+    """A class which bounds the bytes taken up by a group of caches.
+
+    The model caches of every client share the process-wide :data:`BUDGET`,
+    unless the client is given its own budget. Entries are sized on insertion
+    once it has a limit.
+
+    .. code-block:: python
+
+        resist.BUDGET.max_bytes = 256 * 1024 * 1024
+
+    Parameters
+    ----------
+    max_bytes: None | :class:`int`
+        The max amount of bytes the caches can take up, None for no limit.
+        When over the limit, entries are evicted from the largest cache first.
+        Setting a limit later sizes the entries already cached and evicts right away.
+
+    Attributes
+    ----------
+    used: :class:`int`
+        The approximate amount of bytes the caches take up.
+
+    caches: :class:`weakref.WeakSet`
+        The caches sharing the budget.
+    """
+
+    max_bytes: None | int = field(repr=True, default=None, on_setattr=_limited)
+    used: int = field(init=False, repr=True, default=0)
+    caches: weakref.WeakSet[Cache[Any, Any]] = field(
+        init=False, repr=False, factory=weakref.WeakSet
+    )
+
+    def reclaim(self, size: int) -> None:
+        """Evicts entries until there is room for an entry of the given size.
+
+        Parameters
+        ----------
+        size: :class:`int`
+            The size of the entry about to be inserted.
+        """
+        while self.max_bytes is not None and self.used + size > self.max_bytes:
+            caches = [cache for cache in self.caches if cache.root]
+
+            if not caches:
+                return
+
+            max(caches, key=lambda cache: cache.bytes).evict("budget")
+
+    def measure(self) -> None:
+        """Sizes the entries of every cache sharing the budget which were cached
+        before a limit applied, then evicts until the budget is respected.
+        This is done when :attr:`max_bytes` is set.
+        """
+        for cache in list(self.caches):
+            cache.measure()
+
+    def join(self, cache: Cache[Any, Any]) -> None:
+        """Adds a cache to the budget, along with the bytes it takes up.
+
+        Parameters
+        ----------
+        cache: :class:`.Cache`
+            The cache to add.
+        """
+        self.used += cache.bytes
+        self.caches.add(cache)
+
+        # A cache collected without leaving the budget gives its bytes back,
+        # its sizes always add up to its bytes.
+        cache.finalizer = weakref.finalize(cache, self.release, cache.sizes)
+
+    def leave(self, cache: Cache[Any, Any]) -> None:
+        """Removes a cache from the budget, along with the bytes it takes up.
+
+        Parameters
+        ----------
+        cache: :class:`.Cache`
+            The cache to remove.
+        """
+        self.used -= cache.bytes
+        self.caches.discard(cache)
+
+        if cache.finalizer is not None:
+            cache.finalizer.detach()
+            cache.finalizer = None
+
+    def release(self, sizes: dict[Any, int]) -> None:
+        self.used -= sum(sizes.values())
+
+
+@define
+class Index(Generic[KeyT]):
+    """A class which maps a value derived from cached entries to their keys,
+    kept sorted so ranges of keys are found by bisection.
+
+    Revolt IDs are ULIDs, which sort by creation time, so an index of
+    messages by channel yields the messages of a channel oldest first.
+
+    Parameters
+    ----------
+    name: :class:`str`
+        The name of the index.
+
+    key: Callable[[Any], Any]
+        The function deriving the indexed value from an entry.
+
+    Attributes
+    ----------
+    entries: :class:`dict`
+        The sorted keys of the entries, mapped by indexed value.
+    """
+
+    name: str = field(repr=True)
+    key: Callable[[Any], Any] = field(repr=False)
+    entries: dict[Any, list[KeyT]] = field(init=False, repr=False, factory=dict)
+
+    def add(self, key: KeyT, value: Any) -> None:
+        keys = self.entries.setdefault(self.key(value), [])
+
+        # Entries mostly arrive in key order, appending skips the bisection.
+        if not keys or keys[-1] < key:  # type: ignore
+            keys.append(key)
+        else:
+            bisect.insort(keys, key)  # type: ignore
+
+    def discard(self, key: KeyT, value: Any) -> None:
+        indexed = self.key(value)
+
+        if (keys := self.entries.get(indexed)) is None:
+            return
+
+        position = bisect.bisect_left(keys, key)  # type: ignore
+
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
+
+        if not keys:
+            del self.entries[indexed]
+
+    def query(
+        self,
+        indexed: Any,
+        limit: None | int = None,
+        before: None | KeyT = None,
+        after: None | KeyT = None,
+    ) -> list[KeyT]:
+        """Looks up the keys of the entries with an indexed value.
+
+        Parameters
+        ----------
+        indexed: Any
+            The indexed value to look up.
+
+        limit: None | :class:`int`
+            The max amount of keys returned, the largest are kept.
+
+        before: None | Any
+            Only keys smaller than this one are returned.
+
+        after: None | Any
+            Only keys larger than this one are returned.
+
+        Returns
+        -------
+        :class:`list`
+            The keys found, largest first.
+        """
+        if (keys := self.entries.get(indexed)) is None:
+            return []
+
+        start, end = 0, len(keys)
+
+        if after is not None:
+            start = bisect.bisect_right(keys, after)  # type: ignore
+
+        if before is not None:
+            end = bisect.bisect_left(keys, before)  # type: ignore
+
+        if limit is not None:
+            start = max(start, end - limit)
+
+        return keys[start:end][::-1]
 
 
 @define
+class CacheStats:
+    """A class which counts the operations of a :class:`.Cache`.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The amount of lookups which found their key.
+
+    misses: :class:`int`
+        The amount of lookups which did not find their key, or found it expired.
+
+    inserts: :class:`int`
+        The amount of new keys set.
+
+    overwrites: :class:`int`
+        The amount of existing keys set again.
+
+    evictions: :class:`collections.Counter`
+        The amount of entries evicted, per reason. One of `capacity`, `bytes`,
+        `budget` or `expired`.
+    """
+
+    hits: int = field(init=False, repr=True, default=0)
+    misses: int = field(init=False, repr=True, default=0)
+    inserts: int = field(init=False, repr=True, default=0)
+    overwrites: int = field(init=False, repr=True, default=0)
+    evictions: Counter[str] = field(init=False, repr=True, factory=Counter)
+
+    @property
+    def ratio(self) -> None | float:
+        """The ratio of lookups which hit, None if nothing was looked up yet."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+@define(eq=False)
 class Cache(Generic[KeyT, ValueT]):
     """A class which handles in-memory caching.
 
@@ -24,36 +335,137 @@ class Cache(Generic[KeyT, ValueT]):
     max: None | :class:`int`
         The max amount of keys allowed in the cache.
 
+    policy: :class:`str`
+        The eviction policy used once the cache is full, one of
+        `fifo` (first inserted), `lru` (least recently used) or `lfu` (least frequently
+        used, oldest first on ties). Every policy evicts in constant time.
+
+    ttl: None | :class:`float`
+        The amount of seconds entries live for, None for no expiry.
+        Expired entries are dropped when accessed, and swept while inserting.
+
+    max_bytes: None | :class:`int`
+        The max amount of bytes the entries can take up, None for no limit.
+        Entries are sized with `sizer` when inserted, setting a limit later
+        sizes the entries already cached and evicts right away.
+
+    budget: None | :class:`.MemoryBudget`
+        A budget shared with other caches, entries are evicted from the largest
+        cache sharing it once it is exceeded.
+
+    sizer: Callable[[Any], :class:`int`]
+        The function approximating the size of an entry, defaults to :func:`footprint`.
+
+    stats: None | :class:`.CacheStats`
+        The counters to record operations in, None to not count anything.
+
+    on_evict: None | Callable[[Any, Any, :class:`str`], Any]
+        Called with the key, value and reason of every entry evicted,
+        e.g to spill it to secondary storage. Entries popped or overwritten
+        are not evictions.
+
+    loader: None | Callable[[Any], Any]
+        Called with the key of every lookup which misses, e.g to load it from
+        secondary storage. The value returned is cached, unless it is None.
+
+    on_remove: None | Callable[[Any], Any]
+        Called with the key of every entry removed, whether popped or evicted,
+        e.g to keep secondary storage from bringing it back.
+
     Attributes
     ----------
-    root: :class:`dict`
-        The internal dict of the cache.
+    root: :class:`collections.OrderedDict`
+        The internal dict of the cache, oldest or least recently used first.
 
     max_items: None | :class:`int`
         The max amount of items the cache can have at a given time.
 
     len: :class:`int`
         The current amount of items in the cache.
+
+    bytes: :class:`int`
+        The approximate amount of bytes the entries take up,
+        only tracked while a byte limit applies.
+
+    indexes: :class:`dict`
+        The :class:`.Index` instances kept up to date with the entries, by name.
     """
 
-    root: dict[KeyT, ValueT] = field(init=False, repr=False)
+    root: OrderedDict[KeyT, ValueT] = field(init=False, repr=False)
     len: int = field(init=False, default=0)
     max_items: None | int = field(repr=True)
+    policy: Policy = field(repr=True, default="fifo")
+    ttl: None | float = field(repr=True, default=None)
+
+    max_bytes: None | int = field(
+        kw_only=True, repr=True, default=None, on_setattr=_limited
+    )
+    budget: None | MemoryBudget = field(
+        kw_only=True, repr=False, default=None, on_setattr=_rebudget
+    )
+    sizer: Callable[[Any], int] = field(kw_only=True, repr=False, default=footprint)
+    sizes: dict[KeyT, int] = field(init=False, repr=False, factory=dict)
+    finalizer: None | weakref.finalize = field(init=False, repr=False, default=None)
+    bytes: int = field(init=False, repr=False, default=0)
+
+    stats: None | CacheStats = field(kw_only=True, repr=False, default=None)
+    indexes: dict[str, Index[KeyT]] = field(init=False, repr=False, factory=dict)
+    on_evict: None | Callable[[KeyT, ValueT, Reason], Any] = field(
+        kw_only=True, repr=False, default=None
+    )
+    loader: None | Callable[[KeyT], None | ValueT] = field(
+        kw_only=True, repr=False, default=None
+    )
+    on_remove: None | Callable[[KeyT], Any] = field(
+        kw_only=True, repr=False, default=None
+    )
+
+    # Use counts and the keys per use count, in insertion order, for `lfu`.
+    # Ordered dicts are used as a plain dict slows down when popped from the front.
+    counts: dict[KeyT, int] = field(init=False, repr=False, factory=dict)
+    buckets: dict[int, OrderedDict[KeyT, None]] = field(
+        init=False, repr=False, factory=dict
+    )
+    least: int = field(init=False, repr=False, default=0)
+
+    # Deadlines per key, and a heap of them which may hold stale entries.
+    deadlines: dict[KeyT, float] = field(init=False, repr=False, factory=dict)
+    heap: list[tuple[float, int, KeyT]] = field(init=False, repr=False, factory=list)
+    pushed: int = field(init=False, repr=False, default=0)
 
     def __attrs_post_init__(self) -> None:
-        self.root: dict[KeyT, ValueT] = {}
+        self.root = OrderedDict()
 
-    def __setitem__(self, key: KeyT, value: ValueT) -> None:
-        self.root[key] = value
-        self.len += 1
+        if self.policy not in ("fifo", "lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy {self.policy!r}")
 
-        if self.max_items is not None and self.len > self.max_items:
-            self.pop()
+        if self.budget is not None:
+            self.budget.join(self)
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        self.set(key, value)
 
     def __getitem__(self, key: KeyT) -> ValueT:
-        return self.root[key]
+        if (value := self.get(key, MISSING)) is MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: KeyT) -> bool:
+        return key in self.root and not self.expired(key)
+
+    def __len__(self) -> int:
+        return self.len
+
+    @property
+    def sized(self) -> bool:
+        """If entries are sized, because a byte limit applies."""
+        if self.max_bytes is not None:
+            return True
 
-    def set(self, key: KeyT, value: ValueT) -> None:
+        return self.budget is not None and self.budget.max_bytes is not None
+
+    def set(self, key: KeyT, value: ValueT, ttl: None | float = None) -> None:
         """Sets a key-value pair in the cache.
 
         Parameters
@@ -63,10 +475,77 @@ class Cache(Generic[KeyT, ValueT]):
 
         value: Any
             The value of the key.
+
+        ttl: None | :class:`float`
+            The amount of seconds this entry lives for, overriding :attr:`ttl`.
         """
-        return self.__setitem__(key, value)
+        sized, exists = self.sized, key in self.root
+
+        if self.stats is not None:
+            if exists:
+                self.stats.overwrites += 1
+            else:
+                self.stats.inserts += 1
+
+        if exists and not sized:
+            if self.indexes:
+                for index in self.indexes.values():
+                    index.discard(key, self.root[key])
+                    index.add(key, value)
+
+            self.root[key] = value
+            self.touch(key)
+        else:
+            # The size of an entry can change, so sized entries are replaced.
+            if exists:
+                self.remove(key)
+
+            size = self.sizer(value) if sized else 0
+
+            if self.heap:
+                self.expire()
+
+            # Evicting first, so the new entry is never the one picked.
+            while self.root and self.max_items is not None and self.len >= self.max_items:
+                self.evict("capacity")
+
+            if sized:
+                self.reclaim(size)
+
+                self.sizes[key] = size
+                self.bytes += size
+
+                if self.budget is not None:
+                    self.budget.used += size
+
+            self.root[key] = value
+            self.len += 1
+
+            if self.indexes:
+                for index in self.indexes.values():
+                    index.add(key, value)
+
+            if self.policy == "lfu":
+                self.counts[key] = 1
+                self.buckets.setdefault(1, OrderedDict())[key] = None
+                self.least = 1
+
+        if (ttl := self.ttl if ttl is None else ttl) is not None:
+            deadline = time.monotonic() + ttl
+            self.deadlines[key] = deadline
 
-    def get(self, key: KeyT) -> None | ValueT:
+            self.pushed += 1
+            heapq.heappush(self.heap, (deadline, self.pushed, key))
+
+            # Refreshing an entry leaves its previous deadline behind in the heap.
+            if exists:
+                self.compact()
+
+        # An entry overwritten without a ttl no longer expires.
+        elif exists and self.deadlines.pop(key, None) is not None:
+            self.compact()
+
+    def get(self, key: KeyT, default: Any = None) -> None | ValueT:
         """Grabs from the cache.
 
         Parameters
@@ -74,50 +553,594 @@ class Cache(Generic[KeyT, ValueT]):
         key: Any
             The key to query with.
 
+        default: Any
+            The value returned if the key is not cached.
+
         Returns
         -------
         None | Any
             The item grabbed from the cache.
         """
-        return self.root.get(key)
+        if (value := self.root.get(key, MISSING)) is MISSING:
+            if self.stats is not None:
+                self.stats.misses += 1
+
+            if self.loader is not None and (loaded := self.loader(key)) is not None:
+                # Models cache themselves when created, which a loader may do.
+                if key not in self.root:
+                    self.set(key, loaded)
+
+                return loaded
+
+            return default
+
+        if self.deadlines and self.expired(key):
+            self.evict("expired", key)
+
+            if self.stats is not None:
+                self.stats.misses += 1
+
+            return default
+
+        if self.policy != "fifo":
+            self.touch(key)
+
+        if self.stats is not None:
+            self.stats.hits += 1
+
+        return value
 
     def pop(self, key: None | KeyT = None) -> ValueT:
         """Pops a key from the cache.
-        If no key is given, pop the first inserted key.
+        If no key is given, pop the key picked by the eviction policy.
 
         Parameters
         ----------
         key: None | Any
             The key to pop.
 
+        Raises
+        ------
+        :exc:`KeyError`
+            The key given is not cached.
+
+        :exc:`IndexError`
+            No key was given and the cache is empty.
+
         Returns
         -------
         Any
             The value of the key popped.
         """
+        return self.remove(self.victim() if key is None else key)
+
+    def victim(self) -> KeyT:
+        """Picks the key to evict next according to the eviction policy.
+
+        Raises
+        ------
+        :exc:`IndexError`
+            The cache is empty.
+
+        Returns
+        -------
+        Any
+            The key picked.
+        """
+        if not self.root:
+            raise IndexError("pop from an empty cache")
+
+        if self.policy == "lfu":
+            if self.least not in self.buckets:
+                self.least = min(self.buckets)
+
+            return next(iter(self.buckets[self.least]))
+
+        return next(iter(self.root))
+
+    def evict(self, reason: Reason, key: None | KeyT = None) -> ValueT:
+        """Evicts an entry, counting it and calling :attr:`on_evict`.
+
+        Parameters
+        ----------
+        reason: :class:`str`
+            The reason of the eviction.
+
+        key: None | Any
+            The key to evict, defaults to the one picked by the eviction policy.
+
+        Returns
+        -------
+        Any
+            The value of the key evicted.
+        """
+        key = self.victim() if key is None else key
+        value = self.remove(key)
+
+        if self.stats is not None:
+            self.stats.evictions[reason] += 1
+
+        if self.on_evict is not None:
+            self.on_evict(key, value, reason)
+
+        return value
+
+    def remove(self, key: KeyT) -> ValueT:
+        value = self.root.pop(key)
         self.len -= 1
 
-        if key is not None:
-            return self.root.pop(key)
+        if self.on_remove is not None:
+            self.on_remove(key)
+
+        if self.indexes:
+            for index in self.indexes.values():
+                index.discard(key, value)
+
+        if self.policy == "lfu":
+            count = self.counts.pop(key)
+            bucket = self.buckets[count]
+            del bucket[key]
+
+            # The next least used count is only looked up when evicting,
+            # as inserting right after an eviction resets it to 1.
+            if not bucket:
+                del self.buckets[count]
+
+        if self.deadlines.pop(key, None) is not None:
+            self.compact()
+
+        if self.sizes and (size := self.sizes.pop(key, None)) is not None:
+            self.bytes -= size
+
+            if self.budget is not None:
+                self.budget.used -= size
+
+        return value
+
+    def index(self, name: str, key: None | Callable[[ValueT], Any] = None) -> Index[KeyT]:
+        """Adds an index to the cache, indexing the entries already cached.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the index.
+
+        key: None | Callable[[Any], Any]
+            The function deriving the indexed value from an entry,
+            defaults to getting the attribute named `name`.
+
+        Returns
+        -------
+        :class:`.Index`
+            The index added.
+        """
+        index = Index[KeyT](name, operator.attrgetter(name) if key is None else key)
+
+        for cached, value in self.root.items():
+            index.add(cached, value)
+
+        self.indexes[name] = index
+        return index
+
+    def query(
+        self,
+        name: str,
+        indexed: Any,
+        *,
+        limit: None | int = None,
+        before: None | KeyT = None,
+        after: None | KeyT = None,
+    ) -> list[ValueT]:
+        """Looks entries up through an index, without scanning the cache.
+
+        .. code-block:: python
+
+            client.caches[Message].query("channel", channel_id, limit=50)
+
+        Lookups through an index do not count as uses of the entries.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the index to use.
+
+        indexed: Any
+            The indexed value to look up, e.g the ID of a channel.
+
+        limit: None | :class:`int`
+            The max amount of entries returned, the ones with the largest keys are kept.
+
+        before: None | Any
+            Only entries with a key smaller than this one are returned.
+
+        after: None | Any
+            Only entries with a key larger than this one are returned.
+
+        Raises
+        ------
+        :exc:`KeyError`
+            No index has the given name.
+
+        Returns
+        -------
+        :class:`list`
+            The entries found, largest key first.
+        """
+        if self.heap:
+            self.expire()
+
+        keys = self.indexes[name].query(indexed, limit, before, after)
+        return [self.root[key] for key in keys]
+
+    def reclaim(self, size: int) -> None:
+        """Evicts entries until there is room for an entry of the given size."""
+        while (
+            self.root
+            and self.max_bytes is not None
+            and self.bytes + size > self.max_bytes
+        ):
+            self.evict("bytes")
+
+        if self.budget is not None:
+            self.budget.reclaim(size)
+
+    def measure(self) -> None:
+        """Sizes the entries cached before a byte limit applied, then evicts
+        until the limits are respected. This is done when :attr:`max_bytes`
+        or :attr:`budget` is set.
+        """
+        if not self.sized:
+            return
+
+        for key, value in self.root.items():
+            if key not in self.sizes:
+                size = self.sizes[key] = self.sizer(value)
+                self.bytes += size
+
+                if self.budget is not None:
+                    self.budget.used += size
+
+        self.reclaim(0)
+
+    def touch(self, key: KeyT) -> None:
+        """Records a use of a key for the eviction policy."""
+        if self.policy == "lru":
+            self.root.move_to_end(key)
+
+        elif self.policy == "lfu":
+            count = self.counts[key]
+            bucket = self.buckets[count]
+            del bucket[key]
+
+            if not bucket:
+                del self.buckets[count]
+
+                if self.least == count:
+                    self.least = count + 1
+
+            self.counts[key] = count + 1
+            self.buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def expired(self, key: KeyT) -> bool:
+        deadline = self.deadlines.get(key)
+        return deadline is not None and deadline <= time.monotonic()
+
+    def compact(self) -> None:
+        """Rebuilds the heap of deadlines once its stale items outnumber the live ones,
+        so entries removed or refreshed before expiring do not pile up in it.
+        """
+        if len(self.heap) <= 2 * len(self.deadlines):
+            return
+
+        self.heap = []
+
+        for key, deadline in self.deadlines.items():
+            self.pushed += 1
+            self.heap.append((deadline, self.pushed, key))
+
+        heapq.heapify(self.heap)
+
+    def expire(self) -> int:
+        """Drops every expired entry, this is done on inserts and can be called
+        periodically to free memory while the cache is idle.
+
+        Returns
+        -------
+        :class:`int`
+            The amount of entries dropped.
+        """
+        now, dropped = time.monotonic(), 0
+
+        while self.heap and self.heap[0][0] <= now:
+            deadline, _, key = heapq.heappop(self.heap)
+
+            # Entries removed or refreshed since leave stale heap items behind.
+            if self.deadlines.get(key) == deadline:
+                self.evict("expired", key)
+                dropped += 1
+
+        return dropped
+
+    def copy(self, budget: None | MemoryBudget = None) -> Cache[KeyT, ValueT]:
+        """Creates an empty cache with the same limits, policy, counters and indexes.
+        The :attr:`loader` and :attr:`on_remove` hooks are not copied,
+        they are tied to the storage of a single cache.
+
+        Parameters
+        ----------
+        budget: None | :class:`.MemoryBudget`
+            The budget of the copy.
+
+        Returns
+        -------
+        :class:`.Cache`
+            The copy of the cache.
+        """
+        cache = Cache[KeyT, ValueT](
+            self.max_items,
+            self.policy,
+            self.ttl,
+            max_bytes=self.max_bytes,
+            budget=budget,
+            sizer=self.sizer,
+            stats=CacheStats() if self.stats is not None else None,
+            on_evict=self.on_evict,
+        )
+
+        for name, index in self.indexes.items():
+            cache.index(name, index.key)
+
+        return cache
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summarises the cache, without walking its entries.
+
+        Returns
+        -------
+        :class:`dict`
+            The size, limits and policy of the cache,
+            along with its counters if :attr:`stats` is set.
+        """
+        snapshot: dict[str, Any] = {
+            "len": self.len,
+            "bytes": self.bytes,
+            "max_items": self.max_items,
+            "max_bytes": self.max_bytes,
+            "policy": self.policy,
+        }
+
+        if (stats := self.stats) is not None:
+            snapshot.update(
+                hits=stats.hits,
+                misses=stats.misses,
+                ratio=stats.ratio,
+                inserts=stats.inserts,
+                overwrites=stats.overwrites,
+                evictions=dict(stats.evictions),
+            )
 
-        return self.root.pop(list(self.root.keys())[0])
+        return snapshot
 
 
 class Cacheable:
     """Represents a cache-able model.
 
+    Subclasses configure their cache through class keywords,
+    e.g `class Model(Cacheable, max_items=1000, policy="lru", ttl=600)`.
+    A byte limit is set with `max_bytes`, and every model cache shares :data:`BUDGET`.
+    Operations are counted in a :class:`.CacheStats` with `stats=True`,
+    and `indexes` names the attributes to index entries by, see :meth:`.Cache.query`.
+
     Attributes
     ----------
     cache: :class:`.Cache`
-        The cache for this model.
+        The template cache for this model. Every client caches the models it
+        builds in its own copy, see :attr:`.WebSocketClient.caches`.
     """
 
     __cache__: Cache[Any, Self]
 
     def __init_subclass__(cls: type[Self], **kwargs: Any) -> None:
-        cls.__cache__ = Cache[Any, Self](kwargs.get("max_items"))
+        # Slotted attrs classes are rebuilt without the class keywords,
+        # the rebuilt class keeps the cache configured on the original.
+        if not kwargs and "__cache__" in cls.__dict__:
+            return
+
+        cls.__cache__ = Cache[Any, Self](
+            kwargs.get("max_items"),
+            kwargs.get("policy", "fifo"),
+            kwargs.get("ttl"),
+            max_bytes=kwargs.get("max_bytes"),
+            budget=BUDGET,
+            stats=CacheStats() if kwargs.get("stats") else None,
+        )
+
+        for name in kwargs.get("indexes", ()):
+            cls.__cache__.index(name)
 
     @classmethod
     @property
     def cache(cls: type[Self]) -> Cache[Any, Self]:
         return cls.__cache__
+
+    @staticmethod
+    def models() -> dict[str, type[Cacheable]]:
+        """Collects every cache-able model.
+
+        Returns
+        -------
+        :class:`dict`
+            The models, mapped by their qualified name.
+        """
+        models: dict[str, type[Cacheable]] = {}
+        pending = Cacheable.__subclasses__()
+
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+
+            if "__cache__" in cls.__dict__:
+                models[f"{cls.__module__}.{cls.__qualname__}"] = cls
+
+        return models
+
+    @staticmethod
+    def caches() -> dict[str, list[Cache[Any, Any]]]:
+        """Collects the caches of every cache-able model across the process,
+        the template cache of the model first, then the copy of every live client.
+
+        Returns
+        -------
+        :class:`dict`
+            The caches, mapped by the qualified name of their model.
+        """
+        caches = {name: [cls.__cache__] for name, cls in Cacheable.models().items()}
+
+        for registry in list(REGISTRIES):
+            for model, cache in list(registry.caches.items()):
+                caches[f"{model.__module__}.{model.__qualname__}"].append(cache)
+
+        return caches
+
+    @staticmethod
+    def snapshot() -> dict[str, dict[str, Any]]:
+        """Summarises the caches of every cache-able model across the process.
+
+        Returns
+        -------
+        :class:`dict`
+            The :meth:`.Cache.snapshot` of the template cache of every model,
+            with the sizes and counters of the copies of every live client added up.
+            `caches` holds the amount of copies.
+        """
+        snapshot: dict[str, dict[str, Any]] = {}
+
+        for name, (template, *copies) in Cacheable.caches().items():
+            summary = snapshot[name] = template.snapshot()
+            summary["caches"] = len(copies)
+
+            for cache in copies:
+                summary["len"] += cache.len
+                summary["bytes"] += cache.bytes
+
+                if (stats := cache.stats) is None or "hits" not in summary:
+                    continue
+
+                summary["hits"] += stats.hits
+                summary["misses"] += stats.misses
+                summary["inserts"] += stats.inserts
+                summary["overwrites"] += stats.overwrites
+                summary["evictions"] = dict(
+                    stats.evictions + Counter(summary["evictions"])
+                )
+
+            if "hits" in summary:
+                lookups = summary["hits"] + summary["misses"]
+                summary["ratio"] = summary["hits"] / lookups if lookups else None
+
+        return snapshot
+
+
+BUDGET = MemoryBudget()
+# The registries of the live clients, summarised by `Cacheable.snapshot`.
+REGISTRIES: weakref.WeakSet[CacheRegistry] = weakref.WeakSet()
+
+
+@define(eq=False)
+class CacheRegistry:
+    """A class which holds the model caches of a single client,
+    so clients sharing a process never share cached models.
+
+    Caches are copied from the template cache of their model, :attr:`.Cacheable.cache`,
+    the first time they are resolved, so a client only pays for the models it uses.
+
+    .. code-block:: python
+
+        client.caches[Message].query("channel", channel_id, limit=50)
+
+    Parameters
+    ----------
+    budget: None | :class:`.MemoryBudget`
+        The budget of the caches, the process-wide :data:`BUDGET` by default
+        so a single limit bounds the caches of every client.
+
+    Attributes
+    ----------
+    caches: :class:`dict`
+        The caches of the registry, mapped by model.
+    """
+
+    budget: None | MemoryBudget = field(repr=False, default=BUDGET)
+    caches: dict[type[Cacheable], Cache[Any, Any]] = field(
+        init=False, repr=False, factory=dict
+    )
+
+    def __attrs_post_init__(self) -> None:
+        REGISTRIES.add(self)
+
+    def __getitem__(self, model: type[CacheableT]) -> Cache[Any, CacheableT]:
+        return self.resolve(model)
+
+    def __contains__(self, model: type[Cacheable]) -> bool:
+        return model in self.caches
+
+    def __len__(self) -> int:
+        return len(self.caches)
+
+    def get(self, model: type[CacheableT]) -> None | Cache[Any, CacheableT]:
+        """Grabs the cache of a model, without creating it.
+
+        Parameters
+        ----------
+        model: type[:class:`.Cacheable`]
+            The model to grab the cache of.
+
+        Returns
+        -------
+        None | :class:`.Cache`
+            The cache, None if it was never resolved.
+        """
+        return self.caches.get(model)
+
+    def resolve(self, model: type[CacheableT]) -> Cache[Any, CacheableT]:
+        """Resolves the cache of a model, copying it from the template if needed.
+
+        Parameters
+        ----------
+        model: type[:class:`.Cacheable`]
+            The model to resolve the cache of.
+
+        Returns
+        -------
+        :class:`.Cache`
+            The registry's own cache of the model.
+        """
+        if (cache := self.caches.get(model)) is None:
+            cache = self.caches[model] = model.__cache__.copy(self.budget)
+
+        return cache
+
+    def values(self) -> list[Cache[Any, Any]]:
+        """The caches of the registry."""
+        return list(self.caches.values())
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Summarises the caches of the registry.
+
+        Returns
+        -------
+        :class:`dict`
+            The :meth:`.Cache.snapshot` of every cache, mapped by the qualified name
+            of their model.
+        """
+        return {
+            f"{model.__module__}.{model.__qualname__}": cache.snapshot()
+            for model, cache in self.caches.items()
+        }
+
+    def clear(self) -> None:
+        """Drops every cache, releasing the bytes they took up from the budget."""
+        for cache in self.caches.values():
+            cache.budget = None
+
+        self.caches.clear()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Any
+
+import attrs
+from typing_extensions import Self
+
+__all__ = ("Detachable",)
+
+
+def restore(cls: type[Detachable], state: dict[str, Any]) -> Detachable:
+    self = object.__new__(cls)
+
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+    return self
+
+
+class Detachable:
+    """A model which can be pickled without its client,
+    e.g to be handed to a listener running in another process.
+
+    Unpickling does not run the model's initialisation again, so the copy is not cached,
+    and its `client` attribute is None.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self: Self) -> tuple[Any, ...]:
+        state = {
+            attribute.name: getattr(self, attribute.name, None)
+            for attribute in attrs.fields(type(self))  # type: ignore
+        }
+        state["client"] = None
+
+        return restore, (type(self), state)
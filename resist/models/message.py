@@ -14,6 +14,7 @@ from ..types import (
 )
 from .assets import Asset
 from .cacheable import Cacheable
+from .detachable import Detachable
 from .embed import Embed
 from .fetchable import Fetchable
 
@@ -25,9 +26,12 @@ __all__ = ("Message",)
 
 
 @define
-class Message(Cacheable, Fetchable):
+class Message(Cacheable, Detachable, Fetchable, indexes=("channel", "author")):
     """Represents a message sent on Revolt.
 
+    Messages are cached by their client, indexed by channel and author,
+    e.g `client.caches[Message].query("channel", channel_id, limit=50)`.
+
     Attributes
     ----------
     client: :class:`.WebSocketClient`
@@ -64,7 +68,7 @@ class Message(Cacheable, Fetchable):
         The list of members mentioned in this message.
 
     replies: :class:`list[.Message]`
-        The list of messages being replied to.
+        The list of messages being replied to, those no longer cached are left out.
 
     masquerade: None | :class:`dict`
         Alternate username/avatar used while sending this message.
@@ -126,10 +130,16 @@ class Message(Cacheable, Fetchable):
 
         self.embeds = [Embed.from_api(i) for i in self.data.get("embeds", [])]
         self.mentions = self.data.get("mentions", [])
-        self.replies = [Message.cache[id] for id in self.data.get("replies", [])]
+        cache = self.client.caches[Message]
+
+        self.replies = [
+            reply
+            for id in self.data.get("replies", [])
+            if (reply := cache.get(id)) is not None
+        ]
         self.masquerade = self.data.get("masquerade")
 
-        Message.cache.set(self.unique, self)
+        cache.set(self.unique, self)
 
     @staticmethod
     def _handle_system_message_content(
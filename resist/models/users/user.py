@@ -8,6 +8,7 @@ from typing_extensions import Self
 from ...types import UserData
 from ..assets import Asset
 from ..cacheable import Cacheable
+from ..detachable import Detachable
 from ..fetchable import Fetchable
 from .flags import UserBadges, UserFlags
 from .presence import Presence
@@ -20,7 +21,7 @@ __all__ = ("User",)
 
 
 @define
-class User(Cacheable, Fetchable):
+class User(Cacheable, Detachable, Fetchable):
     """A class representing a User object.
 
     Attributes
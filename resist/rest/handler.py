@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -43,6 +44,9 @@ class RESTClient:
 
     context: :class:`.APIContext`
         The context of the API.
+
+    fetched: :class:`float`
+        The UNIX timestamp the context was fetched from the API at.
     """
 
     client: WebSocketClient = field(repr=False)
@@ -51,10 +55,15 @@ class RESTClient:
 
     session: aiohttp.ClientSession = field(init=False, repr=False)
     context: APIContext = field(init=False, repr=True)
+    fetched: float = field(init=False, repr=False, default=0.0)
 
     @classmethod
     async def connect(
-        cls: type[Self], client: WebSocketClient, url: str = "https://api.revolt.chat/"
+        cls: type[Self],
+        client: WebSocketClient,
+        url: str = "https://api.revolt.chat/",
+        context: None | APIContext = None,
+        fetched: None | float = None,
     ) -> Self:
         """Creates a RESTClient and connects.
 
@@ -66,6 +75,13 @@ class RESTClient:
         url: :class:`str`
             The URL to use for the API.
 
+        context: None | :class:`.APIContext`
+            A context saved beforehand, e.g in a :class:`.Snapshot`,
+            to skip fetching it from the API root.
+
+        fetched: None | :class:`float`
+            The UNIX timestamp the given context was fetched at.
+
         Returns
         -------
         :class:`.RESTClient`
@@ -74,10 +90,18 @@ class RESTClient:
         headers = {"x-bot-token": client.token, "User-Agent": "Resist v0.1.0-alpha"}
 
         self: Self = cls(client, client.token, url)
-        self.session = aiohttp.ClientSession(headers=headers)
+        self.session = aiohttp.ClientSession(
+            headers=headers, json_serialize=client.json.dumps
+        )
+
+        if context is not None:
+            self.context = context
+            self.fetched = time.time() if fetched is None else fetched
+            return self
 
         async with self.session.get(url) as resp:
-            self.context = APIContext(**(await resp.json()))
+            self.context = APIContext(**(await resp.json(loads=client.json.loads)))
+            self.fetched = time.time()
 
         return self
 
@@ -103,4 +127,4 @@ class RESTClient:
         path = self.url + path
 
         async with self.session.request(method, path, **kwargs) as resp:
-            return await resp.json()
+            return await resp.json(loads=self.client.json.loads)
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+from typing import TYPE_CHECKING, Any, Iterator
+
+from attrs import define, field
+
+from .models import Cache, Cacheable
+from .types import APIContext
+
+if TYPE_CHECKING:
+    from .client import WebSocketClient
+
+
+__all__ = ("Snapshot",)
+_log = logging.getLogger(__name__)
+
+MAGIC = b"RSNP"
+VERSION = 1
+
+# Magic, format version, manifest length. Sections are located relative
+# to the end of the manifest, so the manifest can be encoded once.
+HEADER = struct.Struct(">4sHI")
+# Offset and length of an entry's data, following its padded key.
+ENTRY = struct.Struct(">QI")
+
+
+@define(frozen=True)
+class Section:
+    """The entries of a single model cache within a snapshot."""
+
+    count: int
+    width: int
+    table: int
+    data: int
+
+    @property
+    def record(self) -> int:
+        return self.width + ENTRY.size
+
+
+@define(eq=False)
+class Snapshot:
+    """A class which persists model caches and the API context to disk,
+    so a restarted client starts with warm caches without re-fetching the API root.
+
+    The file is memory-mapped and nothing is decoded when opened. Every model cache
+    of the client is stored as a table of fixed width keys, sorted so lookups bisect
+    it in place, followed by the raw data of the entries. Entries are decoded and turned
+    back into models on their first lookup, through the :attr:`.Cache.loader` of
+    their cache.
+
+    Only cached models with `client` and `data` attributes are stored,
+    they are rebuilt with `Model(client, data)`.
+
+    .. code-block:: python
+
+        client = WebSocketClient(token, snapshot="resist.snapshot")
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the snapshot file.
+
+    Attributes
+    ----------
+    version: :class:`int`
+        The format version of the file.
+
+    created: :class:`float`
+        The UNIX timestamp the snapshot was saved at.
+
+    context: None | :class:`.APIContext`
+        The context of the API when the snapshot was saved.
+
+    fetched: :class:`float`
+        The UNIX timestamp :attr:`context` was fetched from the API at.
+        A reused context keeps the timestamp it was fetched at,
+        so it ages across restarts.
+
+    sections: :class:`dict`
+        The location of the entries of every model, mapped by its qualified name.
+
+    loaders: :class:`list`
+        The loaders set on the caches of the client the snapshot was loaded into.
+    """
+
+    path: str = field(repr=True)
+    file: Any = field(repr=False)
+    map: mmap.mmap = field(repr=False)
+
+    version: int = field(init=False, repr=True, default=VERSION)
+    created: float = field(init=False, repr=False, default=0.0)
+    context: None | APIContext = field(init=False, repr=False, default=None)
+    fetched: float = field(init=False, repr=False, default=0.0)
+    sections: dict[str, Section] = field(init=False, repr=False, factory=dict)
+    loaders: list[Loader] = field(init=False, repr=False, factory=list)
+
+    @classmethod
+    def open(cls, path: str) -> None | Snapshot:
+        """Opens a snapshot, reading nothing but its manifest.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the snapshot file.
+
+        Returns
+        -------
+        None | :class:`.Snapshot`
+            The snapshot, None if the file is missing, unreadable
+            or of another format version.
+        """
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            file.close()
+            _log.warning(f"SNAPSHOT {path} IS EMPTY OR UNREADABLE")
+            return None
+
+        self = cls(path, file, mapped)
+
+        try:
+            self.read()
+        except Exception:
+            self.close()
+            _log.exception(f"SNAPSHOT {path} IS CORRUPT")
+            return None
+
+        if self.version != VERSION:
+            self.close()
+            _log.warning(f"SNAPSHOT {path} IS VERSION {self.version}, EXPECTED {VERSION}")
+            return None
+
+        return self
+
+    def read(self) -> None:
+        magic, self.version, length = HEADER.unpack_from(self.map, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"Unknown snapshot magic {magic!r}")
+
+        if self.version != VERSION:
+            return
+
+        # The manifest is always encoded with the stdlib so any backend can read it.
+        end = HEADER.size + length
+        manifest = json.loads(self.map[HEADER.size : end])
+
+        self.created = manifest["created"]
+        self.context = manifest["context"]
+        self.fetched = manifest.get("fetched", self.created)
+        self.sections = {
+            name: Section(count, width, end + table, end + data)
+            for name, (count, width, table, data) in manifest["sections"].items()
+        }
+
+    def close(self) -> None:
+        """Closes the snapshot, detaching it from every cache it loads entries into."""
+        for loader in self.loaders:
+            if loader.cache.loader is loader:
+                loader.cache.loader = None
+                loader.cache.on_remove = None
+
+        self.loaders.clear()
+
+        self.map.close()
+        self.file.close()
+
+    def lookup(self, name: str, key: str) -> None | bytes:
+        """Looks up the raw data of an entry.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The qualified name of the model.
+
+        key: :class:`str`
+            The key of the entry.
+
+        Returns
+        -------
+        None | :class:`bytes`
+            The encoded data of the entry, None if it was not stored.
+        """
+        if (section := self.sections.get(name)) is None:
+            return None
+
+        encoded = key.encode()
+
+        if len(encoded) > section.width:
+            return None
+
+        padded = encoded.ljust(section.width, b"\0")
+        low, high = 0, section.count
+
+        while low < high:
+            middle = (low + high) // 2
+            start = section.table + middle * section.record
+            current = self.map[start : start + section.width]
+
+            if current < padded:
+                low = middle + 1
+            elif current > padded:
+                high = middle
+            else:
+                offset, length = ENTRY.unpack_from(self.map, start + section.width)
+                start = section.data + offset
+
+                return self.map[start : start + length]
+
+        return None
+
+    def entries(self, name: str) -> Iterator[tuple[str, bytes]]:
+        """Iterates over the keys and raw data of the entries of a model, in key order.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The qualified name of the model.
+        """
+        if (section := self.sections.get(name)) is None:
+            return
+
+        for index in range(section.count):
+            start = section.table + index * section.record
+            key = self.map[start : start + section.width].rstrip(b"\0").decode()
+
+            offset, length = ENTRY.unpack_from(self.map, start + section.width)
+            start = section.data + offset
+
+            yield key, self.map[start : start + length]
+
+    def load(self, client: WebSocketClient) -> None:
+        """Loads entries into the model caches of a client lazily, on their first lookup.
+
+        The :attr:`.Cache.loader` and :attr:`.Cache.on_remove` of the caches are set,
+        the latter to keep entries removed during the session from being saved again.
+
+        Parameters
+        ----------
+        client: :class:`.WebSocketClient`
+            The client to load the entries into and rebuild models with.
+        """
+        models = Cacheable.models()
+
+        for name in self.sections:
+            if (cls := models.get(name)) is not None:
+                cache = client.caches[cls]
+                loader = Loader(self, client, cls, name, cache)
+
+                cache.loader = loader
+                cache.on_remove = loader.forget
+                self.loaders.append(loader)
+
+    @staticmethod
+    def save(
+        path: str, client: WebSocketClient, previous: None | Snapshot = None
+    ) -> None:
+        """Saves the model caches and the API context of a client.
+
+        The file is written next to the path then moved over it,
+        so a crash while saving leaves the previous snapshot intact.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path of the snapshot file.
+
+        client: :class:`.WebSocketClient`
+            The client to save the caches and the context of.
+
+        previous: None | :class:`.Snapshot`
+            The snapshot loaded at startup. Its entries which were never looked up
+            nor removed from their cache are carried over, as long as the cache
+            has room for them next to its own entries, newest first.
+        """
+        context = client.rest.context if hasattr(client, "rest") else None
+        fetched = client.rest.fetched if hasattr(client, "rest") else 0.0
+        sections: dict[str, tuple[int, int, int, int]] = {}
+        blobs: list[bytearray] = []
+        position = 0
+
+        for name, cls in Cacheable.models().items():
+            if (cache := client.caches.get(cls)) is None:
+                continue
+
+            entries: dict[str, bytes] = {}
+
+            for key, model in cache.root.items():
+                if isinstance(key, str) and hasattr(model, "data"):
+                    entries[key] = client.json.dumps(model.data).encode()
+
+            loader = cache.loader
+
+            if isinstance(loader, Loader) and loader.snapshot is previous:
+                carried = [
+                    (key, raw)
+                    for key, raw in previous.entries(name)
+                    if key not in entries and not loader.stale(key)
+                ]
+
+                # The entries of the cache come first, the newest carried ones fill
+                # whatever room is left.
+                if cache.max_items is not None:
+                    room = max(cache.max_items - len(entries), 0)
+                    carried = carried[-room:] if room else []
+
+                entries.update(carried)
+
+            if not entries:
+                continue
+
+            keys = sorted(entries, key=str.encode)
+
+            width = max(len(key.encode()) for key in keys)
+            table, data = bytearray(), bytearray()
+
+            for key in keys:
+                table += key.encode().ljust(width, b"\0")
+                table += ENTRY.pack(len(data), len(entries[key]))
+                data += entries[key]
+
+            sections[name] = (len(keys), width, position, position + len(table))
+            blobs += (table, data)
+            position += len(table) + len(data)
+
+        manifest = {
+            "created": time.time(),
+            "context": context,
+            "fetched": fetched,
+            "sections": sections,
+        }
+        encoded = json.dumps(manifest, separators=(",", ":")).encode()
+
+        temporary = f"{path}.tmp"
+
+        with open(temporary, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, len(encoded)))
+            file.write(encoded)
+
+            for blob in blobs:
+                file.write(blob)
+
+        os.replace(temporary, path)
+
+
+@define(eq=False)
+class Loader:
+    """The :attr:`.Cache.loader` rebuilding models from a snapshot.
+
+    It tracks the keys it served and the keys removed from the cache,
+    neither of which are carried over from the snapshot when saving.
+    """
+
+    snapshot: Snapshot = field(repr=True)
+    client: WebSocketClient = field(repr=False)
+    cls: type[Cacheable] = field(repr=True)
+    name: str = field(repr=False)
+    cache: Cache[Any, Any] = field(repr=False)
+
+    served: set[str] = field(init=False, repr=False, factory=set)
+    removed: set[str] = field(init=False, repr=False, factory=set)
+
+    def __call__(self, key: Any) -> Any:
+        if not isinstance(key, str) or self.snapshot.map.closed or self.stale(key):
+            return None
+
+        if (raw := self.snapshot.lookup(self.name, key)) is None:
+            return None
+
+        self.served.add(key)
+
+        # A failed rebuild is a miss, lookups through `Cache.get` never raise.
+        try:
+            return self.cls(self.client, self.client.json.loads(raw))  # type: ignore
+        except Exception:
+            _log.exception(f"FAILED TO LOAD {self.name} {key} FROM SNAPSHOT")
+            return None
+
+    def forget(self, key: Any) -> None:
+        self.removed.add(key)
+
+    def stale(self, key: str) -> bool:
+        """If the snapshot's entry of a key is outdated by the session."""
+        return key in self.served or key in self.removed
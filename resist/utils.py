@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Coroutine
+
+from attrs import define, field
+
+__all__ = (
+    "JSONBackend",
+    "find_json_backend",
+    "JSON",
+    "EAGER_TASKS",
+    "create_task",
+    "ulid_from_datetime",
+)
+
+
+@define(frozen=True)
+class JSONBackend:
+    """A class which represents a JSON backend.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the library backing this backend.
+
+    loads: Callable[[:class:`str` | :class:`bytes`], Any]
+        The function used to decode JSON.
+
+    dumps: Callable[[Any], :class:`str`]
+        The function used to encode JSON.
+    """
+
+    name: str = field(repr=True)
+    loads: Callable[..., Any] = field(repr=False)
+    dumps: Callable[[Any], str] = field(repr=False)
+
+
+def find_json_backend() -> JSONBackend:
+    """Finds the fastest JSON backend available.
+
+    The order of preference is `orjson`, `ujson` then the stdlib `json`.
+
+    Returns
+    -------
+    :class:`.JSONBackend`
+        The backend found.
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return JSONBackend("orjson", orjson.loads, lambda obj: orjson.dumps(obj).decode())
+
+    try:
+        import ujson  # type: ignore
+    except ImportError:
+        pass
+    else:
+        return JSONBackend("ujson", ujson.loads, ujson.dumps)  # type: ignore
+
+    dumps = functools.partial(json.dumps, separators=(",", ":"))
+    return JSONBackend("json", json.loads, dumps)
+
+
+JSON = find_json_backend()
+
+# Eager task execution was added in Python 3.12.
+EAGER_TASKS = sys.version_info >= (3, 12)
+
+
+def create_task(
+    loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, Any], eager: bool = True
+) -> asyncio.Task[Any]:
+    """Creates a task, started eagerly where the runtime supports it.
+
+    An eager task runs until its first suspension when created,
+    so a coroutine which finishes without suspending skips the scheduler entirely.
+
+    Parameters
+    ----------
+    loop: :class:`asyncio.AbstractEventLoop`
+        The loop to create the task on.
+
+    coro: Coroutine
+        The coroutine to wrap.
+
+    eager: :class:`bool`
+        If the task should be started eagerly.
+
+    Returns
+    -------
+    :class:`asyncio.Task`
+        The task created.
+    """
+    if eager and EAGER_TASKS:
+        return asyncio.Task(coro, loop=loop, eager_start=True)  # type: ignore
+
+    return loop.create_task(coro)
+
+
+# Crockford's base32, the alphabet of ULIDs.
+ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def ulid_from_datetime(when: datetime) -> str:
+    """Creates the smallest ULID of a point in time.
+
+    Revolt IDs are ULIDs, which start with their creation time in milliseconds,
+    so the ULID created can be used to bound queries by time.
+
+    .. code-block:: python
+
+        after = ulid_from_datetime(ten_minutes_ago)
+        client.caches[Message].query("author", user_id, after=after)
+
+    Parameters
+    ----------
+    when: :class:`datetime.datetime`
+        The point in time, naive datetimes are assumed to be local time.
+
+    Returns
+    -------
+    :class:`str`
+        The ULID, with its random part zeroed.
+    """
+    # Timedelta floor division is exact, unlike scaling a float timestamp.
+    elapsed = when.astimezone(timezone.utc) - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    milliseconds, encoded = elapsed // timedelta(milliseconds=1), ""
+
+    for _ in range(10):
+        milliseconds, digit = divmod(milliseconds, 32)
+        encoded = ULID_ALPHABET[digit] + encoded
+
+    return encoded + "0" * 16
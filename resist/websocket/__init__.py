@@ -1,2 +1,8 @@
+from .decoder import *
+from .dispatcher import *
 from .events import *
+from .executor import *
 from .handler import *
+from .metrics import *
+from .relay import *
+from .stream import *
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from .handler import WebSocketHandler, WSMessage
+
+
+__all__ = ("ThreadedDecoder",)
+_log = logging.getLogger(__name__)
+
+
+@define
+class ThreadedDecoder:
+    """A class which decodes frames on a dedicated thread.
+
+    Frames are queued from the event loop, decoded in order on the thread
+    and handed back to the loop in batches, where they are processed by the handler.
+
+    Parameters
+    ----------
+    handler: :class:`.WebSocketHandler`
+        The handler to decode frames for.
+
+    maxsize: :class:`int`
+        The max amount of frames queued or being decoded at a given time,
+        the reader waits for room once this is reached.
+
+    batch: :class:`int`
+        The max amount of frames handed back to the loop at once.
+    """
+
+    handler: WebSocketHandler = field(repr=False)
+    maxsize: int = field(repr=True, default=1024)
+    batch: int = field(repr=True, default=64)
+
+    loop: asyncio.AbstractEventLoop = field(init=False, repr=False)
+    frames: queue.SimpleQueue[None | WSMessage] = field(init=False, repr=False)
+    capacity: asyncio.Semaphore = field(init=False, repr=False)
+    thread: threading.Thread = field(init=False, repr=False)
+    done: asyncio.Future[None] = field(init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.frames = queue.SimpleQueue()
+        self.capacity = asyncio.Semaphore(self.maxsize)
+        self.done = self.loop.create_future()
+
+        self.thread = threading.Thread(
+            target=self.run, name="resist-decoder", daemon=True
+        )
+        self.thread.start()
+
+    async def submit(self, message: WSMessage) -> None:
+        """Queues a frame to be decoded.
+
+        Parameters
+        ----------
+        message: :class:`aiohttp.WSMessage`
+            The frame to decode.
+        """
+        await self.capacity.acquire()
+        self.frames.put(message)
+
+    async def close(self) -> None:
+        """Stops the thread once every queued frame was processed."""
+        self.frames.put(None)
+        await self.done
+
+    def run(self) -> None:
+        stopping = False
+
+        while not stopping:
+            frames = [self.frames.get()]
+
+            while len(frames) < self.batch:
+                try:
+                    frames.append(self.frames.get_nowait())
+                except queue.Empty:
+                    break
+
+            if frames[-1] is None:
+                stopping = True
+                frames.pop()
+
+            decoded: list[dict[str, Any]] = []
+
+            for frame in frames:
+                try:
+                    data = self.handler.decode(frame)  # type: ignore
+                except Exception as exc:
+                    _log.warning(f"FAILED TO DECODE FRAME {exc!r}")
+                    continue
+
+                if data is not None:
+                    decoded.append(data)
+
+            self.loop.call_soon_threadsafe(self.deliver, decoded, len(frames))
+
+        self.loop.call_soon_threadsafe(self.done.set_result, None)
+
+    def deliver(self, decoded: list[dict[str, Any]], count: int) -> None:
+        # The permits are released no matter what, or the reader ends up waiting forever.
+        try:
+            for data in decoded:
+                try:
+                    self.handler.process(data)
+                except Exception:
+                    _log.exception(f"FAILED TO PROCESS {data.get('type')}")
+        finally:
+            for _ in range(count):
+                self.capacity.release()
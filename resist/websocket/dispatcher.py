@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections import Counter, deque
+from typing import TYPE_CHECKING, Any, Literal
+
+from attrs import define, field
+
+from .events import Lane, Priority
+
+if TYPE_CHECKING:
+    from ..client import WebSocketClient
+    from .events import Event
+
+
+__all__ = ("Dispatcher",)
+
+Shedding = Literal["drop_oldest", "drop_newest", "sample"]
+
+
+@define
+class Dispatcher:
+    """A class which tracks and bounds in-flight listener tasks.
+
+    Events which cannot be dispatched because a limit was reached are queued in
+    a backlog per :class:`.Lane`. Lanes are drained in order, so control events never
+    wait behind a backlog of chat traffic. Once the backlog is full, the websocket
+    reader waits for room before pulling more frames, letting TCP flow control push
+    back on the server.
+
+    Parameters
+    ----------
+    client: :class:`.WebSocketClient`
+        The client to dispatch events from.
+
+    max_inflight: None | :class:`int`
+        The max amount of listener tasks running at a given time, across all events
+        outside of the control lane. Per-event limits are set through
+        :attr:`.Event.max_inflight`.
+
+    lane_limits: :class:`dict`
+        The max amount of listener tasks running at a given time per :class:`.Lane`.
+
+    max_backlog: :class:`int`
+        The max amount of events queued before the reader waits for room.
+
+    shed_threshold: None | :class:`int`
+        The backlog length at which events of :attr:`shed_priority` or lower
+        start getting shed, None to never shed.
+
+    shed_priority: :class:`.Priority`
+        The highest priority of events which can be shed.
+
+    shedding: :class:`str`
+        How events are shed, one of `drop_oldest`, `drop_newest` or `sample`.
+
+    sample_rate: :class:`int`
+        When sampling, 1 in every `sample_rate` events is kept.
+
+    Attributes
+    ----------
+    inflight: :class:`int`
+        The amount of listener tasks currently running.
+
+    lane_inflight: :class:`collections.Counter`
+        The amount of listener tasks currently running, per :class:`.Lane`.
+
+    backlog: :class:`dict`
+        The events waiting to be dispatched, per :class:`.Lane`.
+
+    pending: :class:`int`
+        The amount of events waiting to be dispatched, across all lanes.
+
+    shed: :class:`collections.Counter`
+        The amount of events shed, per event name.
+    """
+
+    client: WebSocketClient = field(repr=False)
+    max_inflight: None | int = field(repr=True, default=None)
+    max_backlog: int = field(kw_only=True, repr=True, default=0)
+    lane_limits: dict[Lane, None | int] = field(kw_only=True, repr=False, factory=dict)
+
+    shed_threshold: None | int = field(kw_only=True, repr=True, default=None)
+    shed_priority: Priority = field(kw_only=True, repr=False, default=Priority.LOW)
+    shedding: Shedding = field(kw_only=True, repr=True, default="drop_oldest")
+    sample_rate: int = field(kw_only=True, repr=False, default=10)
+
+    inflight: int = field(init=False, repr=True, default=0)
+    lane_inflight: Counter[Lane] = field(init=False, repr=False, factory=Counter)
+    backlog: dict[Lane, deque[tuple[Event[Any], tuple[Any, ...]]]] = field(
+        init=False, repr=False, factory=lambda: {lane: deque() for lane in Lane}
+    )
+    pending: int = field(init=False, repr=True, default=0)
+    shed: Counter[str] = field(init=False, repr=False, factory=Counter)
+    sampled: Counter[str] = field(init=False, repr=False, factory=Counter)
+
+    waiters: list[asyncio.Future[None]] = field(init=False, repr=False, factory=list)
+
+    def track(self, event: Event[Any], task: asyncio.Task[Any]) -> None:
+        """Tracks a listener task until it is done.
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event the task was dispatched from.
+
+        task: :class:`asyncio.Task`
+            The task to track.
+        """
+        self.hold(event)
+        task.add_done_callback(functools.partial(self.untrack, event))
+
+    def hold(self, event: Event[Any]) -> None:
+        """Counts a call as in-flight until :meth:`untrack` is called for it,
+        e.g a payload queued behind others by an ordered listener.
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event the call was dispatched from.
+        """
+        self.inflight += 1
+        self.lane_inflight[event.lane] += 1
+        event.inflight += 1
+
+    def untrack(self, event: Event[Any], _: Any = None) -> None:
+        self.inflight -= 1
+        self.lane_inflight[event.lane] -= 1
+        event.inflight -= 1
+
+        self.drain()
+
+    def full(self, event: None | Event[Any] = None) -> bool:
+        """Checks if a limit has been reached.
+
+        Parameters
+        ----------
+        event: None | :class:`.Event`
+            The event to also check the limit of.
+
+        Returns
+        -------
+        :class:`bool`
+            If dispatching now would go over a limit.
+        """
+        if event is None:
+            return self.max_inflight is not None and self.inflight >= self.max_inflight
+
+        if event.lane is not Lane.CONTROL and self.full():
+            return True
+
+        limit = self.lane_limits.get(event.lane)
+        if limit is not None and self.lane_inflight[event.lane] >= limit:
+            return True
+
+        if event.max_inflight is not None:
+            return event.inflight >= event.max_inflight
+
+        return False
+
+    @property
+    def backlogged(self) -> bool:
+        """If the backlog is full, and the reader should wait for room."""
+        return self.pending > self.max_backlog
+
+    def submit(self, event: Event[Any], *args: Any) -> None:
+        """Dispatches an event, or queues it if a limit was reached.
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event to dispatch.
+
+        args: Any
+            The payload to dispatch the event with.
+        """
+        backlog = self.backlog[event.lane]
+
+        if not backlog and not self.full(event):
+            event.dispatch(self.client, *args)
+            return
+
+        if self.shedding_applies(event) and not self.keep(event):
+            return
+
+        backlog.append((event, args))
+        self.pending += 1
+
+    def shedding_applies(self, event: Event[Any]) -> bool:
+        if self.shed_threshold is None or event.priority < self.shed_priority:
+            return False
+
+        return self.pending >= self.shed_threshold
+
+    def keep(self, event: Event[Any]) -> bool:
+        """Applies the shedding policy to an incoming event.
+
+        Returns
+        -------
+        :class:`bool`
+            If the incoming event should still be queued.
+        """
+        if self.shedding == "sample":
+            self.sampled[event.name] += 1
+
+            if self.sampled[event.name] % self.sample_rate == 0:
+                return True
+
+        elif self.shedding == "drop_oldest":
+            backlog = self.backlog[event.lane]
+
+            for index, (queued, _) in enumerate(backlog):
+                if queued.priority >= self.shed_priority:
+                    del backlog[index]
+                    self.pending -= 1
+                    self.shed[queued.name] += 1
+
+                    return True
+
+        self.shed[event.name] += 1
+        return False
+
+    def drain(self) -> None:
+        """Dispatches queued events while there is room, lane by lane."""
+        for backlog in self.backlog.values():
+            while backlog and not self.full(backlog[0][0]):
+                event, args = backlog.popleft()
+                self.pending -= 1
+
+                event.dispatch(self.client, *args)
+
+        if self.waiters and not self.backlogged:
+            waiters, self.waiters = self.waiters, []
+
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def wait(self) -> None:
+        """Waits until the backlog has room."""
+        loop = asyncio.get_running_loop()
+
+        while self.backlogged:
+            waiter = loop.create_future()
+            self.waiters.append(waiter)
+
+            await waiter
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
 import asyncio
+import enum
+import functools
+import inspect
 import logging
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, TypeVar
+from collections import deque
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterator, Literal, TypeVar
 
 from attrs import define, field
 
+from ..utils import create_task
+from .executor import ListenerExecutor
+
 if TYPE_CHECKING:
     from ..client import WebSocketClient
+    from .metrics import ListenerStats
+    from .stream import EventStream
 
     Callback = Callable[..., Any]
 
-__all__ = ("EVENT_MAPPING", "Events", "Event", "Listener", "Collector")
+__all__ = (
+    "EVENT_MAPPING",
+    "Events",
+    "Event",
+    "EventRegistry",
+    "Listener",
+    "Collector",
+    "Subscription",
+    "Subscribers",
+    "Priority",
+    "Lane",
+)
 _log = logging.getLogger(__name__)
 
 Check = Callable[..., bool]
+T = TypeVar("T")
 NameT = TypeVar(
     "NameT",
     bound=Literal[
@@ -49,8 +70,71 @@ NameT = TypeVar(
 
 EVENT_MAPPING: dict[str, Event[Any]] = {}
 
+# The order filter keys are preferred in when picking the key to index a listener by.
+INDEXED_KEYS = ("channel", "author", "server")
 
-@define
+
+def seconds(timeout: None | float | timedelta) -> None | float:
+    """Converts a timeout to seconds."""
+    if isinstance(timeout, timedelta):
+        return timeout.total_seconds()
+
+    return timeout
+
+
+def lookup(args: tuple[Any, ...], key: str) -> Any:
+    """Looks up a key on the first argument of a payload,
+    be it a raw payload or a model.
+    """
+    if not args:
+        return None
+
+    if isinstance(payload := args[0], dict):
+        return payload.get(key)  # type: ignore
+
+    return getattr(payload, key, None)
+
+
+def hashable(value: Any) -> bool:
+    """Whether a value can be used as a dict key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    return True
+
+
+def index_key(filters: dict[str, Any]) -> str:
+    """Picks the key a listener with the given filters is indexed by."""
+    for key in INDEXED_KEYS:
+        if key in filters:
+            return key
+
+    return min(filters)
+
+
+class Priority(enum.IntEnum):
+    """The priority class of an event, used when shedding load.
+    Lower values are more important.
+    """
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class Lane(enum.IntEnum):
+    """The dispatch lane of an event.
+    Lanes are drained in order, each with its own concurrency budget.
+    """
+
+    CONTROL = 0
+    HIGH = 1
+    BULK = 2
+
+
+@define(eq=False)
 class Listener:
     """A class which represents an event listener.
 
@@ -61,23 +145,179 @@ class Listener:
 
     callback: Callable[..., :class:`bool`]
         The callback of the listener.
+        Plain functions are called inline when dispatching, coroutine functions
+        are wrapped in a task.
 
     check: Callable[..., :class:`bool`]
         The check to run before dispatching.
+
+    filters: :class:`dict`
+        Key filters the payload has to match, e.g `{"channel": "..."}`.
+        Listeners with filters are routed to through an index instead of being checked.
+
+    ordered_by: None | :class:`str`
+        The payload key to serialize calls by, e.g `channel`.
+        Calls for the same key run one after another in dispatch order,
+        calls for different keys run concurrently.
+
+    executor: None | :class:`.ListenerExecutor`
+        The executor to run the callback on, off the event loop.
+        The callback has to be a plain function.
+
+    Attributes
+    ----------
+    inline: :class:`bool`
+        If the callback is a plain function, called inline when dispatching.
+
+    queues: :class:`dict`
+        The payloads waiting to be handled, per key of :attr:`ordered_by`.
+        A key is removed once its queue is drained.
+
+    stats: None | :class:`.ListenerStats`
+        The metrics of the listener, None unless metrics are enabled.
+
+    subscriptions: :class:`list`
+        The handles of the listener's active subscriptions, one per event.
     """
 
     once: bool = field(repr=True)
     callback: Callback = field(repr=False)
     check: Check = field(repr=False)
+    filters: dict[str, Any] = field(kw_only=True, repr=True, factory=dict)
+    ordered_by: None | str = field(kw_only=True, repr=True, default=None)
+    executor: None | ListenerExecutor = field(kw_only=True, repr=False, default=None)
+
+    inline: bool = field(init=False, repr=True)
+    queues: dict[Any, deque[tuple[Any, ...]]] = field(
+        init=False, repr=False, factory=dict
+    )
+    stats: None | ListenerStats = field(init=False, repr=False, default=None)
+    subscriptions: list[Subscription] = field(init=False, repr=False, factory=list)
+
+    def __attrs_post_init__(self) -> None:
+        coroutine = asyncio.iscoroutinefunction(self.callback)
+
+        if self.executor is not None and coroutine:
+            raise TypeError("Executor callbacks have to be plain functions.") from None
+
+        self.inline = self.executor is None and not coroutine
 
     async def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        return await self.callback(*args, **kwargs)
+        if self.stats is not None:
+            return await self.stats.measure(self.invoke(*args, **kwargs))
 
+        return await self.invoke(*args, **kwargs)
 
-@define
+    async def invoke(self, *args: Any, **kwargs: Any) -> Any:
+        if self.executor is not None:
+            return await self.executor.run(self.callback, *args, **kwargs)
+
+        result = self.callback(*args, **kwargs)
+
+        if inspect.isawaitable(result):
+            return await result
+
+        return result
+
+    def enqueue(self, args: tuple[Any, ...]) -> tuple[Any, bool]:
+        """Queues a payload behind the others with the same key.
+
+        Parameters
+        ----------
+        args: :class:`tuple`
+            The payload to queue.
+
+        Returns
+        -------
+        :class:`tuple`
+            The key of the payload, which may be None if the payload lacks it,
+            and whether its queue was idle and needs draining.
+
+        Raises
+        ------
+        :exc:`TypeError`
+            Raised when the key of the payload is unhashable.
+        """
+        key = lookup(args, self.ordered_by)  # type: ignore
+
+        if not hashable(key):
+            raise TypeError(
+                f"Cannot order by {self.ordered_by}, {type(key).__name__} is unhashable"
+            ) from None
+
+        if (queue := self.queues.get(key)) is not None:
+            queue.append(args)
+            return key, False
+
+        self.queues[key] = deque([args])
+        return key, True
+
+    async def drain(self, key: Any, done: Callable[[], Any] = lambda: None) -> None:
+        """Handles the queued payloads of a key in order, then drops its queue.
+
+        Parameters
+        ----------
+        key: Any
+            The key to drain the queue of.
+
+        done: Callable[[], Any]
+            Called once per payload handled, or dropped if draining is cancelled.
+        """
+        queue = self.queues[key]
+
+        try:
+            while queue:
+                try:
+                    await self(*queue[0])
+                except Exception:
+                    _log.exception(f"LISTENER FAILED {self.ordered_by}={key}")
+
+                queue.popleft()
+                done()
+        finally:
+            self.release(key, queue, done)
+
+    def release(
+        self,
+        key: Any,
+        queue: deque[tuple[Any, ...]],
+        done: Callable[[], Any],
+        _: Any = None,
+    ) -> None:
+        """Drops the queue of a key, calling `done` for every payload left in it.
+        This is also the done-callback of drain tasks, as a task cancelled before
+        it starts never runs the cleanup of :meth:`drain`.
+
+        Parameters
+        ----------
+        key: Any
+            The key of the queue.
+
+        queue: :class:`collections.deque`
+            The queue to drop.
+
+        done: Callable[[], Any]
+            Called once per payload dropped.
+        """
+        if self.queues.get(key) is queue:
+            del self.queues[key]
+
+        # The queue is detached before releasing, as a release may dispatch
+        # a payload of the same key which then starts a queue of its own.
+        count = len(queue)
+        queue.clear()
+
+        for _ in range(count):
+            done()
+
+
+@define(eq=False)
 class Collector:
     """A class which represents an event collector.
 
+    A collector batches events and calls its callback with each batch.
+    Timings use the loop's monotonic clock.
+
     Parameters
     ----------
     once: :class:`bool`
@@ -88,40 +328,225 @@ class Collector:
 
     check: Callable[..., :class:`bool`]
         The check to run before dispatching.
+
+    filters: :class:`dict`
+        Key filters the payload has to match, e.g `{"channel": "..."}`.
+
+    amount: None | :class:`int`
+        The size of a batch. With a tumbling window the batch is flushed once full,
+        with a sliding window this is the max size of the window.
+
+    timeout: None | :class:`float` | :class:`datetime.timedelta`
+        The length of the window in seconds.
+        With a tumbling window a timer flushes the partial batch once the window,
+        opened by the first event of the batch, expires.
+
+    window: :class:`str`
+        Either `tumbling`, batches are flushed on size or time, whichever is first,
+        like a log batcher. Or `sliding`, the callback is called on every event with
+        the events of the last `timeout` seconds, up to `amount` of them.
+
+    Attributes
+    ----------
+    stats: None | :class:`.ListenerStats`
+        The metrics of the collector's batches, None unless metrics are enabled.
+
+    subscriptions: :class:`list`
+        The handles of the collector's active subscriptions, one per event.
     """
 
     once: bool = field(repr=True)
     callback: Callback = field(repr=False)
     check: Check = field(repr=False)
+    filters: dict[str, Any] = field(kw_only=True, repr=True, factory=dict)
+
+    stats: None | ListenerStats = field(init=False, repr=False, default=None)
+    subscriptions: list[Subscription] = field(init=False, repr=False, factory=list)
 
-    amount: int = field(repr=True)
-    timeout: timedelta = field(repr=True)
+    amount: None | int = field(repr=True, default=None)
+    timeout: None | float = field(repr=True, default=None, converter=seconds)
+    window: Literal["tumbling", "sliding"] = field(repr=True, default="tumbling")
 
-    queue: asyncio.Queue[Any] = field(init=False, repr=False)
-    first: datetime = field(init=False, repr=True)
-    recent: datetime = field(init=False, repr=True)
+    items: deque[tuple[float, tuple[Any, ...]]] = field(init=False, repr=False)
+    timer: None | asyncio.TimerHandle = field(init=False, repr=False, default=None)
+    flushes: set[asyncio.Task[Any]] = field(init=False, repr=False, factory=set)
 
     def __attrs_post_init__(self) -> None:
-        self.queue = asyncio.Queue[Any](maxsize=self.amount)
+        if self.amount is None and self.timeout is None:
+            raise ValueError("A collector needs an amount, a timeout or both.")
+
+        self.items = deque(maxlen=self.amount if self.window == "sliding" else None)
 
     async def __call__(self, *args: Any, **_: Any) -> Any:
-        if not hasattr(self, "first"):
-            self.first = datetime.utcnow()
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        if self.window == "sliding":
+            self.expire(now)
+            self.items.append((now, args))
 
-        self.recent = datetime.utcnow()
-        if not (self.recent - self.first) <= self.timeout:
+            return await self.emit([item for _, item in self.items])
 
-            while not self.queue.empty():
-                self.queue.get_nowait()
+        self.items.append((now, args))
 
+        if len(self.items) == 1 and self.timeout is not None:
+            self.timer = loop.call_at(now + self.timeout, self.expired)
+
+        if self.amount is not None and len(self.items) >= self.amount:
+            await self.flush()
+
+    def expire(self, now: float) -> None:
+        """Drops the items which fell out of a sliding window."""
+        if self.timeout is None:
             return
 
-        await self.queue.put(args)
-        self.queue.task_done()
+        while self.items and self.items[0][0] <= now - self.timeout:
+            self.items.popleft()
+
+    def expired(self) -> None:
+        self.timer = None
+
+        if self.items:
+            task = asyncio.get_running_loop().create_task(self.flush())
+
+            self.flushes.add(task)
+            task.add_done_callback(self.flushed)
+
+    def flushed(self, task: asyncio.Task[Any]) -> None:
+        """Drops a finished timer flush, logging its failure as nothing awaits it."""
+        self.flushes.discard(task)
+
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _log.error("COLLECTOR FLUSH FAILED", exc_info=exc)
+
+    async def flush(self) -> Any:
+        """Flushes the current batch to the callback, even if it is partial.
+
+        Returns
+        -------
+        Any
+            The return value of the callback, None if the batch was empty.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        items = [item for _, item in self.items]
+        self.items.clear()
+
+        if items:
+            return await self.emit(items)
+
+    async def emit(self, items: list[tuple[Any, ...]]) -> Any:
+        if self.stats is not None:
+            return await self.stats.measure(self.invoke(items))
+
+        return await self.invoke(items)
+
+    async def invoke(self, items: list[tuple[Any, ...]]) -> Any:
+        result = self.callback(*list(zip(*items)))
+
+        if inspect.isawaitable(result):
+            return await result
+
+        return result
+
+
+@define(eq=False)
+class Subscribers(Generic[T]):
+    """An ordered set of the listeners or collectors subscribed to an event,
+    with the interface of a :class:`list`.
+
+    Membership tests, appending and removal take constant time,
+    indexing takes linear time.
+    """
+
+    items: dict[T, None] = field(init=False, repr=False, factory=dict)
+
+    def __repr__(self) -> str:
+        return f"Subscribers({list(self.items)!r})"
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self.items
+
+    def __getitem__(self, index: Any) -> Any:
+        return list(self.items)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Subscribers):
+            return list(self.items) == list(other.items)
+
+        return isinstance(other, list) and list(self.items) == other
+
+    def append(self, item: T) -> None:
+        self.items[item] = None
+
+    def remove(self, item: T) -> None:
+        """Removes an item, raising :exc:`ValueError` if it is missing like a list."""
+        if item not in self.items:
+            raise ValueError(f"{item!r} is not subscribed") from None
+
+        del self.items[item]
+
+    def discard(self, item: T) -> None:
+        self.items.pop(item, None)
+
+    def pop(self, index: int = -1) -> T:
+        if index == -1 and self.items:
+            return self.items.popitem()[0]
+
+        item = list(self.items)[index]
+        del self.items[item]
+
+        return item
+
+    def clear(self) -> None:
+        self.items.clear()
+
+    def copy(self) -> list[T]:
+        return list(self.items)
+
+
+@define(eq=False)
+class Subscription:
+    """A handle to a subscription, returned by :meth:`.Event.subscribe`.
+
+    Attributes
+    ----------
+    event: :class:`.Event`
+        The event subscribed to.
+
+    listener: :class:`.Listener` | :class:`.Collector`
+        The subscribed listener or collector.
+    """
+
+    event: Event[Any] = field(repr=True)
+    listener: Listener | Collector = field(repr=True)
+
+    @property
+    def active(self) -> bool:
+        """If the subscription has not been cancelled yet."""
+        return self in self.listener.subscriptions
+
+    def cancel(self) -> bool:
+        """Cancels the subscription in constant time.
+
+        Returns
+        -------
+        :class:`bool`
+            If the subscription was still active.
+        """
+        if not self.active:
+            return False
 
-        if self.queue.full():
-            items = [self.queue.get_nowait() for _ in range(self.amount)]
-            await self.callback(*list(zip(*items)))
+        self.event.unsubscribe(self.listener)
+        return True
 
 
 @define
@@ -136,25 +561,93 @@ class Event(Generic[NameT]):
     name: :class:`str`
         The name of the event.
 
-    listeners: :class:`list`
-        A list of :class:`.Listener` subscribed to the event.
+    listeners: :class:`.Subscribers`
+        The :class:`.Listener` subscribed to the event, in subscription order.
+
+    collectors: :class:`.Subscribers`
+        The :class:`.Collector` subscribed to the event, in subscription order.
+
+    indexes: :class:`dict`
+        Listeners and collectors with key filters, indexed by key then value.
+
+    waiters: :class:`dict`
+        Futures waiting for the event, mapped to their check.
+        These are resolved inline when dispatching, without creating tasks.
+
+    streams: :class:`dict`
+        The :class:`.EventStream` fed by the event, fed inline when dispatching.
+
+    priority: :class:`.Priority`
+        The priority class of the event, low priority events are shed first.
+
+    lane: :class:`.Lane`
+        The dispatch lane of the event.
+
+    max_inflight: None | :class:`int`
+        The max amount of listener tasks of this event running at a given time.
+
+    inflight: :class:`int`
+        The amount of listener tasks of this event currently running.
 
-    collectors: :class:`list`
-        A list of :class:`.Collector` subscribed to the event.
+    register: :class:`bool`
+        If the event should be registered in :data:`EVENT_MAPPING`,
+        copies owned by an :class:`.EventRegistry` are not.
     """
 
     name: NameT = field(repr=True)
-
-    listeners: list[Listener] = field(init=False, repr=False)
-    collectors: list[Collector] = field(init=False, repr=False)
+    priority: Priority = field(kw_only=True, repr=False, default=Priority.NORMAL)
+    lane: Lane = field(kw_only=True, repr=False, default=Lane.HIGH)
+    max_inflight: None | int = field(kw_only=True, repr=False, default=None)
+    register: bool = field(kw_only=True, repr=False, default=True)
+    inflight: int = field(init=False, repr=False, default=0)
+
+    # Index buckets are dicts used as ordered sets, for constant time removal.
+    listeners: Subscribers[Listener] = field(init=False, repr=False)
+    collectors: Subscribers[Collector] = field(init=False, repr=False)
+    indexes: dict[str, dict[Any, dict[Listener | Collector, None]]] = field(
+        init=False, repr=False
+    )
+    waiters: dict[asyncio.Future[Any], Check] = field(init=False, repr=False)
+    streams: dict[EventStream, None] = field(init=False, repr=False)
 
     def __attrs_post_init__(self) -> None:
-        self.listeners = []
-        self.collectors = []
+        self.listeners = Subscribers()
+        self.collectors = Subscribers()
+        self.indexes = {}
+        self.waiters = {}
+        self.streams = {}
+
+        if self.register:
+            EVENT_MAPPING[self.name] = self
 
-        EVENT_MAPPING[self.name] = self
+    def copy(self) -> Event[NameT]:
+        """Creates an unregistered copy of the event, without its subscriptions.
 
-    def subscribe(self, listener: Listener | Collector) -> None:
+        Returns
+        -------
+        :class:`.Event`
+            The copy of the event.
+        """
+        return Event(
+            self.name,
+            priority=self.priority,
+            lane=self.lane,
+            max_inflight=self.max_inflight,
+            register=False,
+        )
+
+    @property
+    def subscribed(self) -> bool:
+        """Whether anything is subscribed to the event."""
+        return bool(
+            self.listeners
+            or self.collectors
+            or self.indexes
+            or self.waiters
+            or self.streams
+        )
+
+    def subscribe(self, listener: Listener | Collector) -> Subscription:
         """Subscribes a :class:`.Listener` or a :class:`.Collector`
         To the event this method is being called from.
 
@@ -163,25 +656,168 @@ class Event(Generic[NameT]):
         listener: :class:`.Listener` | :class:`.Collector`
             The listener or collector to subscribe to this event.
 
+        Returns
+        -------
+        :class:`.Subscription`
+            The handle of the subscription, used to cancel it.
+
         Raises
         ------
         :exc:`TypeError`
             Raised when receiving a listener that is not a type of
-            :class:`.Listener` or :class:`.Collector`.
+            :class:`.Listener` or :class:`.Collector`,
+            or whose indexed filter is unhashable.
+        """
+        if not isinstance(listener, (Listener, Collector)):
+            raise TypeError(f"Unknown listener type {type(listener)}") from None
+
+        for subscription in listener.subscriptions:
+            if subscription.event is self:
+                return subscription
+
+        if listener.filters:
+            self.index(listener)[listener] = None
+        elif isinstance(listener, Listener):
+            self.listeners.append(listener)
+        else:
+            self.collectors.append(listener)
+
+        subscription = Subscription(self, listener)
+        listener.subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, listener: Listener | Collector) -> None:
+        """Unsubscribes a :class:`.Listener` or a :class:`.Collector`
+        from the event this method is being called from.
+
+        Parameters
+        ----------
+        listener: :class:`.Listener` | :class:`.Collector`
+            The listener or collector to unsubscribe.
         """
+        listener.subscriptions = [
+            subscription
+            for subscription in listener.subscriptions
+            if subscription.event is not self
+        ]
+
+        # Metrics are kept as long as the listener is subscribed to another event.
+        if listener.stats is not None and not listener.subscriptions:
+            listener.stats.metrics.forget(listener)
+
+        if listener.filters:
+            return self.unindex(listener)
+
         if isinstance(listener, Listener):
-            if not asyncio.iscoroutinefunction(listener.callback):
-                raise TypeError("Callback has to be a coroutine function.") from None
+            self.listeners.discard(listener)
+        else:
+            self.collectors.discard(listener)
+
+    def index(self, listener: Listener | Collector) -> dict[Listener | Collector, None]:
+        """Finds or creates the index bucket of a listener with key filters.
+
+        Parameters
+        ----------
+        listener: :class:`.Listener` | :class:`.Collector`
+            The listener to find the bucket of.
+
+        Returns
+        -------
+        :class:`dict`
+            The bucket of the listener.
+
+        Raises
+        ------
+        :exc:`TypeError`
+            Raised when the filter the listener is indexed by is unhashable.
+        """
+        key = index_key(listener.filters)
+
+        if not hashable(value := listener.filters[key]):
+            raise TypeError(
+                f"Filter {key} has to be hashable, got {type(value).__name__}"
+            ) from None
+
+        return self.indexes.setdefault(key, {}).setdefault(value, {})
+
+    def unindex(self, listener: Listener | Collector) -> None:
+        """Removes a listener with key filters from its index bucket.
+
+        Parameters
+        ----------
+        listener: :class:`.Listener` | :class:`.Collector`
+            The listener to remove.
+        """
+        key = index_key(listener.filters)
+
+        if (index := self.indexes.get(key)) is None:
+            return
+
+        if (bucket := index.get(listener.filters[key])) is None:
+            return
+
+        bucket.pop(listener, None)
+
+        if not bucket:
+            del index[listener.filters[key]]
+
+        if not index:
+            del self.indexes[key]
 
-            return self.listeners.append(listener)
+    def route(self, args: tuple[Any, ...]) -> list[Listener | Collector]:
+        """Finds the indexed listeners whose key filters match a payload.
 
-        elif isinstance(listener, Collector):
-            if not asyncio.iscoroutinefunction(listener.callback):
-                raise TypeError("Callback has to be a coroutine function.") from None
+        Parameters
+        ----------
+        args: :class:`tuple`
+            The payload to route.
 
-            return self.collectors.append(listener)
+        Returns
+        -------
+        :class:`list`
+            The listeners matching the payload.
+        """
+        routed: list[Listener | Collector] = []
+
+        for key, index in self.indexes.items():
+            try:
+                bucket = index.get(lookup(args, key))
+            except TypeError:
+                # Filters are hashable, so an unhashable value cannot match any of them.
+                continue
 
-        raise TypeError(f"Unknown listener type {type(listener)}") from None
+            if not bucket:
+                continue
+
+            for listener in bucket:
+                if all(lookup(args, k) == v for k, v in listener.filters.items()):
+                    routed.append(listener)
+
+        return routed
+
+    def resolve(self, args: tuple[Any, ...]) -> None:
+        """Resolves the waiters whose check passes for a payload.
+
+        Parameters
+        ----------
+        args: :class:`tuple`
+            The payload to resolve the waiters with.
+        """
+        for future, check in list(self.waiters.items()):
+            if future.done():
+                del self.waiters[future]
+                continue
+
+            try:
+                if not check(*args):
+                    continue
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(args[0] if len(args) == 1 else args)
+
+            del self.waiters[future]
 
     def dispatch(self, client: WebSocketClient, *args: Any) -> list[asyncio.Task[Any]]:
         """Dispatches the event.
@@ -200,27 +836,75 @@ class Event(Generic[NameT]):
             A list of :class:`asyncio.Task` created from dispatching.
         """
         tasks: list[asyncio.Task[Any]] = []
+        routed = self.route(args) if self.indexes else []
 
-        listeners = self.listeners[:]
-        collectors = self.collectors[:]
+        if self.waiters:
+            self.resolve(args)
 
-        for index, listener in enumerate(listeners):
-            if not listener.check(*args):
-                continue
+        for stream in list(self.streams):
+            stream.feed(args)
 
-            if listener.once is True:
-                self.listeners.pop(index)
+        for listeners in (list(self.listeners), list(self.collectors), routed):
+            for listener in listeners:
+                if not listener.check(*args):
+                    continue
 
-            tasks.append(client.loop.create_task(listener(*args)))
+                if listener.once is True:
+                    self.unsubscribe(listener)
 
-        for index, collector in enumerate(collectors):
-            if not collector.check(*args):
-                continue
+                if isinstance(listener, Listener) and listener.inline:
+                    call = listener.stats and listener.stats.begin(inline=True)
+
+                    try:
+                        result = listener.callback(*args)
+                    except Exception:
+                        if call:
+                            call.failed = True
+
+                        _log.exception(f"LISTENER FAILED {self.name}")
+                        continue
+                    finally:
+                        if call:
+                            call.end()
+
+                    # Callables wrapping a coroutine function still get a task.
+                    if not asyncio.iscoroutine(result):
+                        continue
+
+                    coro = result
+                elif isinstance(listener, Listener) and listener.ordered_by is not None:
+                    # Queued payloads count as in-flight, so ordered listeners are
+                    # bound by the dispatcher's limits like any other.
+                    try:
+                        key, idle = listener.enqueue(args)
+                    except TypeError:
+                        _log.exception(f"LISTENER FAILED {self.name}")
+                        continue
 
-            if collector.once is True:
-                self.collectors.pop(index)
+                    client.dispatcher.hold(self)
 
-            tasks.append(client.loop.create_task(collector(*args)))
+                    if not idle:
+                        continue
+
+                    done = functools.partial(client.dispatcher.untrack, self)
+                    release = functools.partial(
+                        listener.release, key, listener.queues[key], done
+                    )
+
+                    task = create_task(
+                        client.loop, listener.drain(key, done), client.eager
+                    )
+                    task.add_done_callback(release)
+
+                    tasks.append(task)
+                    continue
+                else:
+                    coro = listener(*args)
+
+                task = create_task(client.loop, coro, client.eager)
+                client.dispatcher.track(self, task)
+
+                tasks.append(task)
 
         _log.debug(f"DISPATCHED {self.name}")
         return tasks
@@ -234,16 +918,21 @@ class Events:
     E.g `ServerMemberUpdate` => `SERVER_MEMBER_UPDATE`
 
     For all events see https://developers.revolt.chat/websockets/events
+
+    .. note::
+
+        These events are templates, every client dispatches its own copies of them
+        through :attr:`.WebSocketClient.events`.
     """
 
-    ERROR = Event("Error")
-    AUTHENTICATED = Event("Authenticated")
-    PONG = Event("Pong")
-    READY = Event("Ready")
+    ERROR = Event("Error", priority=Priority.HIGH, lane=Lane.CONTROL)
+    AUTHENTICATED = Event("Authenticated", priority=Priority.HIGH, lane=Lane.CONTROL)
+    PONG = Event("Pong", priority=Priority.HIGH, lane=Lane.CONTROL)
+    READY = Event("Ready", priority=Priority.HIGH, lane=Lane.CONTROL)
 
-    MESSAGE = Event("Message")
-    MESSAGE_UPDATE = Event("MessageUpdate")
-    MESSAGE_DELETE = Event("MessageDelete")
+    MESSAGE = Event("Message", lane=Lane.BULK)
+    MESSAGE_UPDATE = Event("MessageUpdate", lane=Lane.BULK)
+    MESSAGE_DELETE = Event("MessageDelete", lane=Lane.BULK)
 
     CHANNEL_CREATE = Event("ChannelCreate")
     CHANNEL_UPDATE = Event("ChannelUpdate")
@@ -252,9 +941,13 @@ class Events:
     CHANNEL_GROUP_JOIN = Event("ChannelGroupJoin")
     CHANNEL_GROUP_LEAVE = Event("ChannelGroupLeave")
 
-    CHANNEL_START_TYPING = Event("ChannelStartTyping")
-    CHANNEL_STOP_TYPING = Event("ChannelStopTyping")
-    CHANNEL_ACK = Event("ChannelAck")
+    CHANNEL_START_TYPING = Event(
+        "ChannelStartTyping", priority=Priority.LOW, lane=Lane.BULK
+    )
+    CHANNEL_STOP_TYPING = Event(
+        "ChannelStopTyping", priority=Priority.LOW, lane=Lane.BULK
+    )
+    CHANNEL_ACK = Event("ChannelAck", priority=Priority.LOW, lane=Lane.BULK)
 
     SERVER_UPDATE = Event("ServerUpdate")
     SERVER_DELETE = Event("ServerDelete")
@@ -268,3 +961,76 @@ class Events:
 
     USER_UPDATE = Event("UserUpdate")
     USER_RELATIONSHIP = Event("UserRelationship")
+
+
+@define
+class EventRegistry:
+    """A class which holds the events of a single client,
+    so clients sharing a process never share listeners.
+
+    Events are copied from their template in :data:`EVENT_MAPPING` the first time
+    they are resolved, so a client only pays for the events it uses.
+
+    .. code-block:: python
+
+        client.events.MESSAGE  # the client's own copy of `Events.MESSAGE`
+
+    Attributes
+    ----------
+    events: :class:`dict`
+        The events of the registry, mapped by name.
+    """
+
+    events: dict[str, Event[Any]] = field(init=False, repr=False, factory=dict)
+
+    def __getattr__(self, name: str) -> Event[Any]:
+        if not isinstance(template := getattr(Events, name, None), Event):
+            raise AttributeError(name) from None
+
+        return self.resolve(template)
+
+    def __getitem__(self, name: str) -> Event[Any]:
+        return self.events[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.events
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def get(self, name: str) -> None | Event[Any]:
+        """Grabs an event of the registry, without creating it.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the event.
+
+        Returns
+        -------
+        None | :class:`.Event`
+            The event, None if it was never resolved.
+        """
+        return self.events.get(name)
+
+    def resolve(self, event: Event[Any]) -> Event[Any]:
+        """Resolves an event to the registry's own copy, creating it if needed.
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event to resolve, usually a template from :class:`.Events`.
+
+        Returns
+        -------
+        :class:`.Event`
+            The registry's own event with the same name.
+        """
+        if (own := self.events.get(event.name)) is None:
+            own = self.events[event.name] = event.copy()
+
+        return own
+
+    def values(self) -> list[Event[Any]]:
+        """The events of the registry."""
+        return list(self.events.values())
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable
+
+from attrs import define, field
+
+__all__ = ("ListenerExecutor",)
+_log = logging.getLogger(__name__)
+
+
+def invoke(module: str, qualname: str, *args: Any, **kwargs: Any) -> Any:
+    """Looks a callback up by name and calls it, in a worker process.
+
+    Decorating a function with :meth:`.WebSocketClient.on` replaces it with its
+    :class:`.Listener`, so the function itself cannot be pickled by reference.
+    """
+    target: Any = importlib.import_module(module)
+
+    for name in qualname.split("."):
+        target = getattr(target, name)
+
+    # Checked by name to avoid importing the events module in every worker.
+    if type(target).__name__ == "Listener":
+        target = target.callback
+
+    return target(*args, **kwargs)
+
+
+@define(eq=False)
+class ListenerExecutor:
+    """A class which runs listeners on an executor, off the event loop,
+    tracking how deep its queue gets.
+
+    Parameters
+    ----------
+    executor: :class:`concurrent.futures.Executor`
+        The executor to run listeners on.
+
+    owned: :class:`bool`
+        If the executor was created by the client, and is shut down with it.
+
+    Attributes
+    ----------
+    depth: :class:`int`
+        The amount of calls submitted and not finished yet.
+
+    peak: :class:`int`
+        The highest :attr:`depth` reached.
+
+    completed: :class:`int`
+        The amount of calls which returned.
+
+    failed: :class:`int`
+        The amount of calls which raised.
+
+    busy: :class:`float`
+        The total time in seconds calls spent submitted, queueing included.
+    """
+
+    executor: Executor = field(repr=True)
+    owned: bool = field(kw_only=True, repr=False, default=False)
+
+    depth: int = field(init=False, repr=True, default=0)
+    peak: int = field(init=False, repr=True, default=0)
+    completed: int = field(init=False, repr=False, default=0)
+    failed: int = field(init=False, repr=False, default=0)
+    busy: float = field(init=False, repr=False, default=0.0)
+
+    @property
+    def process(self) -> bool:
+        """If calls run in other processes, and have to be pickled."""
+        return isinstance(self.executor, ProcessPoolExecutor)
+
+    async def run(self, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs a callback on the executor.
+
+        Parameters
+        ----------
+        callback: Callable[..., Any]
+            The callback to run, it has to be importable by name
+            when running on a process pool.
+
+        args: Any
+            The arguments to call the callback with, pickled on a process pool.
+
+        Returns
+        -------
+        Any
+            The value the callback returned.
+        """
+        if self.process:
+            call = functools.partial(
+                invoke, callback.__module__, callback.__qualname__, *args, **kwargs
+            )
+        else:
+            call = functools.partial(callback, *args, **kwargs)
+
+        self.depth += 1
+        self.peak = max(self.peak, self.depth)
+        start = time.perf_counter()
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, call)
+        except BaseException:
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+            return result
+        finally:
+            self.depth -= 1
+            self.busy += time.perf_counter() - start
+
+    def shutdown(self) -> None:
+        """Shuts the executor down if it is owned, without waiting for it."""
+        if self.owned:
+            self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import re
+import time
+from collections import Counter, deque
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple, cast
 
 import aiohttp
 from attrs import define, field
 
+from ..models import Cache
 from ..types import Auth
-from .events import EVENT_MAPPING
+from .decoder import ThreadedDecoder
+from .events import EVENT_MAPPING, Lane
 
 if TYPE_CHECKING:
     from ..client import WebSocketClient
@@ -17,9 +24,17 @@ if TYPE_CHECKING:
 __all__ = ("WebSocketHandler",)
 _log = logging.getLogger(__name__)
 
+# Revolt serialises the event tag first, so the type can be read off the head.
+TEXT_TYPE = re.compile(r'\s*\{\s*"type"\s*:\s*"(\w+)"')
+BINARY_TYPE = b"\xa4type"
+
+# Events the handler consumes itself, these are never skipped.
+INTERNAL = frozenset({"Ready", "Pong"})
+
 
 class WSMessage(NamedTuple):
     type: aiohttp.WSMsgType
+    data: Any
     json: Callable[..., dict[Any, Any]]
 
 
@@ -32,6 +47,48 @@ class WebSocketHandler:
     ----------
     client: :class:`.WebSocketClient`
         The client being used for the connection.
+
+    Attributes
+    ----------
+    skipped: :class:`collections.Counter`
+        The amount of frames dropped without decoding, per event type,
+        because nothing was subscribed to the event.
+
+    backoff_base: :class:`float`
+        The base delay in seconds between reconnect attempts.
+
+    backoff_max: :class:`float`
+        The max delay in seconds between reconnect attempts.
+
+    fill_concurrency: :class:`int`
+        The max amount of channels fetched at once when filling gaps.
+
+    heartbeat_interval: :class:`float`
+        The interval in seconds between `Ping` frames.
+
+    max_missed: :class:`int`
+        The amount of unanswered `Ping` frames after which the connection is
+        considered dead and gets closed. Pongs are not counted as missed while
+        the reader waits for room in the dispatcher, as they are queued behind
+        the frames not read yet.
+
+    paused: :class:`bool`
+        If the reader is waiting for room in the dispatcher or the relay.
+
+    latencies: :class:`collections.deque`
+        The most recent gateway round trip times, in seconds.
+
+    closed: :class:`bool`
+        If the handler was closed, a closed handler does not reconnect.
+
+    reconnects: :class:`int`
+        The amount of times the handler has reconnected.
+
+    last_seen: :class:`dict`
+        The last message ID seen per channel, used to fill gaps after reconnecting.
+
+    seen: :class:`.Cache`
+        Recently dispatched message IDs, used to deduplicate replayed messages.
     """
 
     client: WebSocketClient = field(repr=False)
@@ -39,30 +96,386 @@ class WebSocketHandler:
     sock: aiohttp.ClientWebSocketResponse = field(init=False, repr=False)
 
     events: dict[str, str] = field(init=False, repr=False)
+    packb: Callable[[Any], bytes] = field(init=False, repr=False)
+    unpackb: Callable[[bytes], Any] = field(init=False, repr=False)
+
+    skipped: Counter[str] = field(init=False, repr=False, factory=Counter)
+
+    backoff_base: float = field(init=False, repr=False, default=1.0)
+    backoff_max: float = field(init=False, repr=False, default=60.0)
+    fill_concurrency: int = field(init=False, repr=False, default=5)
+    fill_limit: int = field(init=False, repr=False, default=100)
+
+    heartbeat_interval: float = field(init=False, repr=False, default=10.0)
+    max_missed: int = field(init=False, repr=False, default=2)
+    pings: dict[int, float] = field(init=False, repr=False, factory=dict)
+    paused: bool = field(init=False, repr=False, default=False)
+    stalled: bool = field(init=False, repr=False, default=False)
+    latencies: deque[float] = field(
+        init=False, repr=False, factory=lambda: deque[float](maxlen=100)
+    )
+
+    closed: bool = field(init=False, repr=True, default=False)
+    attempts: int = field(init=False, repr=False, default=0)
+    reconnects: int = field(init=False, repr=True, default=0)
+    last_seen: dict[str, str] = field(init=False, repr=False, factory=dict)
+    seen: Cache[str, bool] = field(init=False, repr=False, factory=lambda: Cache(1000))
 
     def __attrs_post_init__(self) -> None:
         self.rest = self.client.rest
 
+        if self.client.format == "msgpack":
+            try:
+                import msgpack  # type: ignore
+            except ImportError:
+                raise RuntimeError(
+                    "The msgpack format requires the `msgpack` package."
+                ) from None
+
+            self.packb = msgpack.packb  # type: ignore
+            self.unpackb = msgpack.unpackb  # type: ignore
+
+    async def run(self) -> None:
+        """Runs the connection, reconnecting with jittered exponential backoff
+        whenever it drops until the handler is closed.
+        """
+        # Closing during the backoff is seen once it ends, before reconnecting.
+        while not self.closed:
+            try:
+                await self.connect()
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+                _log.warning(f"CONNECTION FAILED {exc!r}")
+
+            if self.closed or not self.client.reconnect:
+                return
+
+            ceiling = self.backoff_base * 2 ** min(self.attempts, 16)
+            delay = random.uniform(0, min(self.backoff_max, ceiling))
+
+            self.attempts += 1
+            self.reconnects += 1
+
+            _log.info(f"RECONNECTING in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        """Closes the websocket, without reconnecting."""
+        self.closed = True
+
+        if hasattr(self, "sock"):
+            await self.sock.close()
+
+    async def fill_gaps(self) -> None:
+        """Fetches the messages missed while disconnected in every tracked channel,
+        dispatching them as if they were received from the websocket.
+        """
+        semaphore = asyncio.Semaphore(self.fill_concurrency)
+
+        async def fill(channel: str, after: str) -> None:
+            while True:
+                params = {"after": after, "sort": "Oldest", "limit": self.fill_limit}
+
+                async with semaphore:
+                    path = f"channels/{channel}/messages"
+                    messages = await self.rest.request("GET", path, params=params)
+
+                for data in messages:
+                    self.process({"type": "Message", **data})
+
+                if len(messages) < self.fill_limit:
+                    return
+
+                after = messages[-1]["_id"]
+
+        fills = [fill(channel, after) for channel, after in self.last_seen.items()]
+
+        for result in await asyncio.gather(*fills, return_exceptions=True):
+            if isinstance(result, BaseException):
+                _log.warning(f"GAP FILL FAILED {result!r}")
+
     async def connect(self) -> None:
         payload = Auth(type="Authenticate", token=self.client.token)
         context, session = (self.rest.context, self.rest.session)
-        self.sock = await session.ws_connect(context["ws"], heartbeat=10)
+        params: dict[str, Any] = {}
+
+        # JSON is the gateway's default, so the URL is only changed for other formats.
+        if self.client.format != "json":
+            params = {"version": 1, "format": self.client.format}
+
+        self.sock = await session.ws_connect(context["ws"], params=params)
+        self.pings.clear()
+
+        await self.send(payload)
+        heartbeat = asyncio.create_task(self.heartbeat())
+
+        try:
+            await self.read()
+        finally:
+            heartbeat.cancel()
+
+    async def heartbeat(self) -> None:
+        """Sends timestamped `Ping` frames, closing the websocket
+        once too many of them go unanswered.
+        Expired cache entries are swept along the way.
+        """
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+
+            for cache in self.client.caches.values():
+                cache.expire()
+
+            # Pausing since the last beat may have held pongs back, so nothing is missed.
+            if self.paused or self.stalled:
+                self.stalled = self.paused
+                continue
+
+            if len(self.pings) >= self.max_missed:
+                _log.warning(f"MISSED {len(self.pings)} PONGS, CLOSING")
+                return await self.sock.close()
+
+            # Pings sent within the same millisecond would share a stamp,
+            # and the earlier one would be overwritten and never answered.
+            stamp = time.time_ns() // 1_000_000
+            while stamp in self.pings:
+                stamp += 1
+
+            self.pings[stamp] = time.perf_counter()
+
+            await self.send({"type": "Ping", "data": stamp})
+
+    @property
+    def latency(self) -> None | float:
+        """The most recent gateway round trip time, in seconds."""
+        return self.latencies[-1] if self.latencies else None
+
+    def percentile(self, percentile: float) -> None | float:
+        """Calculates a percentile of the recent gateway round trip times.
+
+        Parameters
+        ----------
+        percentile: :class:`float`
+            The percentile to calculate, between 0 and 100.
+
+        Returns
+        -------
+        None | :class:`float`
+            The round trip time in seconds, None if nothing was measured yet.
+        """
+        if not self.latencies:
+            return None
 
-        await self.sock.send_json(payload)
-        await self.read()
+        ordered = sorted(self.latencies)
+        index = round(percentile / 100 * (len(ordered) - 1))
+
+        return ordered[min(max(index, 0), len(ordered) - 1)]
+
+    async def send(self, payload: Any) -> None:
+        """Sends a payload through the websocket,
+        encoded with the format of the client.
+
+        Parameters
+        ----------
+        payload: Any
+            The payload to send.
+        """
+        if self.client.format == "msgpack":
+            return await self.sock.send_bytes(self.packb(payload))
+
+        await self.sock.send_json(payload, dumps=self.client.json.dumps)
+
+    def decode(self, message: WSMessage) -> None | dict[str, Any]:
+        """Decodes a frame received from the websocket.
+
+        Parameters
+        ----------
+        message: :class:`aiohttp.WSMessage`
+            The frame to decode.
+
+        Returns
+        -------
+        None | :class:`dict`
+            The decoded payload, None if the frame does not carry one.
+        """
+        if message.type is aiohttp.WSMsgType.TEXT:
+            return message.json(loads=self.client.json.loads)
+
+        if message.type is aiohttp.WSMsgType.BINARY and self.client.format == "msgpack":
+            return self.unpackb(message.data)
+
+        return None
+
+    def sniff(self, message: WSMessage) -> None | str:
+        """Reads the event type off the head of a frame without decoding it.
+
+        Parameters
+        ----------
+        message: :class:`aiohttp.WSMessage`
+            The frame to sniff.
+
+        Returns
+        -------
+        None | :class:`str`
+            The event type, None if it could not be read cheaply.
+        """
+        if message.type is aiohttp.WSMsgType.TEXT:
+            if match := TEXT_TYPE.match(message.data):
+                return match.group(1)
+
+            return None
+
+        if message.type is aiohttp.WSMsgType.BINARY:
+            data: bytes = message.data
+
+            # fixmap, then the fixstr key `type` and a fixstr value.
+            if len(data) > 7 and 0x80 <= data[0] <= 0x8F and data[1:6] == BINARY_TYPE:
+                if 0xA0 <= data[6] <= 0xBF:
+                    return data[7 : 7 + (data[6] & 0x1F)].decode()
+
+        return None
+
+    def skip(self, kind: None | str) -> bool:
+        """Checks if a frame can be dropped before decoding,
+        counting it in :attr:`skipped` if so.
+
+        Parameters
+        ----------
+        kind: None | :class:`str`
+            The sniffed event type of the frame.
+
+        Returns
+        -------
+        :class:`bool`
+            If the frame should be dropped.
+        """
+        if kind is None or kind in INTERNAL or kind not in EVENT_MAPPING:
+            return False
+
+        # Workers subscribe in their own processes, so nothing is skipped when relaying.
+        if self.client.relay is not None:
+            return False
+
+        if (event := self.client.events.get(kind)) is not None and event.subscribed:
+            return False
+
+        self.skipped[kind] += 1
+        return True
+
+    def urgent(self, kind: None | str) -> bool:
+        """Checks if a frame is handled without waiting for room in the dispatcher,
+        which is the case for the events of the control lane.
+
+        Parameters
+        ----------
+        kind: None | :class:`str`
+            The event type of the frame.
+
+        Returns
+        -------
+        :class:`bool`
+            If the frame should be processed right away.
+        """
+        if kind in INTERNAL:
+            return True
+
+        event = EVENT_MAPPING.get(kind) if kind is not None else None
+        return event is not None and event.lane is Lane.CONTROL
+
+    async def pause(self) -> None:
+        """Waits for room in the dispatcher and the relay, if either is backlogged."""
+        dispatcher, relay = self.client.dispatcher, self.client.relay
+        relayed = relay is not None and relay.backlogged
+
+        if not dispatcher.backlogged and not relayed:
+            return
+
+        self.paused = self.stalled = True
+
+        try:
+            if dispatcher.backlogged:
+                await dispatcher.wait()
+
+            if relay is not None and relay.backlogged:
+                await relay.drain()
+        finally:
+            self.paused = False
 
     async def read(self) -> None:
+        if self.client.decode_thread:
+            return await self.read_threaded()
+
         async for message in self.sock:
             message = cast(WSMessage, message)
 
-            if message.type is not aiohttp.WSMsgType.TEXT:
+            if self.skip(self.sniff(message)):
                 continue
 
-            data = message.json()
-            _log.debug(f"RECEIVED {data['type']}")
-
-            if event := EVENT_MAPPING.get(data["type"]):
-                event.dispatch(self.client, data)
+            if (data := self.decode(message)) is None:
                 continue
 
-            _log.debug(f"UNKNOWN EVENT {data['type']}")
+            if not self.urgent(data.get("type")):
+                await self.pause()
+
+            self.process(data)
+
+    async def read_threaded(self) -> None:
+        decoder = ThreadedDecoder(self)
+
+        try:
+            async for message in self.sock:
+                message = cast(WSMessage, message)
+
+                if self.skip(kind := self.sniff(message)):
+                    continue
+
+                if not self.urgent(kind):
+                    await self.pause()
+
+                await decoder.submit(message)
+        finally:
+            await decoder.close()
+
+    def process(self, data: dict[str, Any]) -> None:
+        """Processes a decoded payload and dispatches its event.
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            The payload to process.
+        """
+        kind = data["type"]
+        _log.debug(f"RECEIVED {kind}")
+
+        if kind == "Message":
+            unique, channel = data["_id"], data["channel"]
+
+            if self.seen.get(unique):
+                return
+
+            self.seen.set(unique, True)
+
+            if unique > self.last_seen.get(channel, ""):
+                self.last_seen[channel] = unique
+
+        elif kind == "Pong":
+            if (sent := self.pings.pop(data["data"], None)) is not None:
+                self.latencies.append(time.perf_counter() - sent)
+
+            # Any pong proves the connection alive, so older pings are not missed.
+            for stamp in [stamp for stamp in self.pings if stamp < data["data"]]:
+                del self.pings[stamp]
+
+        elif kind == "Ready":
+            self.attempts = 0
+
+            if self.reconnects and self.last_seen:
+                self.client.loop.create_task(self.fill_gaps())
+
+        if self.client.relay is not None and kind != "Pong":
+            self.client.relay.publish(data)
+
+        if event := self.client.events.get(kind):
+            self.client.dispatcher.submit(event, data)
+            return
+
+        if kind not in EVENT_MAPPING:
+            _log.debug(f"UNKNOWN EVENT {kind}")
@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING, Any, Awaitable
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from ..client import WebSocketClient
+    from .events import Collector, Event, Listener
+
+
+__all__ = ("Histogram", "ListenerStats", "Metrics")
+_log = logging.getLogger(__name__)
+
+# Bucket upper bounds in seconds, doubling from 1us up to about a minute.
+BOUNDS = tuple(1e-6 * 2**exponent for exponent in range(27))
+
+
+@define
+class Histogram:
+    """A class which records durations into exponential buckets.
+
+    Attributes
+    ----------
+    buckets: :class:`list`
+        The amount of durations recorded per bucket, the last bucket
+        holds everything above the largest bound.
+
+    count: :class:`int`
+        The amount of durations recorded.
+
+    total: :class:`float`
+        The sum of the durations recorded, in seconds.
+
+    max: :class:`float`
+        The longest duration recorded, in seconds.
+    """
+
+    buckets: list[int] = field(
+        init=False, repr=False, factory=lambda: [0] * (len(BOUNDS) + 1)
+    )
+    count: int = field(init=False, repr=True, default=0)
+    total: float = field(init=False, repr=False, default=0.0)
+    max: float = field(init=False, repr=True, default=0.0)
+
+    def record(self, duration: float) -> None:
+        """Records a duration.
+
+        Parameters
+        ----------
+        duration: :class:`float`
+            The duration to record, in seconds.
+        """
+        self.buckets[bisect.bisect_left(BOUNDS, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+        if duration > self.max:
+            self.max = duration
+
+    @property
+    def mean(self) -> None | float:
+        """The mean duration, in seconds."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percentile: float) -> None | float:
+        """Estimates a percentile of the durations recorded.
+
+        Parameters
+        ----------
+        percentile: :class:`float`
+            The percentile to estimate, between 0 and 100.
+
+        Returns
+        -------
+        None | :class:`float`
+            The upper bound of the bucket the percentile falls in, in seconds,
+            None if nothing was recorded yet.
+        """
+        if not self.count:
+            return None
+
+        rank, seen = percentile / 100 * self.count, 0
+
+        for index, amount in enumerate(self.buckets):
+            seen += amount
+
+            if seen >= rank and amount:
+                return min(BOUNDS[index], self.max) if index < len(BOUNDS) else self.max
+
+        return self.max
+
+
+@define(eq=False)
+class Call:
+    """A listener call currently running, watched by the watchdog."""
+
+    stats: ListenerStats = field(repr=True)
+    start: float = field(repr=False)
+    task: None | asyncio.Task[Any] = field(repr=False)
+    thread: int = field(repr=False)
+    failed: bool = field(init=False, repr=False, default=False)
+    reported: bool = field(init=False, repr=False, default=False)
+
+    def end(self) -> None:
+        stats = self.stats
+        stats.latency.record(time.perf_counter() - self.start)
+        stats.inflight -= 1
+
+        if self.failed:
+            stats.errors += 1
+
+        stats.metrics.running.pop(self, None)
+
+
+@define(eq=False)
+class ListenerStats:
+    """A class which holds the metrics of a single listener or collector.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The event and callback name of the listener, e.g `Message:on_message`.
+
+    calls: :class:`int`
+        The amount of times the listener was called.
+
+    errors: :class:`int`
+        The amount of calls which raised.
+
+    inflight: :class:`int`
+        The amount of calls currently running.
+
+    latency: :class:`.Histogram`
+        The durations of the calls.
+    """
+
+    metrics: Metrics = field(repr=False)
+    name: str = field(repr=True)
+
+    calls: int = field(init=False, repr=True, default=0)
+    errors: int = field(init=False, repr=True, default=0)
+    inflight: int = field(init=False, repr=True, default=0)
+    latency: Histogram = field(init=False, repr=False, factory=Histogram)
+
+    def begin(self, inline: bool = False) -> Call:
+        """Starts timing a call.
+
+        Parameters
+        ----------
+        inline: :class:`bool`
+            If the call runs inline, outside of a task of its own.
+
+        Returns
+        -------
+        :class:`Call`
+            The running call, to end once it is done.
+        """
+        self.calls += 1
+        self.inflight += 1
+
+        task = None if inline else asyncio.current_task()
+        call = Call(self, time.perf_counter(), task, threading.get_ident())
+        self.metrics.running[call] = None
+
+        return call
+
+    async def measure(self, awaitable: Awaitable[Any]) -> Any:
+        """Awaits a call, timing it.
+
+        Parameters
+        ----------
+        awaitable: Awaitable
+            The call to time.
+
+        Returns
+        -------
+        Any
+            The result of the call.
+        """
+        call = self.begin()
+
+        try:
+            return await awaitable
+        except Exception:
+            call.failed = True
+            raise
+        finally:
+            call.end()
+
+
+@define
+class Metrics:
+    """A class which records per-listener metrics, watches for slow listeners
+    and monitors the lag of the event loop.
+
+    Nothing is recorded until :meth:`enable` is called,
+    uninstrumented listeners only pay for a single attribute check.
+
+    .. code-block:: python
+
+        client.metrics.enable(slow_threshold=1.0, lag_interval=0.5)
+        ...
+        client.metrics.snapshot()
+
+    Parameters
+    ----------
+    client: :class:`.WebSocketClient`
+        The client to record the metrics of.
+
+    Attributes
+    ----------
+    enabled: :class:`bool`
+        If metrics are being recorded.
+
+    slow_threshold: None | :class:`float`
+        The amount of seconds after which a running listener is logged
+        along with its stack, None to disable the watchdog.
+
+    lag_interval: None | :class:`float`
+        The interval in seconds between event loop lag measurements,
+        None to disable the lag monitor.
+
+    lag_threshold: :class:`float`
+        The event loop lag in seconds after which a warning is logged.
+
+    lag: :class:`.Histogram`
+        The event loop lag measured.
+
+    stats: :class:`dict`
+        The :class:`.ListenerStats` of every instrumented listener and collector.
+
+    running: :class:`dict`
+        The calls currently running.
+    """
+
+    client: WebSocketClient = field(repr=False)
+
+    enabled: bool = field(init=False, repr=True, default=False)
+    slow_threshold: None | float = field(init=False, repr=True, default=None)
+    lag_interval: None | float = field(init=False, repr=True, default=None)
+    lag_threshold: float = field(init=False, repr=False, default=0.1)
+    lag: Histogram = field(init=False, repr=False, factory=Histogram)
+
+    stats: dict[Listener | Collector, ListenerStats] = field(
+        init=False, repr=False, factory=dict
+    )
+    running: dict[Call, None] = field(init=False, repr=False, factory=dict)
+
+    monitor: None | asyncio.Task[None] = field(init=False, repr=False, default=None)
+    watchdog: None | threading.Thread = field(init=False, repr=False, default=None)
+    stopping: threading.Event = field(init=False, repr=False, factory=threading.Event)
+
+    def enable(
+        self,
+        slow_threshold: None | float = None,
+        lag_interval: None | float = None,
+        lag_threshold: float = 0.1,
+    ) -> None:
+        """Starts recording metrics, instrumenting every listener subscribed
+        to the client.
+
+        Parameters
+        ----------
+        slow_threshold: None | :class:`float`
+            The amount of seconds after which a running listener is logged,
+            None to disable the watchdog.
+
+        lag_interval: None | :class:`float`
+            The interval in seconds between event loop lag measurements,
+            None to disable the lag monitor.
+
+        lag_threshold: :class:`float`
+            The event loop lag in seconds after which a warning is logged.
+        """
+        self.enabled = True
+        self.slow_threshold = slow_threshold
+        self.lag_interval = lag_interval
+        self.lag_threshold = lag_threshold
+
+        for event in self.client.events.values():
+            for listener in self.subscribed(event):
+                self.instrument(event, listener)
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self.start()
+
+    def disable(self) -> None:
+        """Stops recording metrics, keeping what was recorded so far."""
+        self.enabled = False
+        self.stop()
+
+        for listener in self.stats:
+            listener.stats = None
+
+    @staticmethod
+    def subscribed(event: Event[Any]) -> list[Listener | Collector]:
+        listeners: list[Listener | Collector] = [*event.listeners, *event.collectors]
+
+        for index in event.indexes.values():
+            for routed in index.values():
+                listeners.extend(routed)
+
+        return listeners
+
+    def instrument(self, event: Event[Any], listener: Listener | Collector) -> None:
+        """Instruments a listener or collector, if metrics are enabled.
+
+        Parameters
+        ----------
+        event: :class:`.Event`
+            The event the listener is subscribed to.
+
+        listener: :class:`.Listener` | :class:`.Collector`
+            The listener to instrument.
+        """
+        if not self.enabled:
+            return
+
+        if (stats := self.stats.get(listener)) is None:
+            name = getattr(listener.callback, "__qualname__", repr(listener.callback))
+            stats = self.stats[listener] = ListenerStats(self, f"{event.name}:{name}")
+
+        listener.stats = stats
+
+    def forget(self, listener: Listener | Collector) -> None:
+        """Drops the metrics of a listener or collector which unsubscribed.
+
+        Calls still running keep recording into the listener's stats,
+        they just no longer show up in :meth:`snapshot`.
+
+        Parameters
+        ----------
+        listener: :class:`.Listener` | :class:`.Collector`
+            The listener to forget.
+        """
+        self.stats.pop(listener, None)
+
+    def start(self) -> None:
+        """Starts the watchdog and the lag monitor, if configured."""
+        if not self.enabled:
+            return
+
+        if self.lag_interval is not None and self.monitor is None:
+            self.monitor = asyncio.get_running_loop().create_task(self.monitor_lag())
+
+        if self.slow_threshold is not None and self.watchdog is None:
+            self.stopping = threading.Event()
+            self.watchdog = threading.Thread(
+                target=self.watch,
+                args=(asyncio.get_running_loop(), self.stopping),
+                name="resist-watchdog",
+                daemon=True,
+            )
+            self.watchdog.start()
+
+    def stop(self) -> None:
+        """Stops the watchdog and the lag monitor."""
+        if self.monitor is not None:
+            self.monitor.cancel()
+            self.monitor = None
+
+        if self.watchdog is not None:
+            self.stopping.set()
+            self.watchdog = None
+
+    async def monitor_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.lag_interval or 0
+
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval)
+
+            lag = max(loop.time() - start - interval, 0.0)
+            self.lag.record(lag)
+
+            if lag > self.lag_threshold:
+                _log.warning(f"EVENT LOOP LAGGED {lag * 1000:.1f}ms")
+
+    def watch(self, loop: asyncio.AbstractEventLoop, stopping: threading.Event) -> None:
+        threshold = self.slow_threshold or 0
+
+        while not stopping.wait(threshold / 2):
+            now = time.perf_counter()
+
+            for call in list(self.running):
+                if call.reported or now - call.start < threshold:
+                    continue
+
+                call.reported = True
+                stack = self.stack(call, loop)
+
+                _log.warning(
+                    f"SLOW LISTENER {call.stats.name} RUNNING FOR "
+                    f"{now - call.start:.2f}s\n{stack}"
+                )
+
+    @staticmethod
+    def stack(call: Call, loop: asyncio.AbstractEventLoop) -> str:
+        # A suspended task is found through its coroutine, anything else is blocking
+        # its thread, usually the loop's.
+        if call.task is not None and asyncio.current_task(loop) is not call.task:
+            frames = call.task.get_stack()
+            summary = traceback.StackSummary.extract(
+                (frame, frame.f_lineno) for frame in frames
+            )
+
+            return "".join(summary.format())
+
+        if (frame := sys._current_frames().get(call.thread)) is None:
+            return "<no stack>"
+
+        return "".join(traceback.format_stack(frame))
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Summarises the metrics of every instrumented listener.
+
+        Returns
+        -------
+        :class:`dict`
+            The calls, errors, in-flight calls and latency percentiles in seconds,
+            mapped by listener name.
+        """
+        snapshot: dict[str, dict[str, Any]] = {}
+
+        for stats in self.stats.values():
+            latency = stats.latency
+            snapshot[stats.name] = {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "inflight": stats.inflight,
+                "mean": latency.mean,
+                "p50": latency.percentile(50),
+                "p99": latency.percentile(99),
+                "max": latency.max,
+            }
+
+        return snapshot
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import zlib
+from typing import TYPE_CHECKING, Any, Literal
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from ..client import WebSocketClient
+
+
+__all__ = ("Relay", "Worker")
+_log = logging.getLogger(__name__)
+
+Routing = Literal["broadcast", "channel", "server"]
+
+# Frames are prefixed with their length, as a big-endian unsigned int.
+HEADER = struct.Struct(">I")
+
+
+@define
+class Relay:
+    """A class which fans gateway payloads out to worker processes
+    over a Unix domain socket.
+
+    The process holding the gateway connection serves the socket,
+    every :class:`.Worker` connected to it receives its share of the payloads
+    and dispatches them on its own event loop.
+
+    .. code-block:: python
+
+        # The gateway process.
+        client = WebSocketClient(token, relay=Relay("/tmp/resist.sock"))
+        await client.connect()
+
+        # Each worker process.
+        client = WebSocketClient(token)
+        await client.work("/tmp/resist.sock")
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the Unix domain socket to serve.
+
+    routing: :class:`str`
+        How payloads are routed, one of `broadcast`, `channel` or `server`.
+        When routing by key, payloads sharing a key always reach the same worker
+        while the set of workers is unchanged. Payloads without a channel or server,
+        such as `Ready`, are broadcast.
+
+        Messages carry no server, so when routing by server their channel is mapped
+        to its server from the `Ready` and `ChannelCreate` payloads seen.
+        Channels outside of servers, or not seen yet, are routed by channel instead.
+
+    high_water: :class:`int`
+        The amount of bytes buffered for a single worker after which
+        the gateway reader waits for the workers to catch up.
+
+    Attributes
+    ----------
+    workers: :class:`list`
+        The stream writers of the connected workers, in connection order.
+
+    sent: :class:`int`
+        The amount of frames sent to workers.
+
+    servers: :class:`dict`
+        The server of every server channel seen, when routing by server.
+    """
+
+    path: str = field(repr=True)
+    routing: Routing = field(kw_only=True, repr=True, default="channel")
+    high_water: int = field(kw_only=True, repr=False, default=1 << 20)
+
+    client: WebSocketClient = field(init=False, repr=False)
+    server: asyncio.AbstractServer = field(init=False, repr=False)
+    workers: list[asyncio.StreamWriter] = field(init=False, repr=False, factory=list)
+    sent: int = field(init=False, repr=True, default=0)
+    servers: dict[str, str] = field(init=False, repr=False, factory=dict)
+
+    async def start(self, client: WebSocketClient) -> None:
+        """Starts serving the socket.
+
+        Parameters
+        ----------
+        client: :class:`.WebSocketClient`
+            The client holding the gateway connection.
+        """
+        self.client = client
+        self.server = await asyncio.start_unix_server(self.connected, self.path)
+
+        _log.info(f"RELAY SERVING {self.path}")
+
+    async def close(self) -> None:
+        """Stops serving the socket and disconnects every worker."""
+        for writer in self.workers:
+            writer.close()
+
+        self.workers.clear()
+
+        if hasattr(self, "server"):
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def connected(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.workers.append(writer)
+        _log.info(f"WORKER CONNECTED, {len(self.workers)} TOTAL")
+
+        try:
+            # Workers never send anything, reading only detects disconnects.
+            await reader.read()
+        finally:
+            if writer in self.workers:
+                self.workers.remove(writer)
+
+            writer.close()
+            _log.info(f"WORKER DISCONNECTED, {len(self.workers)} TOTAL")
+
+    def route(self, data: dict[str, Any]) -> list[asyncio.StreamWriter]:
+        """Picks the workers a payload is sent to.
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            The payload to route.
+
+        Returns
+        -------
+        :class:`list`
+            The stream writers of the workers picked.
+        """
+        if self.routing == "broadcast" or not self.workers:
+            return self.workers
+
+        if (key := self.key(data)) is None:
+            return self.workers
+
+        # crc32 is stable across processes, unlike the randomised `hash`.
+        return [self.workers[zlib.crc32(key.encode()) % len(self.workers)]]
+
+    def key(self, data: dict[str, Any]) -> None | str:
+        """Finds the key a payload is routed by.
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            The payload to find the key of.
+
+        Returns
+        -------
+        None | :class:`str`
+            The key, None if the payload should be broadcast.
+        """
+        channel = data.get("channel")
+        channel = channel if isinstance(channel, str) else None
+
+        if self.routing == "channel":
+            return channel
+
+        if isinstance(server := data.get("server"), str):
+            return server
+
+        # Server events, such as `ServerMemberJoin`, carry the server as their ID.
+        # Member updates carry an ID object of the server and the user instead.
+        if str(data.get("type")).startswith("Server"):
+            if isinstance(unique := data.get("id"), dict):
+                unique = unique.get("server")
+
+            return unique if isinstance(unique, str) else None
+
+        if channel is not None:
+            return self.servers.get(channel, channel)
+
+        return None
+
+    def track(self, data: dict[str, Any]) -> None:
+        """Maps channels to their server from the payloads routed by server."""
+        kind = data.get("type")
+
+        if kind == "Ready":
+            for channel in data.get("channels", []):
+                if isinstance(server := channel.get("server"), str):
+                    self.servers[channel["_id"]] = server
+
+        elif kind == "ChannelCreate" and isinstance(server := data.get("server"), str):
+            self.servers[data["_id"]] = server
+
+        elif kind == "ChannelDelete":
+            self.servers.pop(data.get("id"), None)  # type: ignore
+
+    def publish(self, data: dict[str, Any]) -> None:
+        """Sends a payload to the workers it is routed to.
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            The payload to send.
+        """
+        if self.routing == "server":
+            self.track(data)
+
+        if not (workers := self.route(data)):
+            return
+
+        payload = self.client.json.dumps(data)
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        frame = HEADER.pack(len(payload)) + payload
+
+        for writer in workers:
+            writer.write(frame)
+
+        self.sent += len(workers)
+
+    @property
+    def backlogged(self) -> bool:
+        """If a worker has fallen behind, and the reader should wait for it."""
+        return any(
+            writer.transport.get_write_buffer_size() > self.high_water
+            for writer in self.workers
+        )
+
+    async def drain(self) -> None:
+        """Waits until every worker has caught up."""
+        for writer in list(self.workers):
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+
+@define
+class Worker:
+    """A class which receives payloads from a :class:`.Relay`
+    and dispatches them through its client.
+
+    Parameters
+    ----------
+    client: :class:`.WebSocketClient`
+        The client to dispatch payloads through.
+
+    path: :class:`str`
+        The path of the Unix domain socket served by the relay.
+
+    Attributes
+    ----------
+    received: :class:`int`
+        The amount of payloads received.
+    """
+
+    client: WebSocketClient = field(repr=False)
+    path: str = field(repr=True)
+
+    received: int = field(init=False, repr=True, default=0)
+
+    async def run(self) -> None:
+        """Receives and dispatches payloads until the relay disconnects."""
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        dispatcher = self.client.dispatcher
+
+        try:
+            while True:
+                try:
+                    (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+                    payload = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
+                    return
+
+                self.received += 1
+
+                # Not reading while backlogged lets the relay buffer fill up instead.
+                if dispatcher.backlogged:
+                    await dispatcher.wait()
+
+                self.process(self.client.json.loads(payload))
+        finally:
+            writer.close()
+
+    def process(self, data: dict[str, Any]) -> None:
+        """Dispatches a payload received from the relay.
+
+        Parameters
+        ----------
+        data: :class:`dict`
+            The payload to dispatch.
+        """
+        if event := self.client.events.get(data["type"]):
+            self.client.dispatcher.submit(event, data)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from .events import Event
+
+__all__ = ("EventStream",)
+_log = logging.getLogger(__name__)
+
+Check = Callable[..., bool]
+
+
+@define(eq=False)
+class EventStream:
+    """A class which represents a stream of events, consumed as an async iterator.
+
+    The stream is fed inline when dispatching, no task is created per event.
+
+    Parameters
+    ----------
+    event: :class:`.Event`
+        The event being streamed.
+
+    check: Callable[..., :class:`bool`]
+        The check the event must pass first in order to be buffered.
+
+    maxsize: None | :class:`int`
+        The max amount of events buffered, None for no limit.
+
+    overflow: :class:`str`
+        What happens when the buffer is full, either `drop_oldest` or `drop_newest`.
+
+    Attributes
+    ----------
+    closed: :class:`bool`
+        If the stream was closed, a closed stream is exhausted once its buffer is.
+
+    dropped: :class:`int`
+        The amount of events dropped because the buffer was full.
+    """
+
+    event: Event[Any] = field(repr=True)
+    check: Check = field(repr=False)
+    maxsize: None | int = field(repr=True, default=None)
+    overflow: Literal["drop_oldest", "drop_newest"] = field(
+        repr=True, default="drop_oldest"
+    )
+
+    buffer: deque[Any] = field(init=False, repr=False, factory=deque)
+    waiter: None | asyncio.Future[None] = field(init=False, repr=False, default=None)
+    closed: bool = field(init=False, repr=True, default=False)
+    dropped: int = field(init=False, repr=True, default=0)
+
+    def __attrs_post_init__(self) -> None:
+        self.event.streams[self] = None
+
+    def feed(self, args: tuple[Any, ...]) -> None:
+        """Buffers a payload if it passes the check of the stream.
+
+        A check which raises is logged and the payload skipped, as the stream is fed
+        while dispatching.
+
+        Parameters
+        ----------
+        args: :class:`tuple`
+            The payload the event was dispatched with.
+        """
+        if self.closed:
+            return
+
+        try:
+            if not self.check(*args):
+                return
+        except Exception:
+            _log.exception(f"STREAM CHECK FAILED {self.event.name}")
+            return
+
+        if self.maxsize is not None and len(self.buffer) >= self.maxsize:
+            self.dropped += 1
+
+            if self.overflow == "drop_newest":
+                return
+
+            self.buffer.popleft()
+
+        self.buffer.append(args[0] if len(args) == 1 else args)
+        self.wake()
+
+    def wake(self) -> None:
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def close(self) -> None:
+        """Closes the stream, iteration stops once the buffer is exhausted."""
+        self.closed = True
+        self.event.streams.pop(self, None)
+
+        self.wake()
+
+    async def wait(self) -> bool:
+        while not self.buffer:
+            if self.closed:
+                return False
+
+            self.waiter = asyncio.get_running_loop().create_future()
+            await self.waiter
+
+        return True
+
+    async def anext_many(self, amount: int) -> list[Any]:
+        """Waits for at least one event and returns up to `amount` buffered events.
+
+        Parameters
+        ----------
+        amount: :class:`int`
+            The max amount of events to return.
+
+        Returns
+        -------
+        :class:`list`
+            The events, empty once the stream is closed and exhausted.
+        """
+        if not await self.wait():
+            return []
+
+        return [self.buffer.popleft() for _ in range(min(amount, len(self.buffer)))]
+
+    def __aiter__(self) -> EventStream:
+        return self
+
+    async def __anext__(self) -> Any:
+        if not await self.wait():
+            raise StopAsyncIteration
+
+        return self.buffer.popleft()
+
+    async def __aenter__(self) -> EventStream:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        self.close()
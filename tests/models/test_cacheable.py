@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import gc
+import time
+from unittest import mock
+
 import pytest
 
 import resist
@@ -59,6 +63,188 @@ class TestCache:
         assert cache.len == 5
         assert len(cache.root) == 5
 
+    def test_overwrite(self, cache: resist.Cache[int, str]) -> None:
+        [cache.set(1, str(i)) for i in range(10)]
+
+        assert cache.len == len(cache) == 1
+        assert cache[1] == "9"
+
+    def test_lru(self) -> None:
+        cache = resist.Cache[int, str](3, "lru")
+        [cache.set(i, str(i)) for i in range(3)]
+
+        assert cache.get(0) == "0"
+        cache.set(3, "3")
+
+        assert list(cache.root) == [2, 0, 3]
+        assert cache.pop() == "2"
+
+    def test_lfu(self) -> None:
+        cache = resist.Cache[int, str](3, "lfu")
+        [cache.set(i, str(i)) for i in range(3)]
+
+        for key in (0, 0, 1, 2, 2):
+            cache.get(key)
+
+        cache.set(3, "3")
+        assert 1 not in cache and cache.len == 3
+
+        cache.set(4, "4")
+        assert 3 not in cache
+        assert sorted(cache.root) == [0, 2, 4]
+
+        with pytest.raises(ValueError):
+            resist.Cache[int, str](3, "foo")  # type: ignore
+
+    def test_ttl(self) -> None:
+        cache = resist.Cache[int, str](None, ttl=10)
+        now = time.monotonic()
+
+        with mock.patch.object(time, "monotonic", return_value=now):
+            cache.set(1, "foo")
+            cache.set(2, "bar", ttl=60)
+            cache.set(3, "baz")
+
+        with mock.patch.object(time, "monotonic", return_value=now + 20):
+            assert cache.get(1) is None
+            assert 3 not in cache
+
+            cache.set(4, "qux")
+            assert sorted(cache.root) == [2, 4] and cache.len == 2
+
+        with mock.patch.object(time, "monotonic", return_value=now + 100):
+            assert cache.expire() == 2
+            assert cache.root == {} and cache.len == 0
+
+    def test_ttl_heap(self) -> None:
+        cache = resist.Cache[int, str](10, ttl=60)
+
+        for key in range(1000):
+            cache.set(key % 20, "foo")
+
+        assert len(cache.heap) <= 2 * len(cache.deadlines) + 1
+
+        cache.ttl = None
+        cache.set(19, "bar")
+        assert 19 not in cache.deadlines and not cache.expired(19)
+
+        for key in range(10, 19):
+            cache.pop(key)
+
+        assert cache.deadlines == {} and len(cache.heap) <= 1
+
+    def test_max_bytes(self) -> None:
+        cache = resist.Cache[int, str](
+            None, max_bytes=100, sizer=len, stats=resist.CacheStats()
+        )
+
+        for key in range(5):
+            cache.set(key, "x" * 30)
+
+        assert sorted(cache.root) == [2, 3, 4] and cache.bytes == 90
+
+        cache.set(3, "x" * 60)
+        assert sorted(cache.root) == [3, 4] and cache.bytes == 90
+
+        cache.pop(4)
+        assert cache.bytes == 60
+        assert cache.stats is not None and cache.stats.evictions == {"bytes": 3}
+
+    def test_budget(self) -> None:
+        budget = resist.MemoryBudget(100)
+        large = resist.Cache[int, str](None, budget=budget, sizer=len)
+        small = resist.Cache[int, str](None, budget=budget, sizer=len)
+
+        for key in range(3):
+            large.set(key, "x" * 30)
+
+        small.set(0, "x" * 10)
+        assert budget.used == 100
+
+        small.set(1, "x" * 20)
+        assert sorted(large.root) == [1, 2] and len(small) == 2
+        assert budget.used == large.bytes + small.bytes == 90
+
+        # A collected cache gives its bytes back, e.g one of a client never closed.
+        del large
+        gc.collect()
+        assert budget.used == small.bytes == 30 and len(budget.caches) == 1
+
+        small.budget = None
+        assert budget.used == 0 and not budget.caches
+
+    def test_late_limits(self) -> None:
+        cache = resist.Cache[int, str](None, sizer=len)
+
+        for key in range(5):
+            cache.set(key, "x" * 30)
+
+        assert cache.bytes == 0
+
+        cache.max_bytes = 100
+        assert sorted(cache.root) == [2, 3, 4] and cache.bytes == 90
+
+        budget = resist.MemoryBudget()
+        cache.budget = budget
+        assert budget.used == 90 and cache in budget.caches
+
+        budget.max_bytes = 40
+        assert sorted(cache.root) == [4] and budget.used == cache.bytes == 30
+
+        cache.budget = None
+        assert budget.used == 0 and cache not in budget.caches
+
+    def test_footprint(self) -> None:
+        data = {
+            "_id": "sized",
+            "channel": "98765",
+            "author": "012345",
+            "content": "x" * 1000,
+        }
+        client = resist.WebSocketClient("REVOLT_TOKEN")
+        message = resist.Message(client, data)  # type: ignore
+
+        assert 1000 < resist.footprint(message) < 10_000
+        assert resist.footprint(data) < resist.footprint(message)
+
+    def test_index(self) -> None:
+        cache = resist.Cache[int, str](3)
+        cache.set(5, "foo")
+        index = cache.index("first", lambda value: value[0])
+
+        cache.set(1, "bar")
+        cache.set(3, "fiz")
+        assert cache.query("first", "f") == ["foo", "fiz"]
+
+        cache.set(3, "baz")
+        cache.set(4, "qux")
+        assert cache.query("first", "b") == ["baz", "bar"]
+        assert sorted(index.entries) == ["b", "q"]
+
+    def test_stats(self) -> None:
+        evicted: list[tuple[int, str, str]] = []
+        cache = resist.Cache[int, str](
+            2,
+            stats=resist.CacheStats(),
+            on_evict=lambda *args: evicted.append(args),  # type: ignore
+        )
+
+        cache.set(1, "foo")
+        cache.set(1, "bar")
+        cache.set(2, "baz")
+        cache.set(3, "qux")
+
+        assert cache.get(1) is None and cache.get(2) == "baz"
+        assert evicted == [(1, "bar", "capacity")]
+
+        cache.pop()
+        assert len(evicted) == 1
+
+        snapshot = cache.snapshot()
+        assert snapshot["len"] == 1 and snapshot["ratio"] == 0.5
+        assert (snapshot["inserts"], snapshot["overwrites"]) == (3, 1)
+        assert snapshot["evictions"] == {"capacity": 1}
+
 
 class TestCacheable:
     class Model(resist.Cacheable, max_items=5):
@@ -73,3 +259,39 @@ class TestCacheable:
         assert hasattr(cache, "__cache__")
 
         assert cache.cache.max_items == 5
+
+    def test_policy(self) -> None:
+        class Model(resist.Cacheable, max_items=10, policy="lru", ttl=60):
+            ...
+
+        assert Model.cache.policy == "lru" and Model.cache.ttl == 60
+        assert resist.Message.cache is resist.Message.__dict__["__cache__"]
+
+        caches = resist.Cacheable.caches()
+        assert caches["resist.models.message.Message"][0] is resist.Message.cache
+        assert any(cache[0] is Model.cache for cache in caches.values())
+
+    def test_snapshot(self) -> None:
+        class Model(resist.Cacheable, stats=True):
+            def __init__(self, client: resist.WebSocketClient) -> None:
+                client.caches[Model].set("foo", self)
+
+        name = f"{Model.__module__}.{Model.__qualname__}"
+        clients = [resist.WebSocketClient("REVOLT_TOKEN") for _ in range(2)]
+
+        for client in clients:
+            Model(client)
+            client.caches[Model].get("foo")
+
+        Model.cache.get("foo")
+
+        # The copies of every live client are added up to their template.
+        snapshot = resist.Cacheable.snapshot()
+        assert snapshot["resist.models.message.Message"]["policy"] == "fifo"
+        assert snapshot[name]["caches"] == 2 and snapshot[name]["len"] == 2
+        assert (snapshot[name]["hits"], snapshot[name]["misses"]) == (2, 1)
+        assert snapshot[name]["inserts"] == 2 and snapshot[name]["ratio"] == 2 / 3
+
+        del client, clients
+        gc.collect()
+        assert resist.Cacheable.snapshot()[name]["caches"] == 0
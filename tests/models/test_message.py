@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import pickle
 from datetime import datetime, timezone
+from typing import Any
 
 import pytest
 
@@ -78,6 +80,9 @@ class TestMessage:
         assert m3.content == "type:channel_renamed by:12345"
 
     def test_replies(self, client: resist.WebSocketClient) -> None:
+        self.test_user_message(client)
+        self.test_system_message(client)
+
         message = resist.Message(
             client,
             {
@@ -95,5 +100,72 @@ class TestMessage:
         )
 
         assert message.replies == [
-            m for m in resist.Message.cache.root.values() if m.unique != "replying"
+            m
+            for m in client.caches[resist.Message].root.values()
+            if m.unique != "replying"
         ]
+
+    def test_caches(self, client: resist.WebSocketClient) -> None:
+        other = resist.WebSocketClient("REVOLT_TOKEN")
+        data: Any = {"_id": "isolated", "channel": "98765", "author": "1", "content": ""}
+
+        message = resist.Message(client, data)
+
+        # Clients never share cached models, the class cache is only a template.
+        assert client.caches[resist.Message]["isolated"] is message
+        assert other.caches[resist.Message].get("isolated") is None
+        assert resist.Message.cache.get("isolated") is None
+
+        cache = client.caches[resist.Message]
+        assert cache.max_items == resist.Message.cache.max_items
+        assert set(cache.indexes) == {"channel", "author"}
+        assert cache.budget is resist.BUDGET and cache in resist.BUDGET.caches
+        assert "resist.models.message.Message" in client.caches.snapshot()
+
+        client.caches.clear()
+        assert cache.budget is None and cache not in resist.BUDGET.caches
+
+    def test_pickle(self, client: resist.WebSocketClient) -> None:
+        message = resist.Message(
+            client,
+            {"_id": "pickled", "channel": "98765", "author": "012345", "content": "foo"},
+        )
+        copy = pickle.loads(pickle.dumps(message))
+
+        assert isinstance(copy, resist.Detachable)
+        assert copy.client is None
+        assert (copy.unique, copy.content) == ("pickled", "foo")
+
+    def test_query(self, client: resist.WebSocketClient) -> None:
+        ids = [f"01ARZ3NDEK{index:016}" for index in range(5)]
+
+        for index, unique in enumerate(ids):
+            resist.Message(
+                client,
+                {
+                    "_id": unique,
+                    "channel": "indexed",
+                    "author": "even" if index % 2 == 0 else "odd",
+                    "content": "foo",
+                },
+            )
+
+        def query(name: str, value: str, **kwargs: Any) -> list[str]:
+            messages = client.caches[resist.Message].query(name, value, **kwargs)
+            return [message.unique for message in messages]
+
+        assert query("channel", "indexed") == ids[::-1]
+        assert query("channel", "indexed", limit=2) == [ids[4], ids[3]]
+        assert query("channel", "indexed", before=ids[3], after=ids[0]) == [
+            ids[2],
+            ids[1],
+        ]
+        assert query("author", "odd") == [ids[3], ids[1]]
+
+        cache = client.caches[resist.Message]
+
+        for unique in ids:
+            cache.pop(unique)
+
+        assert query("channel", "indexed") == []
+        assert "indexed" not in cache.indexes["channel"].entries
@@ -26,6 +26,7 @@ class TestWebSocketClient:
     @pytest.mark.asyncio
     async def test_connect(self, client: resist.WebSocketClient) -> None:
         assert client.loop is None
+        client.reconnect = False
 
         with mock.patch.object(resist.WebSocketHandler, "connect") as connect:
             connect = cast(mock.AsyncMock, connect)
@@ -47,16 +48,18 @@ class TestWebSocketClient:
         assert not isinstance(test_register, types.FunctionType)
         assert isinstance(test_register, resist.Listener)
 
-        with pytest.raises(TypeError):
+        @client.on(resist.Events.MESSAGE)
+        def test_inline() -> None:
+            ...
 
-            @client.on(resist.Events.MESSAGE)
-            def _() -> None:
-                ...
+        assert test_register.inline is False and test_inline.inline is True
 
         assert test_register.once is not True
-        assert len(resist.Events.MESSAGE.listeners) == 1
+        assert len(client.events.MESSAGE.listeners) == 2
 
-        resist.Events.MESSAGE.listeners.pop()
+        for listener in (test_register, test_inline):
+            assert len(listener.subscriptions) == 1
+            assert listener.subscriptions[0].cancel()
 
     @pytest.mark.asyncio
     async def test_once(self, client: resist.WebSocketClient) -> None:
@@ -65,10 +68,11 @@ class TestWebSocketClient:
             ...
 
         assert isinstance(test_once_register, resist.Listener)
-        assert len(resist.Events.MESSAGE.listeners) == 1
+        assert len(client.events.MESSAGE.listeners) == 1
         assert test_once_register.once is True
 
-        resist.Events.MESSAGE.listeners.pop()
+        assert len(test_once_register.subscriptions) == 1
+        assert test_once_register.subscriptions[0].cancel()
 
     def test_collect(self, client: resist.WebSocketClient) -> None:
         @client.collect(resist.Events.MESSAGE, amount=5, timeout=None)
@@ -76,7 +80,7 @@ class TestWebSocketClient:
             ...
 
         assert isinstance(test_collect_register, resist.Collector)
-        assert len(resist.Events.MESSAGE.collectors) == 1
+        assert len(client.events.MESSAGE.collectors) == 1
         assert test_collect_register.once is False
 
         @client.collect(resist.Events.MESSAGE, amount=5, timeout=None, once=True)
@@ -84,11 +88,11 @@ class TestWebSocketClient:
             ...
 
         assert isinstance(test_collect_once_register, resist.Collector)
-        assert len(resist.Events.MESSAGE.collectors) == 2
+        assert len(client.events.MESSAGE.collectors) == 2
         assert test_collect_once_register.once is True
 
-        resist.Events.MESSAGE.collectors.pop()
-        resist.Events.MESSAGE.collectors.pop()
+        client.events.MESSAGE.unsubscribe(test_collect_register)
+        client.events.MESSAGE.unsubscribe(test_collect_once_register)
 
     @pytest.mark.asyncio
     async def test_dispatch(self, client: resist.WebSocketClient) -> None:
@@ -105,4 +109,50 @@ class TestWebSocketClient:
             tasks = client.dispatch(resist.Events.MESSAGE)
             await asyncio.gather(*tasks)
 
-        resist.Events.MESSAGE.listeners.pop()
+        client.events.MESSAGE.listeners.pop()
+
+    @pytest.mark.asyncio
+    async def test_wait_for(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.MESSAGE
+
+        waiters = [
+            asyncio.create_task(
+                client.wait_for(event, check=lambda data, i=i: data["n"] == i % 10)
+            )
+            for i in range(1000)
+        ]
+        await asyncio.sleep(0)
+        assert len(event.waiters) == 1000
+
+        for n in range(10):
+            event.dispatch(client, {"n": n})
+
+        results = await asyncio.gather(*waiters)
+
+        assert [result["n"] for result in results] == [i % 10 for i in range(1000)]
+        assert event.waiters == {}
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.wait_for(event, timeout=0.01)
+
+        assert event.waiters == {}
+
+    def test_events(self, client: resist.WebSocketClient) -> None:
+        other = resist.WebSocketClient("REVOLT_TOKEN")
+
+        @client.on(resist.Events.MESSAGE)
+        async def _() -> None:
+            ...
+
+        assert isinstance(client.events, resist.EventRegistry)
+        assert client.events.MESSAGE is client.events.resolve(resist.Events.MESSAGE)
+        assert client.events.MESSAGE is not resist.Events.MESSAGE
+        assert client.events.MESSAGE.lane is resist.Lane.BULK
+
+        assert len(client.events.MESSAGE.listeners) == 1
+        assert not resist.Events.MESSAGE.listeners
+        assert other.events.get("Message") is None
+
+        with pytest.raises(AttributeError):
+            client.events.FOO
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import pathlib
+import struct
+from typing import Any
+from unittest import mock
+
+import pytest
+
+import resist
+
+
+class TestSnapshot:
+    @pytest.fixture()
+    def client(self) -> resist.WebSocketClient:
+        return resist.WebSocketClient("REVOLT_TOKEN")
+
+    def message(self, client: resist.WebSocketClient, unique: str) -> resist.Message:
+        data = {"_id": unique, "channel": "warm", "author": "012345", "content": unique}
+        return resist.Message(client, data)  # type: ignore
+
+    def test_round_trip(
+        self, client: resist.WebSocketClient, tmp_path: pathlib.Path
+    ) -> None:
+        path = str(tmp_path / "resist.snapshot")
+        ids = ["01ARZ3NDEK0000000000000001", "01ARZ3NDEK0000000000000002"]
+
+        for unique in ids:
+            self.message(client, unique)
+
+        resist.Snapshot.save(path, client)
+
+        for unique in ids:
+            client.caches[resist.Message].pop(unique)
+
+        snapshot = resist.Snapshot.open(path)
+        assert snapshot is not None and snapshot.version == 1
+        keys = [key for key, _ in snapshot.entries("resist.models.message.Message")]
+        assert [key for key in keys if key in ids] == ids
+
+        snapshot.load(client)
+        assert ids[0] not in client.caches[resist.Message].root
+
+        message = client.caches[resist.Message][ids[0]]
+        assert message.content == ids[0] and message.client is client
+        assert client.caches[resist.Message].get("missing") is None
+
+        # Entries never looked up are carried over to the next snapshot.
+        resist.Snapshot.save(path, client, snapshot)
+        snapshot.close()
+        assert client.caches[resist.Message].loader is None
+
+        reopened = resist.Snapshot.open(path)
+        assert reopened is not None
+        assert reopened.lookup("resist.models.message.Message", ids[1]) is not None
+        reopened.close()
+
+        client.caches[resist.Message].pop(ids[0])
+
+    def test_removed(
+        self, client: resist.WebSocketClient, tmp_path: pathlib.Path
+    ) -> None:
+        path = str(tmp_path / "resist.snapshot")
+        ids = [f"01ARZ3NDEK000000000000010{index}" for index in range(3)]
+
+        for unique in ids:
+            self.message(client, unique)
+
+        resist.Snapshot.save(path, client)
+
+        for unique in ids:
+            client.caches[resist.Message].pop(unique)
+
+        snapshot = resist.Snapshot.open(path)
+        assert snapshot is not None
+        snapshot.load(client)
+
+        # A loaded entry deleted during the session stays deleted after a restart.
+        assert client.caches[resist.Message][ids[0]].content == ids[0]
+        client.caches[resist.Message].pop(ids[0])
+        assert client.caches[resist.Message].get(ids[0]) is None
+
+        resist.Snapshot.save(path, client, snapshot)
+        snapshot.close()
+
+        reopened = resist.Snapshot.open(path)
+        assert reopened is not None
+
+        name = "resist.models.message.Message"
+        assert reopened.lookup(name, ids[0]) is None
+        assert reopened.lookup(name, ids[1]) is not None
+        reopened.close()
+
+    def test_replies(
+        self, client: resist.WebSocketClient, tmp_path: pathlib.Path
+    ) -> None:
+        path = str(tmp_path / "resist.snapshot")
+        reply = {"_id": "01B", "channel": "warm", "author": "1", "replies": ["01A"]}
+
+        self.message(client, "01A")
+        resist.Message(client, {**reply, "content": ""})  # type: ignore
+        client.caches[resist.Message].pop("01A")
+        resist.Snapshot.save(path, client)
+
+        snapshot = resist.Snapshot.open(path)
+        assert snapshot is not None
+
+        # A reply to a message which was not saved still loads, without it.
+        warm = resist.WebSocketClient("REVOLT_TOKEN")
+        snapshot.load(warm)
+
+        message = warm.caches[resist.Message].get("01B")
+        assert message is not None and message.replies == []
+
+        # Entries which fail to rebuild are misses.
+        cold = resist.WebSocketClient("REVOLT_TOKEN")
+        snapshot.load(cold)
+
+        with mock.patch.object(resist.Message, "__init__", side_effect=ValueError):
+            assert cold.caches[resist.Message].get("01B") is None
+
+        snapshot.close()
+
+    def test_invalid(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "resist.snapshot"
+        assert resist.Snapshot.open(str(path)) is None
+
+        path.write_bytes(b"")
+        assert resist.Snapshot.open(str(path)) is None
+
+        path.write_bytes(struct.pack(">4sHI", b"RSNP", 999, 0))
+        assert resist.Snapshot.open(str(path)) is None
+
+        path.write_bytes(b"garbage!!!")
+        assert resist.Snapshot.open(str(path)) is None
+
+    @pytest.mark.asyncio
+    async def test_context(self, tmp_path: pathlib.Path) -> None:
+        path = str(tmp_path / "resist.snapshot")
+        client = resist.WebSocketClient("REVOLT_TOKEN", snapshot=path)
+        context: Any = {"revolt": "0.5.3", "ws": "wss://ws.revolt.chat"}
+
+        client.rest = await resist.RESTClient.connect(client, context=context)
+        assert client.rest.context is context
+
+        await client.close()
+
+        warm = resist.WebSocketClient("REVOLT_TOKEN", snapshot=path)
+        rest = await warm.connect_rest()
+
+        assert warm.warm is not None and rest.context == context
+        assert rest.fetched == client.rest.fetched
+        await warm.close()
+        assert warm.warm is None
+
+        # A context past its max age is fetched again.
+        stale = resist.WebSocketClient("REVOLT_TOKEN", snapshot=path, context_max_age=0)
+
+        with mock.patch.object(resist.RESTClient, "connect") as connect:
+            await stale.connect_rest()
+
+        connect.assert_awaited_once_with(stale)
+        stale.save_snapshot()
+
+    @pytest.mark.asyncio
+    async def test_unconnected(
+        self, client: resist.WebSocketClient, tmp_path: pathlib.Path
+    ) -> None:
+        path = tmp_path / "resist.snapshot"
+        resist.Snapshot.save(str(path), client)
+        saved = path.read_bytes()
+
+        await resist.WebSocketClient("REVOLT_TOKEN", snapshot=str(path)).close()
+        assert path.read_bytes() == saved
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import resist
+
+
+class TestJSONBackend:
+    def test_find(self) -> None:
+        backend = resist.find_json_backend()
+
+        assert isinstance(backend, resist.JSONBackend)
+        assert backend.name in ("orjson", "ujson", "json")
+        assert resist.JSON.name == backend.name
+
+    def test_round_trip(self) -> None:
+        payload = {"type": "Message", "content": "foo", "mentions": ["bar"]}
+        raw = resist.JSON.dumps(payload)
+
+        assert isinstance(raw, str)
+        assert json.loads(raw) == payload
+        assert resist.JSON.loads(raw) == payload
+        assert resist.JSON.loads(raw.encode()) == payload
+
+    def test_client(self) -> None:
+        backend = resist.JSONBackend("json", json.loads, json.dumps)
+
+        assert resist.WebSocketClient("REVOLT_TOKEN").json is resist.JSON
+        assert resist.WebSocketClient("REVOLT_TOKEN", json=backend).json is backend
+
+
+class TestULID:
+    def test_from_datetime(self) -> None:
+        when = datetime(2016, 7, 30, 23, 54, 10, 259000, tzinfo=timezone.utc)
+
+        assert resist.ulid_from_datetime(when) == "01ARZ3NDEK0000000000000000"
+        assert resist.ulid_from_datetime(when) < "01ARZ3NDEKTSV4RRFFQ69G5FAV"
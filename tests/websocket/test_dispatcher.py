@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import resist
+
+
+class TestDispatcher:
+    @pytest.fixture()
+    def client(self) -> resist.WebSocketClient:
+        return resist.WebSocketClient("REVOLT_TOKEN", max_inflight=1)
+
+    @pytest.fixture()
+    def event(self) -> Any:
+        event = resist.Event("Foo", max_inflight=1)
+        yield event
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    def test_attributes(self, client: resist.WebSocketClient) -> None:
+        assert isinstance(client.dispatcher, resist.Dispatcher)
+        assert client.dispatcher.max_inflight == 1
+        assert client.dispatcher.inflight == 0
+        assert not client.dispatcher.full()
+        assert not client.dispatcher.backlogged
+
+    @pytest.mark.asyncio
+    async def test_limits(
+        self, client: resist.WebSocketClient, event: resist.Event[Any]
+    ) -> None:
+        client.loop = asyncio.get_running_loop()
+        dispatcher = client.dispatcher
+        release = asyncio.Event()
+        received: list[str] = []
+
+        async def callback(arg: str) -> None:
+            received.append(arg)
+            await release.wait()
+
+        event.subscribe(
+            resist.Listener(once=False, callback=callback, check=lambda _: True)
+        )
+        dispatcher.submit(event, "foo")
+        await asyncio.sleep(0)
+
+        assert dispatcher.inflight == 1 and event.inflight == 1
+        assert dispatcher.full(event) and dispatcher.full()
+
+        dispatcher.submit(event, "bar")
+        dispatcher.submit(event, "baz")
+        assert dispatcher.pending == 2 and dispatcher.backlogged
+
+        waiter = asyncio.create_task(dispatcher.wait())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        release.set()
+        await asyncio.wait_for(waiter, timeout=1)
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert received == ["foo", "bar", "baz"]
+        assert dispatcher.inflight == 0 and event.inflight == 0
+
+    @pytest.mark.parametrize(
+        ("shedding", "expected"),
+        [
+            ("drop_oldest", ["normal", "low-3", "low-4"]),
+            ("drop_newest", ["low-0", "low-1", "normal"]),
+            ("sample", ["low-0", "low-1", "normal", "low-3"]),
+        ],
+    )
+    def test_shedding(
+        self, client: resist.WebSocketClient, shedding: Any, expected: list[str]
+    ) -> None:
+        dispatcher = client.dispatcher
+        dispatcher.inflight = 1
+        dispatcher.shed_threshold = 2
+        dispatcher.shedding = shedding
+        dispatcher.sample_rate = 2
+
+        low, normal = resist.Events.CHANNEL_ACK, resist.Events.MESSAGE
+
+        for index in range(2):
+            dispatcher.submit(low, f"low-{index}")
+
+        dispatcher.submit(normal, "normal")
+
+        for index in range(2, 5):
+            dispatcher.submit(low, f"low-{index}")
+
+        backlog = dispatcher.backlog[resist.Lane.BULK]
+        assert [args[0] for _, args in backlog] == expected
+        assert dispatcher.shed["ChannelAck"] == 5 - len(expected) + 1
+        assert "Message" not in dispatcher.shed
+
+    @pytest.mark.asyncio
+    async def test_lanes(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        dispatcher = client.dispatcher
+        dispatcher.lane_limits = {resist.Lane.BULK: 1}
+        release = asyncio.Event()
+        received: list[str] = []
+
+        async def callback(data: dict[str, str]) -> None:
+            received.append(data["type"])
+            await release.wait()
+
+        message, ready = resist.Events.MESSAGE, resist.Events.READY
+        listeners = [
+            resist.Listener(once=False, callback=callback, check=lambda _: True)
+            for _ in range(2)
+        ]
+        message.subscribe(listeners[0])
+        ready.subscribe(listeners[1])
+
+        for _ in range(3):
+            dispatcher.submit(message, {"type": "Message"})
+
+        dispatcher.submit(ready, {"type": "Ready"})
+        await asyncio.sleep(0)
+
+        assert received == ["Message", "Ready"]
+        assert dispatcher.lane_inflight[resist.Lane.CONTROL] == 1
+        assert len(dispatcher.backlog[resist.Lane.BULK]) == 2
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert received == ["Message", "Ready", "Message", "Message"]
+
+        message.unsubscribe(listeners[0])
+        ready.unsubscribe(listeners[1])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import gc
 from datetime import timedelta
 from unittest import mock
 
@@ -44,7 +45,7 @@ class TestEvents:
             return True
 
         collector = resist.Collector(
-            timeout=timedelta(seconds=5),
+            timeout=timedelta(seconds=0.2),
             once=False,
             callback=callback,
             check=check,
@@ -55,21 +56,76 @@ class TestEvents:
         assert collector.callback is callback
         assert collector.check is check
 
-        assert isinstance(collector.timeout, timedelta)
+        assert collector.timeout == 0.2
         assert collector.amount == 5
-        assert collector.queue.maxsize == 5
+        assert collector.window == "tumbling"
 
         for i in range(5):
             await collector(i)
 
         fake.assert_awaited_once_with((0, 1, 2, 3, 4))
-        fake.await_count = 0
+        assert collector.timer is None
+        fake.reset_mock()
 
-        for i in range(5):
+        for i in range(3):
             await collector(i)
-            await asyncio.sleep(1.5)
 
         fake.assert_not_awaited()
+        await asyncio.sleep(0.3)
+
+        fake.assert_awaited_once_with((0, 1, 2))
+        assert len(collector.items) == 0
+
+        with pytest.raises(ValueError):
+            resist.Collector(once=False, callback=callback, check=check)
+
+    @pytest.mark.asyncio
+    async def test_collector_failing(self, caplog: pytest.LogCaptureFixture) -> None:
+        async def callback(_: tuple[int, ...]) -> None:
+            raise RuntimeError("flush")
+
+        collector = resist.Collector(
+            once=False, callback=callback, check=lambda _: True, timeout=0.05
+        )
+        loop = asyncio.get_running_loop()
+        handler = mock.Mock()
+        loop.set_exception_handler(handler)
+
+        await collector(0)
+        await asyncio.sleep(0.1)
+
+        # The failed timer-driven flush is logged instead of never being retrieved.
+        assert not collector.flushes
+        assert "COLLECTOR FLUSH FAILED" in caplog.text
+
+        gc.collect()
+        handler.assert_not_called()
+
+        loop.set_exception_handler(None)
+
+    @pytest.mark.asyncio
+    async def test_sliding_collector(self) -> None:
+        batches: list[tuple[int, ...]] = []
+
+        async def callback(arg: tuple[int, ...]) -> None:
+            batches.append(arg)
+
+        collector = resist.Collector(
+            once=False,
+            callback=callback,
+            check=lambda _: True,
+            amount=3,
+            timeout=0.2,
+            window="sliding",
+        )
+
+        for i in range(4):
+            await collector(i)
+
+        await asyncio.sleep(0.3)
+        await collector(4)
+
+        assert batches == [(0,), (0, 1), (0, 1, 2), (1, 2, 3), (4,)]
 
     @pytest.mark.asyncio
     async def test_events(self, client: resist.WebSocketClient) -> None:
@@ -78,8 +134,8 @@ class TestEvents:
         fake = mock.AsyncMock()
 
         assert event.name == "Message"
-        assert isinstance(event.listeners, list)
-        assert isinstance(event.collectors, list)
+        assert isinstance(event.listeners, resist.Subscribers)
+        assert isinstance(event.collectors, resist.Subscribers)
         assert hasattr(event, "subscribe")
         assert hasattr(event, "dispatch")
 
@@ -107,3 +163,256 @@ class TestEvents:
             assert isinstance(name, str)
             assert isinstance(evt, resist.Event)
             assert evt.name == name
+
+    @pytest.mark.asyncio
+    async def test_filters(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.MESSAGE
+        received: list[tuple[int, str]] = []
+
+        def register(index: int, once: bool = False, **filters: str) -> resist.Listener:
+            async def callback(data: dict[str, str]) -> None:
+                received.append((index, data["_id"]))
+
+            decorator = client.once if once else client.on
+            return decorator(event, **filters)(callback)
+
+        listeners = [register(index, channel=str(index)) for index in range(500)]
+        listeners.append(register(500, channel="7", author="foo"))
+        listeners.append(register(501, once=True, author="bar"))
+
+        assert not any(listener.filters for listener in event.listeners)
+        assert set(event.indexes) == {"channel", "author"}
+        assert len(event.route(({"channel": "7", "author": "foo"},))) == 2
+
+        await asyncio.gather(*event.dispatch(client, {"_id": "a", "channel": "7"}))
+        await asyncio.gather(
+            *event.dispatch(client, {"_id": "b", "channel": "7", "author": "foo"})
+        )
+        await asyncio.gather(*event.dispatch(client, {"_id": "c", "author": "bar"}))
+        await asyncio.gather(*event.dispatch(client, {"_id": "d", "author": "bar"}))
+
+        assert sorted(received) == [(7, "a"), (7, "b"), (500, "b"), (501, "c")]
+        assert "author" not in event.indexes
+
+        for listener in listeners[:-1]:
+            event.unsubscribe(listener)
+
+        assert event.indexes == {}
+
+    @pytest.mark.asyncio
+    async def test_subscription(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = resist.Event("Foo")
+        fake = mock.AsyncMock()
+
+        async def callback(arg: str) -> None:
+            await fake(arg)
+
+        listeners = [
+            resist.Listener(once=index % 2 == 0, callback=callback, check=lambda _: True)
+            for index in range(6)
+        ]
+        subscriptions = [event.subscribe(listener) for listener in listeners]
+
+        assert all(isinstance(s, resist.Subscription) for s in subscriptions)
+        assert all(s.active for s in subscriptions)
+
+        await asyncio.gather(*event.dispatch(client, "foo"))
+
+        assert fake.await_count == 6
+        assert list(event.listeners) == listeners[1::2]
+        assert [s.active for s in subscriptions] == [False, True] * 3
+
+        assert subscriptions[1].cancel()
+        assert not subscriptions[1].cancel()
+        assert list(event.listeners) == [listeners[3], listeners[5]]
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    def test_subscription_events(self) -> None:
+        first = resist.Event("Foo", register=False)
+        second = resist.Event("Bar", register=False)
+        listener = resist.Listener(once=False, callback=lambda: None, check=lambda: True)
+
+        subscriptions = [first.subscribe(listener), second.subscribe(listener)]
+        assert first.subscribe(listener) is subscriptions[0]
+        assert first.listeners == [listener] and second.listeners == [listener]
+
+        # Cancelling one subscription leaves the others active.
+        assert subscriptions[0].cancel()
+        assert not subscriptions[0].active and subscriptions[1].active
+        assert listener not in first.listeners and listener in second.listeners
+
+        assert second.listeners.pop() is listener and not second.listeners
+
+    @pytest.mark.asyncio
+    async def test_inline(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = resist.Event("Foo")
+        received: list[str] = []
+
+        def callback(arg: str) -> None:
+            if arg == "bad":
+                raise RuntimeError(arg)
+
+            received.append(arg)
+
+        listener = resist.Listener(once=False, callback=callback, check=lambda _: True)
+        event.subscribe(listener)
+
+        assert listener.inline
+        assert event.dispatch(client, "foo") == []
+        assert received == ["foo"]
+
+        assert event.dispatch(client, "bad") == []
+        assert client.dispatcher.inflight == 0
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    @pytest.mark.asyncio
+    async def test_ordered(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.resolve(resist.Event("Foo"))
+        received: list[str] = []
+
+        @client.on(event, ordered_by="channel")
+        async def callback(data: dict[str, str]) -> None:
+            if data["_id"] == "a-1":
+                await asyncio.sleep(0.05)
+
+            if data["_id"] == "a-2":
+                raise RuntimeError(data["_id"])
+
+            received.append(data["_id"])
+
+        payloads = [("a-1", "a"), ("a-2", "a"), ("b-1", "b"), ("a-3", "a"), ("n-1", None)]
+        tasks = [
+            task
+            for unique, channel in payloads
+            for task in event.dispatch(client, {"_id": unique, "channel": channel})
+        ]
+
+        # Payloads without the key are ordered among themselves.
+        assert len(tasks) == 3
+        assert len(callback.queues["a"]) == 3
+        assert client.dispatcher.inflight == 5
+
+        await asyncio.gather(*tasks)
+
+        assert received == ["b-1", "n-1", "a-1", "a-3"]
+        assert callback.queues == {}
+        assert client.dispatcher.inflight == 0
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    @pytest.mark.asyncio
+    async def test_ordered_backpressure(self) -> None:
+        client = resist.WebSocketClient("REVOLT_TOKEN", max_inflight=2)
+        client.loop = asyncio.get_running_loop()
+        event = client.events.resolve(resist.Event("Foo"))
+        release = asyncio.Event()
+
+        @client.on(event, ordered_by="channel")
+        async def callback(_: dict[str, str]) -> None:
+            await release.wait()
+
+        for _ in range(3):
+            client.dispatcher.submit(event, {"channel": "a"})
+
+        # The queued payload takes the second slot, the third waits in the backlog.
+        assert len(callback.queues["a"]) == 2
+        assert client.dispatcher.inflight == 2 and client.dispatcher.pending == 1
+
+        release.set()
+
+        while client.dispatcher.inflight:
+            await asyncio.sleep(0)
+
+        assert callback.queues == {} and client.dispatcher.pending == 0
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("started", [False, True])
+    async def test_ordered_cancel(self, started: bool) -> None:
+        client = resist.WebSocketClient("REVOLT_TOKEN", max_inflight=2, eager=False)
+        client.loop = asyncio.get_running_loop()
+        event = client.events.resolve(resist.Event("Foo", register=False))
+        received: list[str] = []
+        release = asyncio.Event()
+
+        @client.on(event, ordered_by="channel")
+        async def callback(data: dict[str, str]) -> None:
+            await release.wait()
+            received.append(data["_id"])
+
+        tasks = event.dispatch(client, {"_id": "b-0", "channel": "b"})
+
+        for index in range(1, 4):
+            client.dispatcher.submit(event, {"_id": f"b-{index}", "channel": "b"})
+
+        assert client.dispatcher.inflight == 2 and client.dispatcher.pending == 2
+
+        if started:
+            await asyncio.sleep(0)
+
+        # Cancelling the drain, started or not, releases its slots and queue,
+        # the backlog then starts a new drain for the same key.
+        tasks[0].cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert client.dispatcher.pending == 0 and not client.dispatcher.backlogged
+        assert len(callback.queues["b"]) == 2
+
+        release.set()
+
+        while client.dispatcher.inflight:
+            await asyncio.sleep(0)
+
+        assert received == ["b-2", "b-3"] and callback.queues == {}
+
+    @pytest.mark.asyncio
+    async def test_unhashable(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = resist.Event("Foo", register=False)
+        received: list[str] = []
+
+        unhashable = resist.Listener(
+            once=False, callback=received.append, check=lambda _: True
+        )
+        unhashable.filters = {"channel": ["a"]}
+
+        with pytest.raises(TypeError, match="Filter channel has to be hashable"):
+            event.subscribe(unhashable)
+
+        assert not event.subscribed and not unhashable.subscriptions
+
+        event.subscribe(
+            resist.Listener(
+                once=False,
+                callback=lambda data: received.append(data["_id"]),
+                check=lambda _: True,
+                filters={"channel": "a"},
+            )
+        )
+
+        async def ordered(data: dict[str, str]) -> None:
+            received.append(data["_id"])
+
+        event.subscribe(
+            resist.Listener(
+                once=False, callback=ordered, check=lambda _: True, ordered_by="author"
+            )
+        )
+
+        # Unhashable payload values match no filter and are not ordered,
+        # instead of failing the whole dispatch.
+        assert event.dispatch(client, {"_id": "x", "channel": ["a"], "author": []}) == []
+        assert client.dispatcher.inflight == 0
+
+        await asyncio.gather(
+            *event.dispatch(client, {"_id": "y", "channel": "a", "author": "b"})
+        )
+        assert received == ["y", "y"]
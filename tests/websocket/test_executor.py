@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+import resist
+
+
+def square(data: dict[str, int]) -> tuple[int, str]:
+    if data["n"] < 0:
+        raise ValueError(data["n"])
+
+    return data["n"] ** 2, threading.current_thread().name
+
+
+def owner(message: resist.Message) -> tuple[str, Any]:
+    return message.content, message.client
+
+
+class TestListenerExecutor:
+    @pytest.fixture()
+    def client(self) -> Any:
+        client = resist.WebSocketClient("REVOLT_TOKEN")
+        yield client
+
+        for executor in client.executors.values():
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_thread(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.resolve(resist.Event("Foo"))
+        listener = client.on(event, executor="thread")(square)
+
+        assert not listener.inline
+        assert client.executor("thread") is listener.executor
+
+        (task,) = event.dispatch(client, {"n": 3})
+        result, thread = await task
+        assert result == 9 and thread != threading.current_thread().name
+
+        (task,) = event.dispatch(client, {"n": -1})
+        with pytest.raises(ValueError):
+            await task
+
+        executor = client.executors["thread"]
+        assert (executor.depth, executor.peak) == (0, 1)
+        assert (executor.completed, executor.failed) == (1, 1)
+
+        with pytest.raises(TypeError):
+
+            @client.on(event, executor="thread")
+            async def _() -> None:
+                ...
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    @pytest.mark.asyncio
+    async def test_supplied(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.resolve(resist.Event("Foo"))
+
+        with ThreadPoolExecutor(thread_name_prefix="supplied") as pool:
+            client.on(event, executor=pool)(square)
+            results = await asyncio.gather(
+                *[task for n in range(4) for task in event.dispatch(client, {"n": n})]
+            )
+
+            assert client.executors[pool].peak == 4
+            assert not client.executors[pool].owned
+
+        assert [result for result, _ in results] == [0, 1, 4, 9]
+        assert all(thread.startswith("supplied") for _, thread in results)
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    @pytest.mark.asyncio
+    async def test_process(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.resolve(resist.Event("Foo"))
+        client.on(event, executor="process")(owner)
+
+        message = resist.Message(
+            client,
+            {"_id": "01A", "channel": "foo", "author": "bar", "content": "baz"},
+        )
+        (task,) = event.dispatch(client, message)
+
+        assert await asyncio.wait_for(task, timeout=30) == ("baz", None)
+        assert client.executors["process"].completed == 1
+
+        del resist.EVENT_MAPPING["Foo"]
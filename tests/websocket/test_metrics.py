@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import pytest
+
+import resist
+
+
+class TestMetrics:
+    @pytest.fixture()
+    def client(self) -> Any:
+        client = resist.WebSocketClient("REVOLT_TOKEN")
+        yield client
+
+        client.metrics.stop()
+
+    def test_histogram(self) -> None:
+        histogram = resist.Histogram()
+        assert histogram.percentile(50) is None
+
+        for duration in (0.001,) * 98 + (0.5, 2.0):
+            histogram.record(duration)
+
+        assert histogram.count == 100 and histogram.max == 2.0
+        assert 0.001 <= histogram.percentile(50) < 0.002  # type: ignore
+        assert 0.5 <= histogram.percentile(99) <= 2.0  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_listeners(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.resolve(resist.Event("Foo"))
+
+        @client.on(event)
+        async def fails(_: Any) -> None:
+            raise RuntimeError
+
+        assert fails.stats is None
+        client.metrics.enable()
+
+        @client.on(event)
+        def inline(_: Any) -> None:
+            ...
+
+        @client.collect(event, amount=2, timeout=None)
+        async def batch(_: Any) -> None:
+            ...
+
+        assert fails.stats is not None and inline.stats is not None
+
+        for _ in range(4):
+            await asyncio.gather(*event.dispatch(client, "foo"), return_exceptions=True)
+
+        snapshot = client.metrics.snapshot()
+        assert snapshot["Foo:TestMetrics.test_listeners.<locals>.fails"]["errors"] == 4
+        assert snapshot["Foo:TestMetrics.test_listeners.<locals>.inline"]["calls"] == 4
+        assert snapshot["Foo:TestMetrics.test_listeners.<locals>.batch"]["calls"] == 2
+        assert all(stats["inflight"] == 0 for stats in snapshot.values())
+        assert client.metrics.running == {}
+
+        assert inline.subscriptions[0].cancel()
+        assert inline not in client.metrics.stats and len(client.metrics.stats) == 2
+
+        client.metrics.disable()
+        assert fails.stats is None
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    @pytest.mark.asyncio
+    async def test_watchdog(
+        self, client: resist.WebSocketClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.resolve(resist.Event("Foo"))
+        client.metrics.enable(slow_threshold=0.05, lag_interval=0.01, lag_threshold=0.05)
+
+        @client.on(event)
+        def blocking(_: Any) -> None:
+            time.sleep(0.2)
+
+        with caplog.at_level(logging.WARNING, logger="resist.websocket.metrics"):
+            await asyncio.sleep(0.02)
+            event.dispatch(client, "foo")
+            await asyncio.sleep(0.05)
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("SLOW LISTENER Foo:" in m and "time.sleep" in m for m in messages)
+        assert any("EVENT LOOP LAGGED" in m for m in messages)
+        assert client.metrics.lag.max >= 0.1
+
+        del resist.EVENT_MAPPING["Foo"]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import pathlib
+from typing import Any
+from unittest import mock
+
+import pytest
+
+import resist
+
+
+class TestRelay:
+    @pytest.mark.asyncio
+    async def test_routing(self, tmp_path: pathlib.Path) -> None:
+        loop = asyncio.get_running_loop()
+        path = str(tmp_path / "relay.sock")
+
+        # Stands in for the gateway, payloads are published as the handler would.
+        gateway = resist.WebSocketClient("REVOLT_TOKEN", loop=loop)
+        relay = resist.Relay(path, routing="channel")
+        await relay.start(gateway)
+
+        received: list[list[tuple[str, str]]] = [[], []]
+        workers: list[resist.Worker] = []
+
+        for index in range(2):
+            client = resist.WebSocketClient("REVOLT_TOKEN", loop=loop)
+
+            @client.on(resist.Events.MESSAGE)
+            def _(data: dict[str, Any], index: int = index) -> None:
+                received[index].append((data["channel"], data["_id"]))
+
+            @client.on(resist.Events.READY)
+            def _(data: dict[str, Any], index: int = index) -> None:
+                received[index].append(("ready", data["type"]))
+
+            workers.append(resist.Worker(client, path))
+
+        tasks = [asyncio.create_task(worker.run()) for worker in workers]
+
+        while len(relay.workers) < 2:
+            await asyncio.sleep(0.01)
+
+        relay.publish({"type": "Ready"})
+        for n in range(20):
+            relay.publish({"type": "Message", "_id": str(n), "channel": str(n % 4)})
+
+        await relay.drain()
+        while sum(worker.received for worker in workers) < 22:
+            await asyncio.sleep(0.01)
+
+        assert relay.sent == 22
+        assert all(messages[0] == ("ready", "Ready") for messages in received)
+
+        channels = [{channel for channel, _ in messages[1:]} for messages in received]
+        assert not channels[0] & channels[1]
+        assert channels[0] | channels[1] == {"0", "1", "2", "3"}
+
+        for messages in received:
+            ordered = [int(unique) for _, unique in messages[1:]]
+            assert ordered == sorted(ordered)
+
+        await relay.close()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+    def test_server_routing(self, tmp_path: pathlib.Path) -> None:
+        relay = resist.Relay(str(tmp_path / "relay.sock"), routing="server")
+        relay.workers = [mock.MagicMock() for _ in range(8)]
+        relay.client = resist.WebSocketClient("REVOLT_TOKEN")
+
+        ready = {"type": "Ready", "channels": [{"_id": "c1", "server": "s1"}]}
+        relay.publish(ready)
+        assert relay.sent == 8
+
+        relay.publish({"type": "ChannelCreate", "_id": "c2", "server": "s1"})
+        relay.publish({"type": "Message", "_id": "m1", "channel": "c1"})
+        relay.publish({"type": "Message", "_id": "m2", "channel": "c2"})
+        relay.publish({"type": "ServerMemberJoin", "id": "s1", "user": "u1"})
+        relay.publish({"type": "Message", "_id": "m3", "channel": "dm"})
+
+        # Each payload after Ready reaches a single worker, the server's for s1.
+        assert relay.sent == 8 + 5
+
+        worker = relay.route({"type": "ServerUpdate", "id": "s1"})
+        assert relay.route({"type": "Message", "channel": "c1"}) == worker
+        assert relay.route({"type": "Message", "channel": "c2"}) == worker
+
+        member = {"type": "ServerMemberUpdate", "id": {"server": "s1", "user": "u1"}}
+        assert relay.route(member) == worker
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import resist
+
+
+class TestEventStream:
+    @pytest.fixture()
+    def client(self) -> resist.WebSocketClient:
+        return resist.WebSocketClient("REVOLT_TOKEN")
+
+    @pytest.mark.asyncio
+    async def test_iterate(self, client: resist.WebSocketClient) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.MESSAGE
+        stream = client.stream(event, check=lambda data: data["n"] % 2 == 0)
+
+        assert isinstance(stream, resist.EventStream)
+        assert stream in event.streams and event.subscribed
+
+        async def consume() -> list[int]:
+            return [data["n"] async for data in stream]
+
+        consumer = asyncio.create_task(consume())
+
+        for n in range(6):
+            event.dispatch(client, {"n": n})
+            await asyncio.sleep(0)
+
+        client.close_streams()
+
+        assert await asyncio.wait_for(consumer, timeout=1) == [0, 2, 4]
+        assert stream.closed and stream not in event.streams
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("overflow", "expected"),
+        [("drop_oldest", [3, 4, 5]), ("drop_newest", [0, 1, 2])],
+    )
+    async def test_overflow(
+        self, client: resist.WebSocketClient, overflow: str, expected: list[int]
+    ) -> None:
+        event = client.events.resolve(resist.Event("Foo"))
+        stream = client.stream(event, maxsize=3, overflow=overflow)  # type: ignore
+
+        async with stream:
+            for n in range(6):
+                event.dispatch(client, n)
+
+            assert stream.dropped == 3
+            assert await stream.anext_many(2) == expected[:2]
+            assert await stream.anext_many(5) == expected[2:]
+
+        assert stream.closed
+        assert await stream.anext_many(5) == []
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    @pytest.mark.asyncio
+    async def test_failing_check(
+        self, client: resist.WebSocketClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        client.loop = asyncio.get_running_loop()
+        event = client.events.MESSAGE
+        stream = client.stream(event, check=lambda data: 10 // data["n"] > 0)
+
+        # A raising check skips the payload instead of failing the dispatch.
+        for n in range(3):
+            event.dispatch(client, {"n": n})
+
+        assert "STREAM CHECK FAILED Message" in caplog.text
+        assert await stream.anext_many(5) == [{"n": 1}, {"n": 2}]
+
+        stream.close()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import cast
 from unittest import mock
 
+import aiohttp
 import pytest
 
 import resist
@@ -45,11 +48,303 @@ class TestWebSocketHandler:
             read = cast(mock.AsyncMock, read)
             await sock.connect()
 
-        ws_connect.assert_awaited_once()
+        ws_connect.assert_awaited_once_with("baz", params={})
         sock.sock.send_json.assert_awaited_once()  # type: ignore
         read.assert_awaited_once()
 
+        sock.client.format = "msgpack"
+        ws_connect.reset_mock()
+
+        with mock.patch.object(resist.WebSocketHandler, "read"):
+            with mock.patch.object(resist.WebSocketHandler, "send"):
+                await sock.connect()
+
+        ws_connect.assert_awaited_once_with(
+            "baz", params={"version": 1, "format": "msgpack"}
+        )
+
     def test_read(self, sock: resist.WebSocketHandler):
         assert hasattr(sock.sock, "receive")
         assert hasattr(sock.sock, "__anext__")
         assert hasattr(sock.sock, "__aiter__")
+
+    def test_decode(self, sock: resist.WebSocketHandler) -> None:
+        text = aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, '{"type": "Pong"}', None)
+        binary = aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, b"\x81", None)
+
+        assert sock.decode(text) == {"type": "Pong"}  # type: ignore
+        assert sock.decode(binary) is None  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_msgpack(self, client: resist.WebSocketClient) -> None:
+        msgpack = pytest.importorskip("msgpack")
+
+        client.format = "msgpack"
+        client.rest = resist.RESTClient(client, client.token, "URL")
+        sock = resist.WebSocketHandler(client)
+        sock.sock = mock.MagicMock()
+        sock.sock.send_bytes = mock.AsyncMock()
+
+        payload = {"type": "Pong", "data": 0}
+        frame = aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, msgpack.packb(payload), None)
+
+        assert sock.decode(frame) == payload  # type: ignore
+
+        await sock.send(payload)
+        sock.sock.send_bytes.assert_awaited_once_with(msgpack.packb(payload))
+
+    def test_sniff(self, sock: resist.WebSocketHandler) -> None:
+        text = aiohttp.WSMessage(
+            aiohttp.WSMsgType.TEXT, '{"type":"ChannelAck","id":"foo"}', None
+        )
+        nested = aiohttp.WSMessage(
+            aiohttp.WSMsgType.TEXT, '{"id":"foo","type":"ChannelAck"}', None
+        )
+        binary = aiohttp.WSMessage(
+            aiohttp.WSMsgType.BINARY, b"\x82\xa4type\xaaChannelAck\xa2id\xa3foo", None
+        )
+
+        assert sock.sniff(text) == "ChannelAck"  # type: ignore
+        assert sock.sniff(nested) is None  # type: ignore
+        assert sock.sniff(binary) == "ChannelAck"  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_skip(self, sock: resist.WebSocketHandler) -> None:
+        event = resist.Events.CHANNEL_ACK
+        frames = [
+            aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, '{"type":"ChannelAck"}', None)
+            for _ in range(3)
+        ]
+
+        async def iterate():
+            for frame in frames:
+                yield frame
+
+        sock.sock = iterate()  # type: ignore
+
+        with mock.patch.object(resist.Event, "dispatch") as dispatch:
+            await sock.read()
+
+        dispatch.assert_not_called()
+        assert sock.skipped["ChannelAck"] == 3
+        assert not event.subscribed
+
+    @pytest.mark.asyncio
+    async def test_run(self, sock: resist.WebSocketHandler) -> None:
+        attempts = 0
+
+        async def connect(_: resist.WebSocketHandler) -> None:
+            nonlocal attempts
+            attempts += 1
+
+            if attempts == 3:
+                sock.closed = True
+
+            raise aiohttp.ClientError
+
+        with mock.patch.object(resist.WebSocketHandler, "connect", connect):
+            with mock.patch("asyncio.sleep", mock.AsyncMock()) as sleep:
+                await sock.run()
+
+        assert attempts == 3
+        assert sleep.await_count == 2
+        assert sock.reconnects == 2
+
+        for (delay,), _ in sleep.await_args_list:
+            assert 0 <= delay <= sock.backoff_max
+
+    @pytest.mark.asyncio
+    async def test_run_closed(self, sock: resist.WebSocketHandler) -> None:
+        connect = mock.AsyncMock(side_effect=aiohttp.ClientError)
+        sock.sock.close = mock.AsyncMock()
+
+        async def sleep(_: float) -> None:
+            await sock.close()
+
+        with mock.patch.object(resist.WebSocketHandler, "connect", connect):
+            with mock.patch("asyncio.sleep", sleep):
+                await sock.run()
+
+        # Closing during the backoff does not reconnect.
+        connect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_process(self, sock: resist.WebSocketHandler) -> None:
+        sock.client.loop = asyncio.get_running_loop()
+        message = {"type": "Message", "_id": "01B", "channel": "foo"}
+        sock.process({"type": "Message", "_id": "01", "channel": "bar"})
+        assert "Message" not in sock.client.events
+
+        sock.client.events.MESSAGE
+        with mock.patch.object(resist.Event, "dispatch") as dispatch:
+            sock.process(message)
+            sock.process(message)
+            sock.process({"type": "Message", "_id": "01A", "channel": "foo"})
+
+        assert dispatch.call_count == 2
+        assert sock.last_seen == {"foo": "01B", "bar": "01"}
+
+    @pytest.mark.asyncio
+    async def test_fill_gaps(self, sock: resist.WebSocketHandler) -> None:
+        sock.client.events.MESSAGE
+        sock.fill_limit = 2
+        sock.last_seen = {"foo": "01A", "bar": "01A"}
+        pages = {
+            ("foo", "01A"): [
+                {"_id": "01B", "channel": "foo"},
+                {"_id": "01C", "channel": "foo"},
+            ],
+            ("foo", "01C"): [{"_id": "01D", "channel": "foo"}],
+            ("bar", "01A"): [],
+        }
+
+        async def request(
+            _: resist.RESTClient, __: str, path: str, params: dict[str, str]
+        ) -> list[dict[str, str]]:
+            return pages[(path.split("/")[1], params["after"])]
+
+        with mock.patch.object(resist.RESTClient, "request", request):
+            with mock.patch.object(resist.Event, "dispatch") as dispatch:
+                await sock.fill_gaps()
+
+        assert dispatch.call_count == 3
+        assert sock.last_seen == {"foo": "01D", "bar": "01A"}
+
+    @pytest.mark.asyncio
+    async def test_heartbeat(self, sock: resist.WebSocketHandler) -> None:
+        sock.heartbeat_interval = 0
+        sock.sock.send_json = mock.AsyncMock()
+        sock.sock.close = mock.AsyncMock()
+
+        with mock.patch("time.time_ns", return_value=1_000_000_000):
+            await asyncio.wait_for(sock.heartbeat(), timeout=1)
+
+        assert sock.sock.send_json.await_count == sock.max_missed
+        assert sorted(sock.pings) == [1000 + n for n in range(sock.max_missed)]
+        sock.sock.close.assert_awaited_once()
+
+        (payload,), _ = sock.sock.send_json.await_args
+        assert payload["type"] == "Ping"
+        assert payload["data"] in sock.pings
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_paused(self, sock: resist.WebSocketHandler) -> None:
+        sock.client.loop = asyncio.get_running_loop()
+        sock.client.dispatcher.max_inflight = 1
+        sock.heartbeat_interval = 0.01
+        sock.sock.send_json = mock.AsyncMock()
+        sock.sock.close = mock.AsyncMock()
+
+        event = sock.client.events.resolve(resist.Event("Foo"))
+        release = asyncio.Event()
+
+        @sock.client.on(event)
+        async def listener(_) -> None:
+            await release.wait()
+
+        # Fills the only in-flight slot, then the backlog, pausing the reader.
+        sock.client.dispatcher.submit(event, {})
+        sock.client.dispatcher.submit(event, {})
+        assert sock.client.dispatcher.backlogged
+
+        reader = asyncio.create_task(sock.pause())
+        heartbeat = asyncio.create_task(sock.heartbeat())
+
+        await asyncio.sleep(sock.heartbeat_interval * (sock.max_missed + 3))
+        assert sock.paused and not reader.done()
+        sock.sock.close.assert_not_awaited()
+
+        release.set()
+        await asyncio.wait_for(reader, timeout=1)
+        heartbeat.cancel()
+
+        del resist.EVENT_MAPPING["Foo"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("threaded", [False, True])
+    async def test_control_unpaused(
+        self, sock: resist.WebSocketHandler, threaded: bool
+    ) -> None:
+        sock.client.decode_thread = threaded
+        sock.client.dispatcher.pending = sock.client.dispatcher.max_backlog + 1
+        sock.pings = {1: 0.0}
+
+        async def iterate():
+            yield aiohttp.WSMessage(
+                aiohttp.WSMsgType.TEXT, '{"type":"Pong","data":1}', None
+            )
+
+        sock.sock = iterate()  # type: ignore
+        await asyncio.wait_for(sock.read(), timeout=1)
+
+        assert sock.client.dispatcher.backlogged and sock.pings == {}
+        assert not sock.paused
+
+    def test_pong(self, sock: resist.WebSocketHandler) -> None:
+        assert sock.latency is None
+        assert sock.percentile(50) is None
+
+        sent = time.perf_counter() - 0.05
+        sock.pings = {1: sent, 2: sent, 3: sent}
+
+        with mock.patch.object(resist.Event, "dispatch"):
+            sock.process({"type": "Pong", "data": 2})
+
+        assert sock.pings == {3: sent}
+        assert sock.latency == pytest.approx(0.05, abs=0.04)
+
+        sock.latencies.extend([0.1, 0.2, 0.3])
+
+        assert sock.percentile(0) == sock.latencies[0]
+        assert sock.percentile(100) == 0.3
+
+    @pytest.mark.asyncio
+    async def test_read_threaded(self, sock: resist.WebSocketHandler) -> None:
+        sock.client.decode_thread = True
+        frames = [
+            aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, f'{{"type":"Foo","n":{n}}}', None)
+            for n in range(500)
+        ]
+        frames.insert(250, aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, "{", None))
+
+        async def iterate():
+            for frame in frames:
+                yield frame
+
+        sock.sock = iterate()  # type: ignore
+        received: list[int] = []
+
+        with mock.patch.object(
+            resist.WebSocketHandler, "process", lambda _, data: received.append(data["n"])
+        ):
+            await sock.read()
+
+        assert received == list(range(500))
+
+    @pytest.mark.asyncio
+    async def test_read_threaded_failing(self, sock: resist.WebSocketHandler) -> None:
+        sock.client.decode_thread = True
+
+        # More frames than the decoder has permits, so leaked permits would deadlock.
+        frames = [
+            aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, f'{{"type":"Foo","n":{n}}}', None)
+            for n in range(2000)
+        ]
+
+        async def iterate():
+            for frame in frames:
+                yield frame
+
+        def process(_, data):
+            if data["n"] % 2:
+                raise RuntimeError(data["n"])
+
+            received.append(data["n"])
+
+        sock.sock = iterate()  # type: ignore
+        received: list[int] = []
+
+        with mock.patch.object(resist.WebSocketHandler, "process", process):
+            await asyncio.wait_for(sock.read(), timeout=5)
+
+        assert received == list(range(0, 2000, 2))